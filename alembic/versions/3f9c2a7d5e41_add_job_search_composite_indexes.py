@@ -0,0 +1,67 @@
+"""add job search composite indexes
+
+Revision ID: 3f9c2a7d5e41
+Revises: 0c5e1f7a2b93
+Create Date: 2026-10-18 20:45:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2a7d5e41"
+down_revision: Union[str, None] = "0c5e1f7a2b93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("idx_job_status_deadline", "job", ["status", "deadline"]),
+    (
+        "idx_job_status_updated_at_deadline",
+        "job",
+        ["status", "updated_at", "deadline"],
+    ),
+    (
+        "idx_job_status_employment_type_deadline",
+        "job",
+        ["status", "employment_type", "deadline"],
+    ),
+    (
+        "idx_job_status_job_position_id_deadline",
+        "job",
+        ["status", "job_position_id", "deadline"],
+    ),
+    (
+        "idx_job_status_job_experience_id_deadline",
+        "job",
+        ["status", "job_experience_id", "deadline"],
+    ),
+    (
+        "idx_job_status_salary_type_min_salary_max_salary",
+        "job",
+        ["status", "salary_type", "min_salary", "max_salary"],
+    ),
+    (
+        "idx_work_location_province_id_district_id_job_id",
+        "work_location",
+        ["province_id", "district_id", "job_id"],
+    ),
+    (
+        "idx_job_category_category_id_job_id",
+        "job_category",
+        ["category_id", "job_id"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,92 @@
+"""add job search table
+
+Revision ID: 8b1e4d6c9a20
+Revises: 3f9c2a7d5e41
+Create Date: 2026-10-18 21:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8b1e4d6c9a20"
+down_revision: Union[str, None] = "3f9c2a7d5e41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_job_search_job_id", ["job_id"]),
+    ("ix_job_search_company_id", ["company_id"]),
+    ("ix_job_search_employment_type", ["employment_type"]),
+    ("ix_job_search_job_experience_id", ["job_experience_id"]),
+    ("ix_job_search_job_position_id", ["job_position_id"]),
+    ("ix_job_search_max_salary", ["max_salary"]),
+    ("ix_job_search_salary_band", ["salary_band"]),
+    ("ix_job_search_quantity", ["quantity"]),
+    ("ix_job_search_deadline", ["deadline"]),
+    ("ix_job_search_created_at", ["created_at"]),
+    ("ix_job_search_updated_at", ["updated_at"]),
+    (
+        "idx_job_search_province_id_district_id_deadline",
+        ["province_id", "district_id", "deadline"],
+    ),
+    (
+        "idx_job_search_salary_type_min_salary_max_salary",
+        ["salary_type", "min_salary", "max_salary"],
+    ),
+)
+
+# MySQL 8.0.17+ multi-valued indexes, used by JSON_CONTAINS filters
+ARRAY_INDEXES = (
+    ("idx_job_search_category_ids", "category_ids"),
+    ("idx_job_search_field_ids", "field_ids"),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_search",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("province_id", sa.Integer(), nullable=True),
+        sa.Column("district_id", sa.Integer(), nullable=True),
+        sa.Column("company_id", sa.Integer(), nullable=True),
+        sa.Column("field_ids", sa.JSON(), nullable=False),
+        sa.Column("category_ids", sa.JSON(), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column(
+            "employment_type",
+            sa.Enum("FULL_TIME", "PART_TIME", "INTERNSHIP", name="jobtype"),
+            nullable=True,
+        ),
+        sa.Column("job_experience_id", sa.Integer(), nullable=False),
+        sa.Column("job_position_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "salary_type",
+            sa.Enum("VND", "USD", "DEAL", name="salarytype"),
+            nullable=False,
+        ),
+        sa.Column("min_salary", sa.Integer(), nullable=True),
+        sa.Column("max_salary", sa.Integer(), nullable=True),
+        sa.Column("salary_band", sa.Integer(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("deadline", sa.Date(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["job.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_job_search_id", "job_search", ["id"], unique=False)
+    for name, columns in INDEXES:
+        op.create_index(name, "job_search", columns, unique=False)
+    for name, column in ARRAY_INDEXES:
+        op.execute(
+            f"CREATE INDEX {name} ON job_search ((CAST({column} AS UNSIGNED ARRAY)))"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("job_search")
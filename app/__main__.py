@@ -3,11 +3,13 @@ from starlette.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
-from app.db.base import get_db
+from app.db.base import get_db, replica_router
 from app.db.base_class import Base
 from app.db.init_db import init_db
 from app.storage.s3 import s3_service
-from app.storage.redis import redis_dependency
+from app.storage.redis import RedisDependency, pubsub_redis_dependency
+from app.storage.base_cache import cache_invalidation_listener
+from app.core.job.job_helper import job_facet_index_refresher
 from app.core.loggers import get_logger, setup_logging
 from app.core import loggers
 from app.common.exception_handler import register_exception
@@ -69,13 +71,25 @@ async def lifespan(app: FastAPI):
     # Startup event
     print("Redis connection opened")
     init_db(next(get_db()))
-    await redis_dependency.init()
+    await RedisDependency.init_all()
+    if pubsub_redis_dependency.redis:
+        cache_invalidation_listener.start(pubsub_redis_dependency.redis.connection)
+    if settings.JOB_FACET_INDEX_ENABLED:
+        job_facet_index_refresher.start(
+            pubsub_redis_dependency.redis.connection
+            if pubsub_redis_dependency.redis
+            else None
+        )
+    replica_router.start()
     yield
     # Shutdown event
     print("Redis connection closed")
     await disable_all_connections()
     await disable_all_redis_connections()
-    await redis_dependency.close()
+    await cache_invalidation_listener.stop()
+    await job_facet_index_refresher.stop()
+    await replica_router.stop()
+    await RedisDependency.close_all()
     await disable_all_s3_connections()
     logger.info(msg="Shutting down application")
 
@@ -21,7 +21,12 @@ from app.api.api_v1.endpoint.config import (
 )
 
 from app.api.api_v1.endpoint.user import user_auth, user, company, job, cv_applications
-from app.api.api_v1.endpoint.admin import admin_approval_request_job
+from app.api.api_v1.endpoint.admin import (
+    admin_approval_request_job,
+    admin_search_index,
+    admin_cache,
+    admin_database,
+)
 from app.api.api_v1.endpoint.chat import websocket, chat, conversation, contact, message
 
 api_router = APIRouter(prefix="/api/v1")
@@ -75,6 +80,17 @@ api_router.include_router(
     prefix="/admin/approval_request_job",
     tags=["admin_approval_request_job"],
 )
+api_router.include_router(
+    admin_search_index.router,
+    prefix="/admin/search_index",
+    tags=["admin_search_index"],
+)
+api_router.include_router(
+    admin_cache.router, prefix="/admin/cache", tags=["admin_cache"]
+)
+api_router.include_router(
+    admin_database.router, prefix="/admin/database", tags=["admin_database"]
+)
 
 api_router.include_router(chat.router, prefix="/chat", tags=["chat"])
 api_router.include_router(
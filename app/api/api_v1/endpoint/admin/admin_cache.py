@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+
+from app.core.auth.user_manager_service import user_manager_service
+from app.core.cache.cache_service import cache_service
+
+router = APIRouter()
+
+
+@router.get("/stats", summary="Get cache statistics.")
+async def get_cache_stats(
+    current_user=Depends(user_manager_service.get_current_admin),
+):
+    """
+    Get cache statistics.
+
+    This endpoint returns the hit ratios of the local and Redis tiers of every cache
+    service, the hit/miss/error latency of every cached function, the compression
+    ratio and cost of every model codec and the Redis pool usage, on the worker
+    serving the request.
+
+    Returns:
+    - status_code (200): The cache statistics have been found successfully.
+    - status_code (403): The permission is denied.
+
+    """
+    return await cache_service.get_stats()
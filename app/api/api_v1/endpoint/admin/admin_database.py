@@ -0,0 +1,55 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.auth.user_manager_service import user_manager_service
+from app.core.database.database_service import database_service
+
+router = APIRouter()
+
+
+@router.get("/slow_queries", summary="Get slow query report.")
+async def get_slow_queries(
+    current_user=Depends(user_manager_service.get_current_admin),
+    limit: int = Query(
+        50, ge=1, le=500, description="The number of fingerprints.", example=50
+    ),
+    order_by: Literal["total_ms", "count", "max_ms", "avg_ms"] = Query(
+        "total_ms", description="The field to sort by.", example="total_ms"
+    ),
+):
+    """
+    Get slow query report.
+
+    This endpoint returns the statements slower than SLOW_QUERY_THRESHOLD_MS seen by
+    the worker serving the request, grouped by normalized SQL fingerprint with the
+    CRUD methods that issued them and, for a sample, their EXPLAIN plan.
+
+    Parameters:
+    - limit (int): The number of fingerprints to return.
+    - order_by (str): The field to sort by, one of total_ms, count, max_ms, avg_ms.
+
+    Returns:
+    - status_code (200): The slow query report has been found successfully.
+    - status_code (403): The permission is denied.
+
+    """
+    return await database_service.get_slow_queries(limit, order_by)
+
+
+@router.delete("/slow_queries", summary="Reset slow query report.")
+async def reset_slow_queries(
+    current_user=Depends(user_manager_service.get_current_admin),
+):
+    """
+    Reset slow query report.
+
+    This endpoint clears the slow query fingerprints of the worker serving the
+    request.
+
+    Returns:
+    - status_code (200): The slow query report has been reset successfully.
+    - status_code (403): The permission is denied.
+
+    """
+    return await database_service.reset_slow_queries()
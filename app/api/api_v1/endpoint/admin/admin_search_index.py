@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from redis.asyncio import Redis
+
+from app.db.base import get_db
+from app.storage.redis import get_redis
+from app.core.auth.user_manager_service import user_manager_service
+from app.core.job.job_service import job_service
+
+router = APIRouter()
+
+
+@router.post("/job/rebuild", summary="Rebuild job search index.")
+async def rebuild_job_search_index(
+    db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user=Depends(user_manager_service.get_current_admin),
+):
+    """
+    Rebuild job search index.
+
+    This endpoint re-indexes every published job into the keyword search index.
+
+    Returns:
+    - status_code (200): The search index has been rebuilt successfully.
+    - status_code (403): The permission is denied.
+
+    """
+    return await job_service.rebuild_search_index(db, redis)
+
+
+@router.post("/facet/rebuild", summary="Rebuild job facet index.")
+async def rebuild_job_facet_index(
+    db: Session = Depends(get_db),
+    current_user=Depends(user_manager_service.get_current_admin),
+):
+    """
+    Rebuild job facet index.
+
+    This endpoint reloads the in-memory facet index of published jobs on the worker
+    serving the request. Other workers refresh on their own interval.
+
+    Returns:
+    - status_code (200): The facet index has been rebuilt successfully.
+    - status_code (403): The permission is denied.
+
+    """
+    return await job_service.rebuild_facet_index(db)
+
+
+@router.post("/job_search/rebuild", summary="Rebuild job search table.")
+async def rebuild_job_search_table(
+    db: Session = Depends(get_db),
+    current_user=Depends(user_manager_service.get_current_admin),
+):
+    """
+    Rebuild job search table.
+
+    This endpoint rewrites the job_search read table from every published job and
+    drops the rows of jobs that are no longer published. Run it once before setting
+    JOB_SEARCH_TABLE_ENABLED.
+
+    Returns:
+    - status_code (200): The job search table has been rebuilt successfully.
+    - status_code (403): The permission is denied.
+
+    """
+    return await job_service.rebuild_job_search(db)
@@ -8,8 +8,10 @@ from fastapi import (
     UploadFile,
 )
 from sqlalchemy.orm import Session
+from redis.asyncio import Redis
 
 from app.db.base import get_db
+from app.storage.redis import get_redis
 from app.core.company.company_service import company_service
 from app.core.auth.user_manager_service import user_manager_service
 from app.hepler.enum import OrderType, SortBy, CompanyType
@@ -161,6 +163,7 @@ async def create_company(
 @router.put("/{company_id}", summary="Update company.")
 async def update_company(
     db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     current_user=Depends(user_manager_service.get_current_business),
     company_id: int = Path(description="The company id.", example=1),
     email: str = Form(
@@ -239,6 +242,7 @@ async def update_company(
     data = locals()
     return await company_service.update(
         db,
+        redis,
         {**data},
         current_user,
     )
@@ -247,6 +251,7 @@ async def update_company(
 @router.delete("/{id}", summary="Delete a company.")
 async def delete_company(
     db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     current_user=Depends(user_manager_service.get_current_business_admin_superuser),
     id: int = Path(..., description="The id of the company.", example=1),
 ):
@@ -265,4 +270,4 @@ async def delete_company(
 
     """
 
-    return await company_service.delete(db, id, current_user)
+    return await company_service.delete(db, redis, id, current_user)
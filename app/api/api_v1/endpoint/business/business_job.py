@@ -64,6 +64,8 @@ async def get_job(
     - job_status (str): The job status.
     - job_approve_status (str): The job approve status.
     - campaign_id (int): The campaign id.
+    - after (str): The cursor of the last job returned, enables keyset pagination.
+      Pass an empty value to get the first page with a cursor.
 
     Returns:
     - status_code (200): The list of job has been found successfully.
@@ -109,6 +111,7 @@ async def search_job(
     ),
     job_position_id: int = Query(None, description="The position id.", example=1),
     keyword: str = Query(None, description="The keyword.", example="developer"),
+    after: str = Query(None, description="The cursor of the last job returned."),
 ):
     """
     Get list of job by business.
@@ -134,6 +137,7 @@ async def search_job(
     - keyword (str): The keyword.
     - status (str): The job status.
     - business_id (int): The business id.
+    - after (str): The cursor of the last job returned, enables keyset pagination.
 
     Returns:
     - status_code (200): The list of job has been found successfully.
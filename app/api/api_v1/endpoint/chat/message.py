@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, Request, Query, Path
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
-from app.db.base import get_db
+from app.db.base import get_async_read_db
 from app.storage.redis import get_redis
 from app.core.auth.user_manager_service import user_manager_service
 from app.core.conversation.conversation_service import conversation_service
@@ -13,7 +13,7 @@ router = APIRouter()
 
 @router.get("/{conversation_id}/messages", summary="Get list of messages.")
 async def get_conversation(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     redis: Redis = Depends(get_redis),
     current_user=Depends(user_manager_service.get_current_user_or_business_verify),
     conversation_id: int = Path(..., description="The conversation id.", example=1),
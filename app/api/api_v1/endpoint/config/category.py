@@ -1,20 +1,22 @@
 from fastapi import APIRouter, Depends, Request, Query, Path, Body
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
-from app.db.base import get_db
+from app.db.base import get_db, get_async_read_db
 from app.core.auth.user_manager_service import user_manager_service
 from app.hepler.enum import OrderType
 from app.core.category.category_service import category_service
 from app.storage.redis import get_redis
+from app.storage.cached import bypass_cache
 
 router = APIRouter()
 
 
-@router.get("", summary="Get list of categories.")
+@router.get("", summary="Get list of categories.", dependencies=[Depends(bypass_cache)])
 async def get_list_category(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     redis: Redis = Depends(get_redis),
     skip: int = Query(None, description="The number of category to skip.", example=0),
     limit: int = Query(
@@ -68,6 +70,7 @@ async def get_category_by_id(
 @router.post("", summary="Create a category.")
 async def create_category(
     db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     current_user=Depends(user_manager_service.get_current_superuser),
     data: dict = Body(
         ...,
@@ -96,12 +99,13 @@ async def create_category(
     """
     data = locals()
 
-    return await category_service.create(db, data)
+    return await category_service.create(db, redis, data)
 
 
 @router.put("/{id}", summary="Update a category by id.")
 async def update_category_by_id(
     db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     current_user=Depends(user_manager_service.get_current_superuser),
     id: int = Path(..., description="The category id."),
     data: dict = Body(
@@ -132,12 +136,13 @@ async def update_category_by_id(
     """
     data = locals()
 
-    return await category_service.update(db, id, data)
+    return await category_service.update(db, redis, id, data)
 
 
 @router.delete("/{id}", summary="Delete a category by id.")
 async def delete_category_by_id(
     db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     current_user=Depends(user_manager_service.get_current_superuser),
     id: int = Path(..., description="The category id."),
 ):
@@ -154,4 +159,4 @@ async def delete_category_by_id(
     - status_code (404): The category is not found.
 
     """
-    return await category_service.delete(db, id)
+    return await category_service.delete(db, redis, id)
@@ -1,19 +1,21 @@
 from fastapi import APIRouter, Depends, Query, Path, Body
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
-from app.db.base import get_db
+from app.db.base import get_db, get_async_read_db
 from app.storage.redis import get_redis
 from app.core.auth.user_manager_service import user_manager_service
 from app.hepler.enum import OrderType
 from app.core.field.field_service import field_service
+from app.storage.cached import bypass_cache
 
 router = APIRouter()
 
 
-@router.get("", summary="Get list of categories.")
+@router.get("", summary="Get list of categories.", dependencies=[Depends(bypass_cache)])
 async def get_list_field(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     redis: Redis = Depends(get_redis),
     skip: int = Query(None, description="The number of field to skip.", example=0),
     limit: int = Query(None, description="The number of field to return.", example=100),
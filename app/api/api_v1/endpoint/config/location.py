@@ -1,18 +1,21 @@
 from fastapi import APIRouter, Depends, Query, Path
 from redis.asyncio import Redis
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.db.base import get_async_read_db
 from app.core.location.location_service import location_service
 from app.hepler.enum import OrderType
 from app.storage.redis import get_redis
+from app.storage.cached import bypass_cache
 
 router = APIRouter()
 
 
-@router.get("/province", summary="Get list of provinces.")
+@router.get(
+    "/province", summary="Get list of provinces.", dependencies=[Depends(bypass_cache)]
+)
 async def get_list_province(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     redis: Redis = Depends(get_redis),
     skip: int = Query(None, description="The number of province to skip.", example=0),
     limit: int = Query(
@@ -41,9 +44,13 @@ async def get_list_province(
     return await location_service.get_province(db, redis, args)
 
 
-@router.get("/province/{id}", summary="Get province by id.")
+@router.get(
+    "/province/{id}",
+    summary="Get province by id.",
+    dependencies=[Depends(bypass_cache)],
+)
 async def get_province_by_id(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     redis: Redis = Depends(get_redis),
     id: int = Path(..., description="The province id.", example=1),
 ):
@@ -63,9 +70,11 @@ async def get_province_by_id(
     return await location_service.get_province_by_id(db, redis, id)
 
 
-@router.get("/district", summary="Get list of districts.")
+@router.get(
+    "/district", summary="Get list of districts.", dependencies=[Depends(bypass_cache)]
+)
 async def get_list_district(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     redis: Redis = Depends(get_redis),
     province_id: int = Query(..., description="The province id.", example=1),
     skip: int = Query(None, description="The number of districts to skip.", example=0),
@@ -97,9 +106,13 @@ async def get_list_district(
     return await location_service.get_district(db, redis, args)
 
 
-@router.get("/district/{id}", summary="Get district by id.")
+@router.get(
+    "/district/{id}",
+    summary="Get district by id.",
+    dependencies=[Depends(bypass_cache)],
+)
 async def get_district_by_id(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     redis: Redis = Depends(get_redis),
     id: int = Path(..., description="The district id.", example=1),
 ):
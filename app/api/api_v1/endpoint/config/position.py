@@ -7,11 +7,16 @@ from app.db.base import get_db
 from app.core.auth.user_manager_service import user_manager_service
 from app.core.job_position.position_service import job_position_service
 from app.hepler.enum import OrderType
+from app.storage.cached import bypass_cache
 
 router = APIRouter()
 
 
-@router.get("/job_position", summary="Get list of job positions.")
+@router.get(
+    "/job_position",
+    summary="Get list of job positions.",
+    dependencies=[Depends(bypass_cache)],
+)
 async def get_list_job_position(
     db: Session = Depends(get_db),
     redis: Redis = Depends(get_redis),
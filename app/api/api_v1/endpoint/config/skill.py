@@ -1,19 +1,21 @@
 from fastapi import APIRouter, Depends, Query, Path, Body
 from redis.asyncio import Redis
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.db.base import get_db, get_async_read_db
 from app.core.auth.user_manager_service import user_manager_service
 from app.storage.redis import get_redis
 from app.core.skill.skill_service import skill_service
 from app.hepler.enum import OrderType
+from app.storage.cached import bypass_cache
 
 router = APIRouter()
 
 
-@router.get("", summary="Get list of skills.")
+@router.get("", summary="Get list of skills.", dependencies=[Depends(bypass_cache)])
 async def get_list_skill(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     redis: Redis = Depends(get_redis),
     skip: int = Query(None, description="The number of skill to skip.", example=0),
     limit: int = Query(
@@ -67,6 +69,7 @@ async def get_skill_by_id(
 @router.post("", summary="Create a skill.")
 async def create_skill(
     db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     current_user=Depends(user_manager_service.get_current_superuser),
     data: dict = Body(
         ...,
@@ -94,12 +97,13 @@ async def create_skill(
     - status_code (409): The skill is already created.
 
     """
-    return await skill_service.create(db, data)
+    return await skill_service.create(db, redis, data)
 
 
 @router.put("/{id}", summary="Update a skill by id.")
 async def update_skill(
     db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     current_user=Depends(user_manager_service.get_current_superuser),
     id: int = Path(..., description="The skill id."),
     data: dict = Body(
@@ -129,12 +133,13 @@ async def update_skill(
     - status_code (404): The skill is not found.
 
     """
-    return await skill_service.update(db, id, data)
+    return await skill_service.update(db, redis, id, data)
 
 
 @router.delete("/{id}", summary="Delete a skill by id.")
 async def delete_skill_by_id(
     db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     current_user=Depends(user_manager_service.get_current_superuser),
     id: int = Path(..., description="The skill id."),
 ):
@@ -151,4 +156,4 @@ async def delete_skill_by_id(
     - status_code (404): The skill is not found.
 
     """
-    return await skill_service.delete(db, id)
+    return await skill_service.delete(db, redis, id)
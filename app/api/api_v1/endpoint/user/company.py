@@ -2,7 +2,7 @@ from fastapi import APIRouter, Query, Path, Depends
 from typing import List
 from sqlalchemy.orm import Session
 
-from app.db.base import get_db
+from app.db.base import get_db, get_read_db
 from app.core.company.company_service import company_service
 from app.hepler.enum import OrderType, SortBy
 
@@ -11,7 +11,7 @@ router = APIRouter()
 
 @router.get("", summary="Get list of companies.")
 async def get_companies(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = Query(None, description="The number of companies to skip.", example=0),
     limit: int = Query(
         None, description="The number of companies to return.", example=10
@@ -50,7 +50,7 @@ async def get_companies(
 
 @router.get("/search", summary="Search list of company.")
 async def get_company(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = Query(None, description="The number of users to skip.", example=0),
     limit: int = Query(None, description="The number of users to return.", example=10),
     sort_by: SortBy = Query(
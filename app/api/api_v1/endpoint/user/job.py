@@ -2,20 +2,22 @@ from fastapi import APIRouter, Depends, Query, Path
 from redis.asyncio import Redis
 from datetime import date
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.db.base import get_db, get_read_db, get_async_db, get_async_read_db
 from app.storage.redis import get_redis
 from app.core.job.job_service import job_service
 from app.hepler.enum import OrderType, SortJobBy, JobType, SalaryType
 from app.model import Account
 from app.core.auth.user_manager_service import user_manager_service
+from app.storage.cached import bypass_cache
 
 router = APIRouter()
 
 
 @router.get("/search", summary="Search list of job.")
 async def search_job(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     redis: Redis = Depends(get_redis),
     current_user: Account = Depends(user_manager_service.get_current_user_optional),
     skip: int = Query(None, description="The number of users to skip.", example=0),
@@ -44,6 +46,7 @@ async def search_job(
     keyword: str = Query(None, description="The keyword.", example="developer"),
     updated_at: date = Query(None, description="The updated at.", example=date.today()),
     suggest: bool = Query(False, description="The suggest job.", example=False),
+    after: str = Query(None, description="The cursor of the last job returned."),
 ):
     """
     Get list of job by user.
@@ -68,6 +71,7 @@ async def search_job(
     - salary_type (str): The type salary.
     - keyword (str): The keyword.
     - updated_at (date): The updated at.
+    - after (str): The cursor of the last job returned, enables keyset pagination.
 
     Returns:
     - status_code (200): The list of job has been found successfully.
@@ -82,7 +86,7 @@ async def search_job(
 
 @router.get("", summary="Get list of job.")
 async def get_job(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     redis: Redis = Depends(get_redis),
     current_user: Account = Depends(user_manager_service.get_current_user_optional),
     skip: int = Query(None, description="The number of users to skip.", example=0),
@@ -95,6 +99,7 @@ async def get_job(
     ),
     company_id: int = Query(None, description="The company id.", example=1),
     province_id: int = Query(None, description="The province id.", example=1),
+    after: str = Query(None, description="The cursor of the last job returned."),
 ):
     """
     Get list of job by user.
@@ -108,6 +113,7 @@ async def get_job(
     - order_by (str): The order to sort by.
     - company_id (int): The company id.
     - province_id (int): The province id.
+    - after (str): The cursor of the last job returned, enables keyset pagination.
 
     Returns:
     - status_code (200): The list of job has been found successfully.
@@ -120,7 +126,11 @@ async def get_job(
     return await job_service.get_by_user(db, redis, {**args}, current_user)
 
 
-@router.get("/count_job_by_category", summary="Count job by category.")
+@router.get(
+    "/count_job_by_category",
+    summary="Count job by category.",
+    dependencies=[Depends(bypass_cache)],
+)
 async def count_job_by_category(
     db: Session = Depends(get_db),
     redis: Redis = Depends(get_redis),
@@ -139,7 +149,11 @@ async def count_job_by_category(
     return await job_service.count_job_by_category(db, redis)
 
 
-@router.get("/count_job_by_salary", summary="Count job by salary.")
+@router.get(
+    "/count_job_by_salary",
+    summary="Count job by salary.",
+    dependencies=[Depends(bypass_cache)],
+)
 async def count_job_by_salary(
     db: Session = Depends(get_db),
     redis: Redis = Depends(get_redis),
@@ -158,7 +172,64 @@ async def count_job_by_salary(
     return await job_service.count_job_by_salary(db, redis)
 
 
-@router.get("/cruitment_demand", summary="Get information of recruitment demand.")
+@router.get("/facets", summary="Count job by facets.")
+async def get_job_facets(
+    db: Session = Depends(get_read_db),
+    redis: Redis = Depends(get_redis),
+    company_id: int = Query(None, description="The company id.", example=1),
+    province_id: int = Query(None, description="The province id.", example=1),
+    district_id: int = Query(None, description="The district id.", example=1),
+    category_id: int = Query(None, description="The category id.", example=1),
+    field_id: int = Query(None, description="The field id.", example=1),
+    employment_type: JobType = Query(
+        None, description="The employment type.", example=JobType.FULL_TIME
+    ),
+    job_experience_id: int = Query(None, description="The experience id.", example=1),
+    min_salary: int = Query(None, description="The min salary.", example=1000000),
+    max_salary: int = Query(None, description="The max salary.", example=10000000),
+    salary_type: SalaryType = Query(
+        None, description="The type salary.", example=SalaryType.VND
+    ),
+    job_position_id: int = Query(None, description="The position id.", example=1),
+    keyword: str = Query(None, description="The keyword.", example="developer"),
+    updated_at: date = Query(None, description="The updated at.", example=date.today()),
+):
+    """
+    Count job by facets.
+
+    This endpoint allows counting the jobs matching the search filters by
+    district, category, salary, experience and employment type.
+
+    Parameters:
+    - company_id (int): The company id.
+    - province_id (int): The province id.
+    - district_id (int): The district id.
+    - category_id (int): The category id.
+    - field_id (int): The field id.
+    - employment_type (str): The employment type.
+    - job_experience_id (int): The experience id.
+    - job_position_id (int): The position id.
+    - min_salary (int): The min salary.
+    - max_salary (int): The max salary.
+    - salary_type (str): The type salary.
+    - keyword (str): The keyword.
+    - updated_at (date): The updated at.
+
+    Returns:
+    - status_code (200): The job facets have been counted successfully.
+    - status_code (400): The request is invalid.
+
+    """
+    args = locals()
+
+    return await job_service.get_facets(db, redis, {**args})
+
+
+@router.get(
+    "/cruitment_demand",
+    summary="Get information of recruitment demand.",
+    dependencies=[Depends(bypass_cache)],
+)
 async def get_cruitment_demand(
     db: Session = Depends(get_db),
     redis: Redis = Depends(get_redis),
@@ -179,7 +250,7 @@ async def get_cruitment_demand(
 
 @router.get("/{job_id}", summary="Get job by id.")
 async def get_job_by_id(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     redis: Redis = Depends(get_redis),
     current_user: Account = Depends(user_manager_service.get_current_user_optional),
     job_id: int = Path(
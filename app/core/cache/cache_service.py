@@ -0,0 +1,20 @@
+from app.common.response import CustomResponse
+from app.storage.base_cache import BaseCache
+from app.storage.cached import cached
+from app.storage.codec import ModelCodec
+from app.storage.redis import RedisDependency
+
+
+class CacheService:
+    async def get_stats(self):
+        return CustomResponse(
+            data={
+                "caches": BaseCache.get_all_stats(),
+                "functions": cached.get_all_stats(),
+                "codecs": ModelCodec.get_all_stats(),
+                "redis_pools": RedisDependency.get_all_pool_stats(),
+            }
+        )
+
+
+cache_service = CacheService()
@@ -89,6 +89,7 @@ class CampaignService:
         else:
             campaigns, count = filter_functions.get(page.filter_by)(db, page)
 
+        campaignCRUD.load_profile(db, campaigns, "campaign_dashboard")
         campaigns_response = [
             campaign_helper.get_info(db, campaign) for campaign in campaigns
         ]
@@ -99,12 +100,13 @@ class CampaignService:
         page = CampaignGetListPagination(**data)
 
         campaigns = filter_functions.get(page.filter_by)(db, page)
+        campaignCRUD.load_profile(db, campaigns, "campaign_dashboard")
         response = [campaign_helper.get_info(db, campaign) for campaign in campaigns]
 
         return CustomResponse(data={"campaigns": response})
 
     async def get_by_id(self, db: Session, campaign_id: int, current_user: Account):
-        campaign = campaignCRUD.get(db, campaign_id)
+        campaign = campaignCRUD.get(db, campaign_id, profile="campaign_dashboard")
         if not campaign:
             raise CustomException(
                 status_code=status.HTTP_404_NOT_FOUND, msg="Campaign not found"
@@ -203,7 +205,7 @@ class CampaignService:
                     db, job.id, JobStatus.STOPPED
                 )
             try:
-                job_cache_service.delete_job_info(redis, campaign.job.id)
+                await job_cache_service.delete_job_info(redis, campaign.job.id)
             except Exception as e:
                 print(e)
 
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from typing import List
+from redis.asyncio import Redis
+from typing import List, Dict
 
 from app.crud import category as categoryCRUD, job_category as job_categoryCRUD
 from app.schema.category import (
@@ -8,9 +9,19 @@ from app.schema.category import (
 from app.model import Category
 from fastapi import status
 from app.common.exception import CustomException
+from app.storage.lookup import Lookup
 
 
 class CategoryHelper:
+    def __init__(self):
+        self.category_lookup = Lookup(
+            "category",
+            lambda db: {
+                category.id: self.get_info(category)
+                for category in categoryCRUD.get_all(db)
+            },
+        )
+
     def check_valid(
         self,
         db: Session,
@@ -31,7 +42,12 @@ class CategoryHelper:
         if not ids or ids is None:
             return []
 
-        return [self.check_valid(db, id) for id in ids]
+        ids = list(set(ids))
+        if len(categoryCRUD.get_existing_ids(db, ids)) != len(ids):
+            raise CustomException(
+                status_code=status.HTTP_404_NOT_FOUND, msg="Category not found"
+            )
+        return ids
 
     def get_info(self, category: Category) -> CategoryItemResponse:
         return CategoryItemResponse(**category.__dict__)
@@ -43,22 +59,39 @@ class CategoryHelper:
     def get_list_info(self, categories: List[Category]) -> List:
         return [self.get_info(category) for category in categories]
 
+    def get_list_info_by_job_ids(
+        self, db: Session, job_ids: List[int]
+    ) -> Dict[int, List[CategoryItemResponse]]:
+        response = {job_id: [] for job_id in job_ids}
+        for job_id, category in categoryCRUD.get_by_job_ids(db, job_ids):
+            response[job_id].append(self.get_info(category))
+        return response
+
     def get_list_info_by_ids(self, db: Session, ids: List[int]) -> List:
         return [self.get_info_by_id(db, id) for id in ids]
 
+    def get_category_lookup(
+        self, db: Session, ids: List[int]
+    ) -> Dict[int, CategoryItemResponse]:
+        """In-memory category lookup, reloaded when an id is missing"""
+        return self.category_lookup.get(db, ids)
+
+    async def clear_category_lookup(self, redis: Redis) -> None:
+        await self.category_lookup.invalidate(redis)
+
     def create_with_job_id(
         self,
         db: Session,
         job_id: int,
         ids: List[int],
     ) -> None:
-        ids = list(set(ids))
-        for category_id in ids:
-            job_category_data = {
-                "job_id": job_id,
-                "category_id": category_id,
-            }
-            job_categoryCRUD.create(db, obj_in=job_category_data)
+        job_categoryCRUD.create_multi(
+            db,
+            objs_in=[
+                {"job_id": job_id, "category_id": category_id}
+                for category_id in set(ids or [])
+            ],
+        )
 
     def update_with_job_id(
         self,
@@ -66,19 +99,19 @@ class CategoryHelper:
         job_id: int,
         new_category_ids: List[int],
     ) -> None:
-        current_category_ids = job_categoryCRUD.get_ids_by_job_id(db, job_id)
-        new_category_ids = list(set(new_category_ids))
-        remove_category_ids = list(set(current_category_ids) - set(new_category_ids))
-        add_category_ids = list(set(new_category_ids) - set(current_category_ids))
-
-        for category_id in remove_category_ids:
-            job_categoryCRUD.remove_by_job_id_and_category_id(db, job_id, category_id)
-        for category_id in add_category_ids:
-            job_category_data = {
-                "job_id": job_id,
-                "category_id": category_id,
-            }
-            job_categoryCRUD.create(db, obj_in=job_category_data)
+        current_category_ids = set(job_categoryCRUD.get_ids_by_job_id(db, job_id))
+        new_category_ids = set(new_category_ids or [])
+
+        job_categoryCRUD.remove_by_job_id_and_category_ids(
+            db, job_id, list(current_category_ids - new_category_ids)
+        )
+        job_categoryCRUD.create_multi(
+            db,
+            objs_in=[
+                {"job_id": job_id, "category_id": category_id}
+                for category_id in new_category_ids - current_category_ids
+            ],
+        )
 
 
 category_helper = CategoryHelper()
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
 from app.crud import category as categoryCRUD
@@ -9,32 +10,28 @@ from app.common.response import CustomResponse
 from app.schema.page import Pagination
 from app.schema.category import CategoryCreateRequest, CategoryUpdateRequest
 from app.storage.cache.config_cache_service import config_cache_service
+from app.storage.cache.job_cache_service import job_cache_service
+from app.storage.cached import cached
 
 
 class CategoryService:
-    async def get(self, db: Session, redis: Redis, data: dict):
+    async def get(self, db: AsyncSession, redis: Redis, data: dict):
         page = Pagination(**data)
-        key = page.get_key()
-
-        response = None
-        try:
-            response = await config_cache_service.get_cache_category(redis, key)
-        except Exception as e:
-            print(e)
-        if not response:
-            categories = categoryCRUD.get_multi(db, **page.model_dump())
-            response = category_helper.get_list_info(categories)
-            try:
-                await config_cache_service.cache_category(
-                    redis,
-                    key,
-                    response,
-                )
-            except Exception as e:
-                print(e)
+        response = await self.get_list(db, redis, page)
 
         return CustomResponse(data=response)
 
+    @cached(
+        config_cache_service,
+        config_cache_service.category_key + "{page.key}",
+        expire=60 * 60 * 24 * 30,
+        codec=config_cache_service.category_codec,
+        tags=[config_cache_service.category_key],
+    )
+    async def get_list(self, db: AsyncSession, redis: Redis, page: Pagination):
+        categories = await categoryCRUD.async_get_multi(db, **page.model_dump())
+        return category_helper.get_list_info(categories)
+
     async def get_by_id(self, db: Session, category_id: int):
         category = categoryCRUD.get(db, category_id)
 
@@ -47,7 +44,7 @@ class CategoryService:
 
         return CustomResponse(data=response)
 
-    async def create(self, db: Session, data: dict):
+    async def create(self, db: Session, redis: Redis, data: dict):
         category_data = CategoryCreateRequest(**data)
 
         category = categoryCRUD.get_by_name(db, category_data.name)
@@ -58,10 +55,14 @@ class CategoryService:
 
         category = categoryCRUD.create(db, obj_in=category_data)
         response = category_helper.get_info(category)
+        await category_helper.clear_category_lookup(redis)
+        await config_cache_service.invalidate_tags(
+            redis, [config_cache_service.category_key]
+        )
 
         return CustomResponse(status_code=status.HTTP_201_CREATED, data=response)
 
-    async def update(self, db: Session, category_id: int, data: dict):
+    async def update(self, db: Session, redis: Redis, category_id: int, data: dict):
         category_data = CategoryUpdateRequest(**data)
 
         category = categoryCRUD.get(db, category_id)
@@ -71,10 +72,18 @@ class CategoryService:
             )
 
         response = categoryCRUD.update(db, db_obj=category, obj_in=category_data)
+        await category_helper.clear_category_lookup(redis)
+        await config_cache_service.invalidate_tags(
+            redis,
+            [
+                config_cache_service.category_key,
+                job_cache_service.category_tag(category_id),
+            ],
+        )
 
         return CustomResponse(data=response)
 
-    async def delete(self, db: Session, category_id: int):
+    async def delete(self, db: Session, redis: Redis, category_id: int):
         category = categoryCRUD.get(db, category_id)
         if not category:
             raise CustomException(
@@ -82,6 +91,14 @@ class CategoryService:
             )
 
         response = categoryCRUD.remove(db, id=category_id)
+        await category_helper.clear_category_lookup(redis)
+        await config_cache_service.invalidate_tags(
+            redis,
+            [
+                config_cache_service.category_key,
+                job_cache_service.category_tag(category_id),
+            ],
+        )
 
         return CustomResponse(data=response)
 
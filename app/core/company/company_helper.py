@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Dict
 from datetime import datetime, timezone
 
 from app import crud
@@ -34,6 +34,25 @@ class CompanyHelper:
             fields=field_helper.get_list_info(fields),
         )
 
+    def get_list_info_by_business_ids(
+        self, db: Session, business_ids: List[int]
+    ) -> Dict[int, CompanyItemResponse]:
+        companies = {}
+        for company in crud.company.get_by_business_ids(db, business_ids):
+            companies.setdefault(company.business_id, company)
+
+        fields = {company.id: [] for company in companies.values()}
+        for company_id, field in crud.field.get_by_company_ids(db, list(fields)):
+            fields[company_id].append(field_helper.get_info(field))
+
+        return {
+            business_id: CompanyItemResponse(
+                **{k: v for k, v in company.__dict__.items() if k not in ["fields"]},
+                fields=fields[company.id],
+            )
+            for business_id, company in companies.items()
+        }
+
     def get_info_general(
         self, company: Company
     ) -> Optional[CompanyItemGeneralResponse]:
@@ -1,5 +1,6 @@
 from fastapi import status
 from sqlalchemy.orm import Session
+from redis.asyncio import Redis
 
 from app.crud import company as companyCRUD
 from app.schema.company import (
@@ -16,6 +17,8 @@ from app.core.auth.business_auth_helper import business_auth_helper
 from app.core.field.field_helper import field_helper
 from app.core.file.file_helper import file_helper
 from app.core.company.company_helper import company_helper
+from app.core.job.job_helper import job_helper
+from app.storage.cache.job_cache_service import job_cache_service
 from app.model import Manager, Account, Business
 from app.common.exception import CustomException
 from app.common.response import CustomResponse
@@ -120,7 +123,9 @@ class CompanyService:
 
         return CustomResponse(status_code=status.HTTP_201_CREATED, data=response)
 
-    async def update(self, db: Session, data: dict, current_user: Account):
+    async def update(
+        self, db: Session, redis: Redis, data: dict, current_user: Account
+    ):
         company_id = data.get("company_id")
         company = companyCRUD.get(db, company_id)
         if not company:
@@ -146,12 +151,18 @@ class CompanyService:
         obj_in = CompanyUpdate(**company_data.model_dump())
         company = companyCRUD.update(db, db_obj=company, obj_in=obj_in)
         field_helper.update_with_company_id(db, company.id, new_fields)
+        job_helper.sync_job_search_by_company(db, company.id)
+        await job_cache_service.invalidate_tags(
+            redis, [job_cache_service.company_tag(company.id)]
+        )
 
         response = company_helper.get_private_info(db, company)
 
         return CustomResponse(data=response)
 
-    async def delete(self, db: Session, company_id: int, current_user: Account):
+    async def delete(
+        self, db: Session, redis: Redis, company_id: int, current_user: Account
+    ):
         company = companyCRUD.get(db, company_id)
         manager: Manager = current_user.manager
         business: Business = manager.business
@@ -167,6 +178,9 @@ class CompanyService:
             )
 
         response = companyCRUD.remove(db, id=company_id)
+        await job_cache_service.invalidate_tags(
+            redis, [job_cache_service.company_tag(company_id)]
+        )
 
         return CustomResponse(data=response)
 
@@ -35,6 +35,18 @@ class Settings(BaseSettings):
     MYSQL_HOST: str = Field(default="localhost")
     MYSQL_PORT: str = Field(default="3306")
     MYSQL_DATABASE: str = Field(default="fastapi")
+    # Read replica information
+    DATABASE_REPLICA_URLS: List[str] = Field(default=[])
+    DATABASE_REPLICA_HEALTH_INTERVAL: int = Field(default=30)
+    DATABASE_STICKY_SECONDS: int = Field(default=5)
+    # Per-request statement counting, repeated statement shapes are logged as N+1
+    QUERY_STATS_ENABLED: bool = Field(default=True)
+    QUERY_STATS_REPEAT_THRESHOLD: int = Field(default=5)
+    # Statements slower than the threshold are logged, a sample is explained
+    SLOW_QUERY_ENABLED: bool = Field(default=True)
+    SLOW_QUERY_THRESHOLD_MS: int = Field(default=200)
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = Field(default=0.1)
+    SLOW_QUERY_MAX_FINGERPRINTS: int = Field(default=500)
     # Token information
     ACCESS_TOKEN_EXPIRE: int = Field(default=36000)
     REFRESH_TOKEN_EXPIRE: int = Field(default=86400)
@@ -79,6 +91,33 @@ class Settings(BaseSettings):
     REDIS_DB: int = Field(default=0)
     REDIS_EXPIRE: int = Field(default=3600)
     REDIS_MAX_CONNECTIONS: int = Field(default=10)
+    REDIS_PUBSUB_MAX_CONNECTIONS: int = Field(default=100)
+    REDIS_COUNTER_MAX_CONNECTIONS: int = Field(default=10)
+    # standalone, sentinel or cluster, cluster mode needs the search indexes off
+    REDIS_MODE: str = Field(default="standalone")
+    REDIS_SENTINELS: List[str] = Field(default=[])
+    REDIS_SENTINEL_MASTER: str = Field(default="mymaster")
+    REDIS_SENTINEL_PASSWORD: str = Field(default="")
+    CACHE_LOCAL_ENABLED: bool = Field(default=True)
+    CACHE_LOCAL_EXPIRE: int = Field(default=300)
+    # honour the X-Cache-Bypass header of routes using bypass_cache, benchmarks only
+    CACHE_BYPASS_ENABLED: bool = Field(default=False)
+    # in-process id lookups of small tables (categories, districts...)
+    LOOKUP_EXPIRE: int = Field(default=600)
+    # Redis 6+ client-side caching, local entries are invalidated by Redis itself
+    CACHE_CLIENT_TRACKING: bool = Field(default=False)
+    CACHE_CLIENT_TRACKING_EXPIRE: int = Field(default=3600)
+    # zstd compression of cached models, in bytes of JSON
+    CACHE_COMPRESS_ENABLED: bool = Field(default=True)
+    CACHE_COMPRESS_MIN_SIZE: int = Field(default=1024)
+    CACHE_COMPRESS_LEVEL: int = Field(default=3)
+    # Search index information
+    JOB_SEARCH_INDEX_ENABLED: bool = Field(default=True)
+    JOB_FACET_INDEX_ENABLED: bool = Field(default=True)
+    JOB_FACET_INDEX_REFRESH_SECONDS: int = Field(default=300)
+    # job_search read table, enable reads once it has been rebuilt
+    JOB_SEARCH_TABLE_ENABLED: bool = Field(default=False)
+    JOB_SEARCH_TABLE_SYNC: bool = Field(default=True)
     # Logging information
     LOG_LEVEL: int = Field(default=10)
     # Celery information
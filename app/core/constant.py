@@ -1,5 +1,6 @@
 import os
 from app.core.config import settings
+from app.hepler.enum import SalaryType
 
 FAIL = "fail"
 ERROR = "error"
@@ -31,3 +32,16 @@ MAX_FILE_SIZE = 10 * 1024 * 1024
 MAX_CV_SIZE = 5 * 1024 * 1024
 BUCKET_URL = "https://tvnow-bucket.s3.amazonaws.com/"
 GOOGLE_GET_USER_INFO_URL = "https://www.googleapis.com/oauth2/v1/userinfo?access_token="
+SALARY_UNIT = 1000000
+SALARY_RANGES = [
+    (0, 3, SalaryType.VND),
+    (3, 10, SalaryType.VND),
+    (10, 20, SalaryType.VND),
+    (20, 30, SalaryType.VND),
+    (30, 999, SalaryType.VND),
+]
+OTHER_SALARY = [
+    SalaryType.DEAL,
+    SalaryType.USD,
+    "other",
+]
@@ -87,6 +87,9 @@ class ConversationHelper:
                 db, conversation_id=conversation.id, limit=limit
             )
         )
+        conversation_memberCRUD.load_profile(
+            db, conversation_members, "conversation_member"
+        )
         members = [
             self.get_member_response(db, conversation_member)
             for conversation_member in conversation_members
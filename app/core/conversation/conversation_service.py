@@ -60,6 +60,11 @@ class ConversationService:
         conversations: List[Conversation] = conversationCRUD.get_by_lastest_message(
             db, account_id=current_user.id, **page.model_dump()
         )
+        conversationCRUD.load_profile(
+            db,
+            [c for c in conversations if c.type == ConversationType.PRIVATE],
+            "conversation_member",
+        )
 
         response = []
         for conversation in conversations:
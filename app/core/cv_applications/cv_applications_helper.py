@@ -30,7 +30,11 @@ class CVApplicationsHelper:
         company_info = company_helper.get_info_general(company)
 
         return CVApplicationUserItemResponse(
-            **cv_application.__dict__,
+            **{
+                k: v
+                for k, v in cv_application.__dict__.items()
+                if k not in ["user", "campaign"]
+            },
             job=job_info,
             company=company_info,
             user=self.get_user_info(db, cv_application)
@@ -44,7 +48,11 @@ class CVApplicationsHelper:
         job_info: JobItemResponseGeneral = job_helper.get_info_general(job)
 
         return CVApplicationGeneralResponse(
-            **cv_application.__dict__,
+            **{
+                k: v
+                for k, v in cv_application.__dict__.items()
+                if k not in ["user", "campaign"]
+            },
             job=job_info,
             user=self.get_user_info(db, cv_application)
         )
@@ -54,7 +62,12 @@ class CVApplicationsHelper:
     ) -> CVApplicationInfoResponse:
 
         return CVApplicationInfoResponse(
-            **cv_application.__dict__, user=self.get_user_info(db, cv_application)
+            **{
+                k: v
+                for k, v in cv_application.__dict__.items()
+                if k not in ["user", "campaign"]
+            },
+            user=self.get_user_info(db, cv_application),
         )
 
     def job_open(sefl, db: Session, job_id: int) -> Job:
@@ -93,6 +106,7 @@ class CVApplicationsHelper:
         cv_applications = cv_applicationCRUD.get_by_campaign_id(
             db, campaign_id=campaign_id, skip=skip, limit=limit
         )
+        cv_applicationCRUD.load_profile(db, cv_applications, "cv_application_user")
         return [self.get_info(db, cv_application) for cv_application in cv_applications]
 
 
@@ -48,6 +48,7 @@ class CVApplicationsService:
             db, user_id=current_user.id, **page.model_dump()
         )
 
+        cv_applicationCRUD.load_profile(db, cv_applications, "cv_application_card")
         cv_applications_response: List[CVApplicationUserItemResponse] = [
             await cv_applications_helper.get_full_info(db, cv_application)
             for cv_application in cv_applications
@@ -58,7 +59,9 @@ class CVApplicationsService:
     async def get_by_id(
         self, db: Session, id: int, current_user: Account
     ) -> CustomResponse:
-        cv_application: CVApplication = cv_applicationCRUD.get(db, id)
+        cv_application: CVApplication = cv_applicationCRUD.get(
+            db, id, profile="cv_application_card"
+        )
 
         if not cv_application:
             raise CustomException(
@@ -93,6 +96,7 @@ class CVApplicationsService:
             db, business_id=current_user.id, **page.model_dump()
         )
 
+        cv_applicationCRUD.load_profile(db, cv_applications, "cv_application_card")
         cv_applications_response: List[CVApplicationUserItemResponse] = [
             await cv_applications_helper.get_full_info(db, cv_application)
             for cv_application in cv_applications
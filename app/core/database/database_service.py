@@ -0,0 +1,14 @@
+from app.common.response import CustomResponse
+from app.db.slow_query import slow_query_log
+
+
+class DatabaseService:
+    async def get_slow_queries(self, limit: int, order_by: str):
+        return CustomResponse(data=slow_query_log.get_report(limit, order_by))
+
+    async def reset_slow_queries(self):
+        slow_query_log.reset()
+        return CustomResponse(data=None)
+
+
+database_service = DatabaseService()
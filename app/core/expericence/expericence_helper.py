@@ -1,11 +1,27 @@
 from sqlalchemy.orm import Session
+from typing import List, Dict
 
 from app.crud import experience as experienceCRUD
 from app.common.exception import CustomException
 from fastapi import status
+from app.storage.lookup import Lookup
 
 
 class ExperienceHelper:
+    def __init__(self):
+        self.experience_lookup = Lookup(
+            "experience",
+            lambda db: {
+                experience.id: {
+                    "id": experience.id,
+                    "title": experience.title,
+                    "from_year": experience.from_year,
+                    "to_year": experience.to_year,
+                }
+                for experience in experienceCRUD.get_all(db)
+            },
+        )
+
     def check_valid(
         self,
         db: Session,
@@ -18,5 +34,9 @@ class ExperienceHelper:
             )
         return id
 
+    def get_experience_lookup(self, db: Session, ids: List[int]) -> Dict[int, dict]:
+        """In-memory experience lookup, reloaded when an id is missing"""
+        return self.experience_lookup.get(db, ids)
+
 
 experience_helper = ExperienceHelper()
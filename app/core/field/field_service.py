@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
 from app.crud import field as fieldCRUD
@@ -9,33 +10,26 @@ from app.common.response import CustomResponse
 from app.schema.field import FieldCreateRequest, FieldUpdateRequest
 from app.schema.page import Pagination
 from app.storage.cache.config_cache_service import config_cache_service
+from app.storage.cached import cached
 
 
 class FieldService:
-    async def get_field(self, db: Session, redis: Redis, data: dict):
+    async def get_field(self, db: AsyncSession, redis: Redis, data: dict):
         page = Pagination(**data)
-        key = page.get_key()
-
-        response = None
-        try:
-            response = await config_cache_service.get_cache_field(redis, key)
-        except Exception as e:
-            print(e)
-
-        if not response:
-            fields = fieldCRUD.get_multi(db, **page.model_dump())
-            response = field_helper.get_list_info(fields)
-            try:
-                await config_cache_service.cache_field(
-                    redis,
-                    key,
-                    response,
-                )
-            except Exception as e:
-                print(e)
+        response = await self.get_list(db, redis, page)
 
         return CustomResponse(data=response)
 
+    @cached(
+        config_cache_service,
+        config_cache_service.field_key + "{page.key}",
+        expire=60 * 60 * 24 * 30,
+        codec=config_cache_service.field_codec,
+    )
+    async def get_list(self, db: AsyncSession, redis: Redis, page: Pagination):
+        fields = await fieldCRUD.async_get_multi(db, **page.model_dump())
+        return field_helper.get_list_info(fields)
+
     async def get_by_id(self, db: Session, id: int):
         field = fieldCRUD.get(db, id)
         if not field:
@@ -1,13 +1,13 @@
+from collections import defaultdict
 from sqlalchemy.orm import Session
 from redis.asyncio import Redis
-from typing import Union, List
+from typing import Union, List, Optional
 from fastapi import status
 
 from app.schema.job import (
     JobItemResponse,
     JobBusinessItemResponse,
     JobItemResponseGeneral,
-    JobSearchByUser,
 )
 from app.schema.job import CVApplicationInfoResponse, JobUpdate, JobUpdateRequest
 from app.schema.job_approval_request import (
@@ -20,10 +20,17 @@ from app.crud import (
     company as companyCRUD,
     cv_applications as cv_applicationCRUD,
     job_approval_request as job_approval_requestCRUD,
+    job_search as job_searchCRUD,
 )
 from app.schema.user import UserBasicResponse
 from app.core.working_times.working_times_helper import working_times_helper
 from app.storage.cache.job_cache_service import job_cache_service
+from app.storage.search.job_search_index import job_search_index
+from app.storage.search.job_facet_index import job_facet_index, JobFacetIndex
+from app.storage.base_facet_index import FacetIndexRefresher
+from app.db.base import SessionLocal, run_sync
+from app.core.config import settings
+from app.core import constant
 from app.model import (
     Job,
     Account,
@@ -40,33 +47,372 @@ from app.core.job_position.job_position_hepler import job_position_helper
 from app.core.skill.skill_helper import skill_helper
 from app.core.category.category_helper import category_helper
 from app.core.work_locations.work_locations_hepler import work_location_helper
+from app.core.location.location_helper import location_helper
 from app.core.job_approval_requests.job_approval_request_helper import (
     job_approval_request_helper,
 )
 from app.core.job_approval_log.job_approval_log_helper import job_approval_log_helper
 from app.core.company.company_helper import company_helper
-from app.hepler.enum import JobSkillType, JobStatus, JobApprovalStatus
+from app.hepler.enum import JobStatus, JobApprovalStatus
 from app.common.exception import CustomException
 from app.common.response import CustomResponse
 
 
 class JobHepler:
-    async def get_list_job(self, db: Session, redis: Redis, data: dict):
-        jobs = jobCRUD.get_multi(db, **data)
-        jobs_response = []
-        for job in jobs:
-            job_res = await self.get_info(db, redis, job)
-            if isinstance(job_res, dict):
-                jobs_response.append(job_res) if job_res.get("company") else None
-            else:
-                jobs_response.append(job_res) if job_res.company else None
-
-        return jobs_response
+    async def get_list_job(self, db: Session, redis: Redis, jobs: List[Job]):
+        jobs_response = await self.get_list_job_info(db, redis, jobs)
+        return [job_res for job_res in jobs_response if job_res.company]
 
     async def get_list_job_info(
         self, db: Session, redis: Redis, jobs: List[Job]
     ) -> List[JobItemResponse]:
-        return [await self.get_info(db, redis, job) for job in jobs]
+        jobs_response = {}
+        try:
+            jobs_response, _ = await job_cache_service.get_many_job_info(
+                redis, [job.id for job in jobs]
+            )
+        except Exception as e:
+            print(e)
+
+        missed_jobs = [job for job in jobs if job.id not in jobs_response]
+        missed_jobs_response = await run_sync(
+            db, self.get_list_info_from_db, missed_jobs
+        )
+        jobs_response.update({job.id: job for job in missed_jobs_response})
+        try:
+            await job_cache_service.cache_many_job_info(redis, missed_jobs_response)
+        except Exception as e:
+            print(e)
+
+        return [jobs_response[job.id] for job in jobs]
+
+    def get_list_info_from_db(
+        self, db: Session, jobs: List[Job], Schema=JobItemResponse
+    ) -> List[JobItemResponse]:
+        if not jobs:
+            return []
+
+        job_ids = [job.id for job in jobs]
+        working_times = working_times_helper.get_by_job_ids(db, job_ids)
+        work_locations = work_location_helper.get_by_job_ids(db, job_ids)
+        companies = company_helper.get_list_info_by_business_ids(
+            db, list({job.business_id for job in jobs})
+        )
+        categories = category_helper.get_list_info_by_job_ids(db, job_ids)
+        skills = skill_helper.get_list_info_by_job_ids(db, job_ids)
+
+        return [
+            self.build_info(
+                job,
+                Schema=Schema,
+                working_times=working_times[job.id],
+                locations=work_locations[job.id],
+                company=companies.get(job.business_id),
+                categories=categories[job.id],
+                must_have_skills=skills[job.id],
+                should_have_skills=skills[job.id],
+            )
+            for job in jobs
+        ]
+
+    def build_info(self, job: Job, Schema=JobItemResponse, **relations):
+        return Schema(
+            **{
+                k: v
+                for k, v in job.__dict__.items()
+                if k
+                not in [
+                    "working_times",
+                    "must_have_skills",
+                    "should_have_skills",
+                    "locations",
+                    "job_categories",
+                ]
+            },
+            **relations,
+        )
+
+    async def search_job_ids_by_keyword(
+        self, redis: Redis, keyword: Optional[str]
+    ) -> Optional[List[int]]:
+        if not keyword or not settings.JOB_SEARCH_INDEX_ENABLED:
+            return None
+        try:
+            if await job_search_index.is_built(redis):
+                return await job_search_index.search_job_ids(redis, keyword)
+        except Exception as e:
+            print(e)
+        return None
+
+    async def get_catalogue_key(self, redis: Redis, key: str) -> str:
+        """Prefix a search cache key with the job catalogue generation"""
+        generation = 0
+        try:
+            generation = await job_cache_service.get_catalogue_generation(redis)
+        except Exception as e:
+            print(e)
+        return f"{generation}_{key}"
+
+    async def bump_catalogue_generation(self, redis: Redis) -> None:
+        try:
+            await job_cache_service.bump_catalogue_generation(redis)
+        except Exception as e:
+            print(e)
+
+    async def sync_search_index(self, db: Session, redis: Redis, job: Job) -> None:
+        await self.sync_facet_index(db, redis, [job.id])
+        self.sync_job_search(db, [job.id])
+        await self.bump_catalogue_generation(redis)
+        if not settings.JOB_SEARCH_INDEX_ENABLED:
+            return
+        try:
+            if job.status == JobStatus.PUBLISHED:
+                db.expire(job, ["must_have_skills", "should_have_skills"])
+                await job_search_index.index_job(redis, job)
+            else:
+                await job_search_index.remove_job(redis, job.id)
+        except Exception as e:
+            print(e)
+
+    async def remove_from_search_index(self, redis: Redis, job_id: int) -> None:
+        job_facet_index.remove(job_id)
+        if settings.JOB_FACET_INDEX_ENABLED:
+            await job_facet_index_refresher.publish(redis, [job_id])
+        await self.bump_catalogue_generation(redis)
+        try:
+            await job_search_index.remove_job(redis, job_id)
+        except Exception as e:
+            print(e)
+
+    async def rebuild_search_index(
+        self, db: Session, redis: Redis, batch_size: int = 1000
+    ) -> int:
+        # drops terms of jobs gone since the last build, searches use SQL
+        # until the index is marked built again
+        await job_search_index.clear(redis)
+        count = 0
+        after_id = 0
+        while True:
+            jobs = jobCRUD.get_published(db, after_id=after_id, limit=batch_size)
+            if not jobs:
+                break
+            for job in jobs:
+                await job_search_index.index_job(redis, job)
+            count += len(jobs)
+            after_id = jobs[-1].id
+            db.expunge_all()
+        await job_search_index.mark_built(redis)
+        return count
+
+    def get_facet_index(self) -> Optional[JobFacetIndex]:
+        """The facet index once built, job_facet_index_refresher keeps it fresh"""
+        if not settings.JOB_FACET_INDEX_ENABLED or not job_facet_index.is_built():
+            return None
+        return job_facet_index
+
+    def can_use_facet_index(
+        self, filters: dict, job_ids: Optional[List[int]] = None
+    ) -> bool:
+        """Whether the facet index answers the filters
+
+        Its answers are not cached: they cost less than a Redis round-trip, and
+        a worker that has not applied a change yet would keep its stale answer
+        under the new catalogue generation.
+        """
+        facet_index = self.get_facet_index()
+        return facet_index is not None and facet_index.can_filter(filters, job_ids)
+
+    def get_facet_bitmap(
+        self, db: Session, filters: dict, job_ids: Optional[List[int]] = None
+    ) -> Optional[int]:
+        facet_index = self.get_facet_index()
+        if not facet_index or not facet_index.can_filter(filters, job_ids):
+            return None
+        return facet_index.get_bitmap(filters, job_ids)
+
+    def count_by_facets(
+        self, db: Session, filters: dict, job_ids: Optional[List[int]] = None
+    ) -> Optional[int]:
+        bitmap = self.get_facet_bitmap(db, filters, job_ids)
+        if bitmap is None:
+            return None
+        return job_facet_index.count(bitmap)
+
+    def get_number_job_of_district_by_facets(
+        self, db: Session, filters: dict, job_ids: Optional[List[int]] = None
+    ) -> Optional[list]:
+        bitmap = self.get_facet_bitmap(db, filters, job_ids)
+        if bitmap is None:
+            return None
+        return job_facet_index.count_jobs_of_district(
+            bitmap, filters.get("province_id"), filters.get("district_id")
+        )
+
+    def get_facets(
+        self, db: Session, filters: dict, job_ids: Optional[List[int]] = None
+    ) -> dict:
+        facet_index = self.get_facet_index()
+        if facet_index is None or not facet_index.can_filter(filters, job_ids):
+            job_ids = jobCRUD.user_search_ids(db, **{**filters, "job_ids": job_ids})
+            if facet_index is None:
+                facet_index = JobFacetIndex()
+                facet_index.load(jobCRUD.get_facet_rows(db, job_ids))
+        bitmap = facet_index.get_bitmap(filters, job_ids)
+        return facet_index.get_facet_counts(
+            bitmap, filters.get("province_id"), filters.get("district_id")
+        )
+
+    def get_facets_info(self, db: Session, facets: dict) -> dict:
+        districts = location_helper.get_district_lookup(
+            db, [district_id for district_id, _ in facets["district"]]
+        )
+        categories = category_helper.get_category_lookup(db, list(facets["category"]))
+        experiences = experience_helper.get_experience_lookup(
+            db, list(facets["experience"])
+        )
+
+        salary = []
+        for idx, (min, max, salary_type) in enumerate(constant.SALARY_RANGES):
+            salary.append(
+                {
+                    "min_salary": min,
+                    "max_salary": max if max != 999 else 0,
+                    "salary_type": salary_type,
+                    "count": facets["salary_band"].get(idx, 0),
+                }
+            )
+        for index, salary_type in enumerate(constant.OTHER_SALARY):
+            salary.append(
+                {
+                    "min_salary": 0,
+                    "max_salary": 0,
+                    "salary_type": salary_type,
+                    "count": facets["salary_band"].get(
+                        len(constant.SALARY_RANGES) + index, 0
+                    ),
+                }
+            )
+
+        return {
+            "count": facets["count"],
+            "district": [
+                {"district": districts[district_id].model_dump(), "count": count}
+                for district_id, count in facets["district"]
+                if district_id in districts
+            ],
+            "category": [
+                {**categories[category_id].model_dump(), "count": count}
+                for category_id, count in facets["category"].items()
+                if category_id in categories
+            ],
+            "salary": salary,
+            "experience": [
+                {**experiences[experience_id], "count": count}
+                for experience_id, count in facets["experience"].items()
+                if experience_id in experiences
+            ],
+            "employment_type": [
+                {"employment_type": employment_type, "count": count}
+                for employment_type, count in facets["employment_type"].items()
+            ],
+        }
+
+    async def sync_facet_index(
+        self, db: Session, redis: Redis, job_ids: List[int]
+    ) -> None:
+        """Re-index the jobs here, then on every other worker"""
+        if not settings.JOB_FACET_INDEX_ENABLED:
+            return
+        if job_facet_index.is_built():
+            try:
+                job_facet_index.update(job_ids, jobCRUD.get_facet_rows(db, job_ids))
+            except Exception as e:
+                print(e)
+        await job_facet_index_refresher.publish(redis, job_ids)
+
+    def rebuild_facet_index(self, db: Session) -> int:
+        job_facet_index.load(jobCRUD.get_facet_rows(db))
+        return job_facet_index.count(job_facet_index.all)
+
+    def load_facet_documents(self, job_ids: Optional[List[int]] = None) -> dict:
+        """Facet documents of published jobs, on a session of its own"""
+        with SessionLocal() as db:
+            return job_facet_index.get_documents(jobCRUD.get_facet_rows(db, job_ids))
+
+    def get_job_search_rows(self, rows: dict) -> List[dict]:
+        """Turn job_searchCRUD.get_source_rows into one row per job and location"""
+        locations = defaultdict(list)
+        for job_id, province_id, district_id in rows["locations"]:
+            locations[job_id].append((province_id, district_id))
+        categories = defaultdict(list)
+        for job_id, category_id in rows["categories"]:
+            categories[job_id].append(category_id)
+        fields = defaultdict(list)
+        for company_id, field_id in rows["fields"]:
+            fields[company_id].append(field_id)
+
+        job_search_rows = []
+        for job in rows["jobs"]:
+            job_search_row = {
+                "job_id": job.id,
+                "company_id": job.company_id,
+                "field_ids": fields.get(job.company_id, []),
+                "category_ids": categories.get(job.id, []),
+                "title": job.title,
+                "employment_type": job.employment_type,
+                "job_experience_id": job.job_experience_id,
+                "job_position_id": job.job_position_id,
+                "salary_type": job.salary_type,
+                "min_salary": job.min_salary,
+                "max_salary": job.max_salary,
+                "salary_band": JobFacetIndex.get_salary_band(
+                    job.salary_type, job.min_salary, job.max_salary
+                ),
+                "quantity": job.quantity,
+                "deadline": job.deadline,
+                "created_at": job.created_at,
+                "updated_at": job.updated_at,
+            }
+            for province_id, district_id in locations.get(job.id) or [(None, None)]:
+                job_search_rows.append(
+                    {
+                        **job_search_row,
+                        "province_id": province_id,
+                        "district_id": district_id,
+                    }
+                )
+        return job_search_rows
+
+    def sync_job_search(self, db: Session, job_ids: List[int]) -> None:
+        if not settings.JOB_SEARCH_TABLE_SYNC or not job_ids:
+            return
+        try:
+            rows = job_searchCRUD.get_source_rows(db, job_ids)
+            job_searchCRUD.replace(db, job_ids, self.get_job_search_rows(rows))
+        except Exception as e:
+            db.rollback()
+            print(e)
+
+    def sync_job_search_by_company(self, db: Session, company_id: int) -> None:
+        self.sync_job_search(
+            db, job_searchCRUD.get_job_ids_by_company_id(db, company_id)
+        )
+
+    def rebuild_job_search(self, db: Session, batch_size: int = 1000) -> int:
+        count = 0
+        after_id = 0
+        while True:
+            job_ids = job_searchCRUD.get_published_job_ids(
+                db, after_id=after_id, limit=batch_size
+            )
+            if not job_ids:
+                break
+            rows = job_searchCRUD.get_source_rows(db, job_ids)
+            job_searchCRUD.replace(db, job_ids, self.get_job_search_rows(rows))
+            count += len(job_ids)
+            after_id = job_ids[-1]
+        job_searchCRUD.remove_unpublished(db)
+        return count
 
     def check_fields(
         self,
@@ -80,8 +426,9 @@ class JobHepler:
         experience_id: int,
         position_id: int,
     ):
-        skill_helper.check_list_valid(db, must_have_skills)
-        skill_helper.check_list_valid(db, should_have_skills)
+        skill_helper.check_list_valid(
+            db, (must_have_skills or []) + (should_have_skills or [])
+        )
         work_location_helper.check_list_valid(db, locations)
         category_helper.check_list_valid(db, categories)
         working_times_helper.check_list_valid(db, working_times)
@@ -100,14 +447,12 @@ class JobHepler:
         working_times: list,
     ) -> None:
         skill_helper.update_with_job_id(
-            db, job_id, must_have_skills, JobSkillType.MUST_HAVE
-        )
-        skill_helper.update_with_job_id(
-            db, job_id, should_have_skills, JobSkillType.SHOULD_HAVE
+            db, job_id, must_have_skills, should_have_skills
         )
         work_location_helper.update_with_job_id(db, job_id, locations)
         category_helper.update_with_job_id(db, job_id, categories)
         working_times_helper.update_with_job_id(db, job_id, working_times)
+        db.commit()
 
     async def get_info(
         self, db: Session, redis: Redis, job: Job, Schema=JobItemResponse
@@ -122,6 +467,17 @@ class JobHepler:
         except Exception as e:
             print(e)
 
+        job_response = await run_sync(db, self.get_info_from_db, job, Schema=Schema)
+
+        try:
+            await job_cache_service.cache_job_info(redis, job_id, job_response)
+        except Exception as e:
+            print(e)
+        return job_response
+
+    def get_info_from_db(
+        self, db: Session, job: Job, Schema=JobItemResponse
+    ) -> Union[JobItemResponse, dict]:
         working_times_response = working_times_helper.get_by_job_id(db, job.id)
         work_locations_response = work_location_helper.get_by_job_id(db, job.id)
         company = companyCRUD.get_by_business_id(db, job.business_id)
@@ -129,19 +485,9 @@ class JobHepler:
         categories_response = category_helper.get_list_info(job.job_categories)
         must_have_skills_response = skill_helper.get_list_info(job.must_have_skills)
         should_have_skills_response = skill_helper.get_list_info(job.should_have_skills)
-        job_response = Schema(
-            **{
-                k: v
-                for k, v in job.__dict__.items()
-                if k
-                not in [
-                    "working_times",
-                    "must_have_skills",
-                    "should_have_skills",
-                    "locations",
-                    "job_categories",
-                ]
-            },
+        return self.build_info(
+            job,
+            Schema=Schema,
             working_times=working_times_response,
             locations=work_locations_response,
             company=company_response,
@@ -150,12 +496,6 @@ class JobHepler:
             should_have_skills=should_have_skills_response,
         )
 
-        try:
-            await job_cache_service.cache_job_info(redis, job_id, job_response)
-        except Exception as e:
-            print(e)
-        return job_response
-
     async def get_info_business(
         self, db: Session, redis: Redis, job: Job
     ) -> JobBusinessItemResponse:
@@ -178,12 +518,6 @@ class JobHepler:
         )
         return job_response
 
-    def get_count_job_user_search_key(self, data: JobSearchByUser) -> str:
-        return f"{data.province_id}_{data.district_id}_{data.province_id}_{data.category_id}_{data.field_id}_{data.employment_type}_{data.job_experience_id}_{data.job_position_id}_{data.min_salary}_{data.max_salary}_{data.salary_type}_{data.deadline}_{data.keyword}_{data.suggest}_{data.updated_at}"
-
-    def search_job_user_search_key(self, data: JobSearchByUser) -> str:
-        return f"{data.province_id}_{data.district_id}_{data.province_id}_{data.category_id}_{data.field_id}_{data.employment_type}_{data.job_experience_id}_{data.job_position_id}_{data.min_salary}_{data.max_salary}_{data.salary_type}_{data.deadline}_{data.keyword}_{data.suggest}_{data.updated_at}_{data.skip}_{data.limit}_{data.sort_by}_{data.order_by}"
-
     def create_fields(
         self,
         db: Session,
@@ -195,14 +529,12 @@ class JobHepler:
         working_times: list,
     ):
         skill_helper.create_with_job_id(
-            db, job_id, must_have_skills, JobSkillType.MUST_HAVE
-        )
-        skill_helper.create_with_job_id(
-            db, job_id, should_have_skills, JobSkillType.SHOULD_HAVE
+            db, job_id, must_have_skills, should_have_skills
         )
         work_location_helper.create_with_job_id(db, job_id, locations)
         category_helper.create_with_job_id(db, job_id, categories)
         working_times_helper.create_with_job_id(db, job_id, working_times)
+        db.commit()
 
     def get_info_with_cv_application(
         self, db: Session, job: JobItemResponse, account: Account
@@ -291,3 +623,7 @@ class JobHepler:
 
 
 job_helper = JobHepler()
+
+job_facet_index_refresher = FacetIndexRefresher(
+    job_facet_index, job_helper.load_facet_documents, "job_facet_index"
+)
@@ -1,6 +1,6 @@
 from fastapi import status
 from sqlalchemy.orm import Session
-from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
 from app.schema.job import (
@@ -11,6 +11,7 @@ from app.schema.job import (
     JobFilterByBusiness,
     JobFilterByUser,
     JobSearchByUser,
+    JobFacetFilter,
     JobSearchByBusiness,
     JobCount,
     JobItemResponse,
@@ -34,7 +35,6 @@ from app.core import constant
 from app.hepler.enum import (
     Role,
     JobStatus,
-    SalaryType,
     JobApprovalStatus,
     CampaignStatus,
     RequestApproval,
@@ -43,6 +43,7 @@ from app.hepler.enum import (
 from app.core.job_approval_requests import job_approval_request_helper
 from app.core.job_approval_log.job_approval_log_helper import job_approval_log_helper
 from app.storage.cache.job_cache_service import job_cache_service
+from app.storage.cached import cached
 from app.hepler.common import CommonHelper
 from app.model import (
     Manager,
@@ -56,6 +57,7 @@ from app.model import (
     Campaign,
 )
 from app.core.location.location_helper import location_helper
+from app.db.base import run_sync
 from app.core.job.job_helper import job_helper
 from app.core.category.category_helper import category_helper
 from app.core.auth.business_auth_helper import business_auth_helper
@@ -94,7 +96,19 @@ class JobService:
                 )
 
             page.company_id = company.id
-        response = await job_helper.get_list_job(db, redis, page.model_dump())
+        jobs = jobCRUD.get_multi(db, **page.model_dump())
+        response = await job_helper.get_list_job(db, redis, jobs)
+
+        if page.after is not None:
+            response = {
+                "jobs": response,
+                "next_cursor": jobCRUD.get_next_cursor(
+                    jobs,
+                    limit=page.limit,
+                    sort_by=page.sort_by,
+                    order_by=page.order_by,
+                ),
+            }
 
         return CustomResponse(data=response)
 
@@ -105,98 +119,148 @@ class JobService:
         page.job_status = JobStatus.PUBLISHED
         page.job_approve_status = JobApprovalStatus.APPROVED
 
-        jobs = await job_helper.get_list_job(db, redis, page.model_dump())
+        jobs = jobCRUD.get_multi(db, **page.model_dump())
+        jobs_response = await job_helper.get_list_job(db, redis, jobs)
 
         params = JobCount(**data)
         number_of_all_jobs = jobCRUD.count(db, **params.model_dump())
         response = {
             "count": number_of_all_jobs,
-            "jobs": jobs,
+            "next_cursor": jobCRUD.get_next_cursor(
+                jobs,
+                limit=page.limit,
+                sort_by=page.sort_by,
+                order_by=page.order_by,
+            ),
+            "jobs": jobs_response,
         }
 
         return CustomResponse(data=response)
 
     async def search_by_user(
-        self, db: Session, redis: Redis, data: dict, current_user: Account
+        self, db: AsyncSession, redis: Redis, data: dict, current_user: Account
     ):
         page = JobSearchByUser(**data)
         page.job_status = JobStatus.PUBLISHED
         jobs = None
         count = 0
         jobs_of_district_response = []
+        keyword_job_ids = await job_helper.search_job_ids_by_keyword(
+            redis, page.keyword
+        )
+        # ranked keyword pages and keyset pages continue differently
+        if page.after and jobCRUD.is_ranked_cursor(page.after) != (
+            keyword_job_ids is not None
+        ):
+            raise CustomException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                msg="Cursor does not match this search, start from the first page",
+            )
+        search_key = await job_helper.get_catalogue_key(redis, page.get_search_key())
+        filter_key = await job_helper.get_catalogue_key(redis, page.get_filter_key())
 
         try:
-            jobs = await job_cache_service.get_cache_user_search(
-                redis, page.get_count_job_user_search_key()
-            )
+            jobs = await job_cache_service.get_cache_user_search(redis, search_key)
         except Exception as e:
             print(e)
 
         if not jobs:
-            jobs = jobCRUD.user_search(db, **page.model_dump())
+            if keyword_job_ids is not None:
+                jobs = await run_sync(
+                    db,
+                    jobCRUD.user_search_by_ranked_ids,
+                    keyword_job_ids,
+                    **page.model_dump(),
+                )
+            else:
+                jobs = await run_sync(db, jobCRUD.user_search, **page.model_dump())
             jobs = await job_helper.get_list_job_info(db, redis, jobs)
             try:
-                await job_cache_service.cache_user_search(
-                    redis, page.get_count_job_user_search_key(), jobs
-                )
+                await job_cache_service.cache_user_search(redis, search_key, jobs)
             except Exception as e:
                 print(e)
 
         if (page.province_id or page.district_id) and page.suggest:
+            from_facet_index = job_helper.can_use_facet_index(
+                page.model_dump(), keyword_job_ids
+            )
             try:
-                cache_key = page.get_jobs_of_district_key()
-                jobs_of_district_response = await job_cache_service.get_list(
-                    redis, cache_key
+                if not from_facet_index:
+                    jobs_of_district_response = await job_cache_service.get_cache_province_district_search_by_user(
+                        redis, filter_key
+                    )
+                count = sum(
+                    jobs_of_district_data["count"]
+                    for jobs_of_district_data in jobs_of_district_response or []
                 )
             except Exception as e:
                 print(e)
 
             if not jobs_of_district_response:
-                jobs_of_district = jobCRUD.get_number_job_of_district(
-                    db, **page.model_dump()
+                jobs_of_district = job_helper.get_number_job_of_district_by_facets(
+                    db, page.model_dump(), keyword_job_ids
+                )
+                if jobs_of_district is None:
+                    jobs_of_district = await run_sync(
+                        db,
+                        jobCRUD.get_number_job_of_district,
+                        **page.model_dump(),
+                        job_ids=keyword_job_ids,
+                    )
+                districts = await run_sync(
+                    db,
+                    location_helper.get_district_lookup,
+                    [key for key, _ in jobs_of_district],
                 )
                 jobs_of_district_response = []
                 for key, value in jobs_of_district:
                     count += value
-                    if value > 0 and key is not None:
-                        district = location_helper.get_district_info(db, key)
+                    if value > 0 and key in districts:
                         jobs_of_district_response.append(
                             {
-                                "district": district,
+                                "district": districts[key],
                                 "count": value,
                             }
                         )
                 try:
-                    await job_cache_service.cache_province_district_search_by_user(
-                        redis,
-                        cache_key,
-                        [
-                            {
-                                "district": jobs_of_district_data["district"].__dict__,
-                                "count": jobs_of_district_data["count"],
-                            }
-                            for jobs_of_district_data in jobs_of_district_response
-                        ],
-                    )
+                    if not from_facet_index:
+                        await job_cache_service.cache_province_district_search_by_user(
+                            redis,
+                            filter_key,
+                            [
+                                {
+                                    "district": jobs_of_district_data[
+                                        "district"
+                                    ].__dict__,
+                                    "count": jobs_of_district_data["count"],
+                                }
+                                for jobs_of_district_data in jobs_of_district_response
+                            ],
+                        )
                 except Exception as e:
                     print(e)
 
         else:
-            cache_key = page.get_count_job_user_search_key()
-            count = None
-            try:
-                count = await job_cache_service.get_cache_count_search_by_user(
-                    redis, cache_key
-                )
-            except Exception as e:
-                print(e)
+            params = JobCount(**data)
+            count = job_helper.count_by_facets(db, params.model_dump(), keyword_job_ids)
+            if count is None:
+                try:
+                    count = await job_cache_service.get_cache_count_search_by_user(
+                        redis, filter_key
+                    )
+                except Exception as e:
+                    print(e)
 
-            if not count:
-                params = JobCount(**data)
-                count = jobCRUD.user_count(db, **params.model_dump())
+            if count is None:
+                count = await run_sync(
+                    db,
+                    jobCRUD.user_count,
+                    **params.model_dump(),
+                    job_ids=keyword_job_ids,
+                )
                 try:
                     await job_cache_service.cache_count_search_by_user(
-                        redis, cache_key, count
+                        redis, filter_key, count
                     )
                 except Exception as e:
                     print(e)
@@ -204,13 +268,25 @@ class JobService:
         if current_user:
             for job in jobs:
                 jobs_response.append(
-                    job_helper.get_info_with_cv_application(db, job, current_user)
+                    await run_sync(
+                        db, job_helper.get_info_with_cv_application, job, current_user
+                    )
                 )
         else:
             jobs_response = jobs
 
         response = {
             "count": count,
+            "next_cursor": (
+                jobCRUD.get_next_cursor(
+                    jobs,
+                    limit=page.limit,
+                    sort_by=page.sort_by,
+                    order_by=page.order_by,
+                )
+                if keyword_job_ids is None
+                else jobCRUD.get_next_ranked_cursor(jobs, **page.model_dump())
+            ),
             "option": page,
             "jobs": jobs_response,
             "jobs_of_district": jobs_of_district_response,
@@ -218,6 +294,35 @@ class JobService:
 
         return CustomResponse(data=response)
 
+    async def get_facets(self, db: Session, redis: Redis, data: dict):
+        filters = JobFacetFilter(**data)
+        keyword_job_ids = await job_helper.search_job_ids_by_keyword(
+            redis, filters.keyword
+        )
+        from_facet_index = job_helper.can_use_facet_index(
+            filters.model_dump(), keyword_job_ids
+        )
+        cache_key = await job_helper.get_catalogue_key(redis, filters.get_facets_key())
+        response = None
+        try:
+            if not from_facet_index:
+                response = await job_cache_service.get_cache_job_facets(
+                    redis, cache_key
+                )
+        except Exception as e:
+            print(e)
+
+        if not response:
+            facets = job_helper.get_facets(db, filters.model_dump(), keyword_job_ids)
+            response = job_helper.get_facets_info(db, facets)
+            try:
+                if not from_facet_index:
+                    await job_cache_service.cache_job_facets(redis, cache_key, response)
+            except Exception as e:
+                print(e)
+
+        return CustomResponse(data=response)
+
     async def search_by_business(
         self, db: Session, redis: Redis, current_user: Account, data: dict
     ):
@@ -247,16 +352,16 @@ class JobService:
         params = JobCount(**page.model_dump())
         count = jobCRUD.count(db, **params.model_dump())
 
-        jobs_response = []
-        for job in jobs:
-            job_res = await job_helper.get_info(db, redis, job)
-            if isinstance(job_res, dict):
-                jobs_response.append(job_res) if job_res.get("company") else None
-            else:
-                jobs_response.append(job_res) if job_res.company else None
+        jobs_response = await job_helper.get_list_job(db, redis, jobs)
 
         response = {
             "count": count,
+            "next_cursor": jobCRUD.get_next_cursor(
+                jobs,
+                limit=page.limit,
+                sort_by=page.sort_by,
+                order_by=page.order_by,
+            ),
             "option": page,
             "jobs": jobs_response,
         }
@@ -293,16 +398,16 @@ class JobService:
         return CustomResponse(data=response)
 
     async def get_by_id_for_user(
-        self, db: Session, redis: Redis, job_id: int, current_user: Account
+        self, db: AsyncSession, redis: Redis, job_id: int, current_user: Account
     ):
-        job: Job = jobCRUD.get(db, job_id)
+        job: Job = await run_sync(db, jobCRUD.get, job_id)
         if not job:
             raise CustomException(
                 status_code=status.HTTP_404_NOT_FOUND, msg="Job not found"
             )
 
-        job_approval_request: JobApprovalRequest = (
-            job_approval_requestCRUD.get_first_by_job_id(db, job_id)
+        job_approval_request: JobApprovalRequest = await run_sync(
+            db, job_approval_requestCRUD.get_first_by_job_id, job_id
         )
         if (
             job.status != JobStatus.PUBLISHED
@@ -315,14 +420,15 @@ class JobService:
         response: JobItemResponse = await job_helper.get_info(db, redis, job)
 
         if current_user:
-            cv_application: CVApplication = (
-                cv_applicationCRUD.get_by_user_id_and_campaign_id(
-                    db, current_user.id, job.campaign_id
-                )
+            cv_application: CVApplication = await run_sync(
+                db,
+                cv_applicationCRUD.get_by_user_id_and_campaign_id,
+                current_user.id,
+                job.campaign_id,
             )
             if cv_application:
-                response.cv_application = cv_applications_helper.get_info(
-                    db, cv_application
+                response.cv_application = await run_sync(
+                    db, cv_applications_helper.get_info, cv_application
                 )
 
         return CustomResponse(data=response)
@@ -358,59 +464,49 @@ class JobService:
         return CustomResponse(data=response)
 
     async def count_job_by_category(self, db: Session, redis: Redis):
-        time_scan = CommonHelper.get_current_time(db)
-        response = None
-        try:
-            response = await job_cache_service.get_cache_count_job_by_category(redis)
-        except Exception as e:
-            print(e)
-
-        if not response:
-            data = jobCRUD.count_job_by_category(db)
-            response = []
-
-            for id, count in data:
-                category = category_helper.get_info_by_id(db, id)
-                response.append(
-                    {
-                        **category.model_dump(),
-                        "count": count,
-                        "time_scan": str(time_scan),
-                    }
-                )
-            try:
-                await job_cache_service.cache_count_job_by_category(redis, response)
-            except Exception as e:
-                print(e)
+        response = await self.get_count_job_by_category(db, redis)
 
         return CustomResponse(data=response)
 
-    async def count_job_by_salary(self, db: Session, redis: Redis):
-        data = None
-        salary_ranges = [
-            (0, 3, SalaryType.VND),
-            (3, 10, SalaryType.VND),
-            (10, 20, SalaryType.VND),
-            (20, 30, SalaryType.VND),
-            (30, 999, SalaryType.VND),
-        ]
-        other_salary = [
-            SalaryType.DEAL,
-            SalaryType.USD,
-            "other",
+    @cached(
+        job_cache_service,
+        job_cache_service.count_job_by_category_key,
+        expire=60 * 60 * 12,
+        early_refresh=1.0,
+    )
+    async def get_count_job_by_category(self, db: Session, redis: Redis) -> list:
+        time_scan = CommonHelper.get_current_time(db)
+        data = jobCRUD.count_job_by_category(db)
+        response = []
+
+        for id, count in data:
+            category = category_helper.get_info_by_id(db, id)
+            response.append(
+                {
+                    **category.model_dump(),
+                    "count": count,
+                    "time_scan": str(time_scan),
+                }
+            )
+        return response
+
+    @cached(
+        job_cache_service,
+        job_cache_service.count_job_by_salary_key,
+        expire=60 * 60 * 12,
+        early_refresh=1.0,
+    )
+    async def get_count_job_by_salary(self, db: Session, redis: Redis) -> list:
+        return [
+            (idx, count)
+            for (idx, count) in jobCRUD.count_job_by_salary(db, constant.SALARY_RANGES)
         ]
-        try:
-            data = await job_cache_service.get_cache_count_job_by_salary(redis)
-        except Exception as e:
-            print(e)
 
+    async def count_job_by_salary(self, db: Session, redis: Redis):
+        salary_ranges = constant.SALARY_RANGES
+        other_salary = constant.OTHER_SALARY
         time_scan = CommonHelper.get_current_time(db)
-        if not data:
-            data = jobCRUD.count_job_by_salary(db, salary_ranges)
-            try:
-                await job_cache_service.cache_count_job_by_salary(redis, data)
-            except Exception as e:
-                print(e)
+        data = await self.get_count_job_by_salary(db, redis)
 
         response = []
         for index, (idx, count) in enumerate(data[:-3]):
@@ -444,82 +540,53 @@ class JobService:
         return constant.SUCCESS, 200, response
 
     async def get_cruitment_demand(self, db: Session, redis: Redis):
+        response = await self.get_cruitment_demand_info(db, redis)
+
+        return CustomResponse(data=response)
+
+    @cached(
+        job_cache_service,
+        job_cache_service.job_cruiment_demand_key,
+        expire=60 * 60 * 12,
+        early_refresh=1.0,
+    )
+    async def get_cruitment_demand_info(self, db: Session, redis: Redis) -> dict:
         time_scan = CommonHelper.get_current_time(db)
-        approved_time = time_scan - timedelta(days=1)
+        work_market_data: WorkMarket = work_marketCRUD.get_lastest(db)
+
+        return {
+            "number_of_job_24h": (
+                work_market_data.quantity_job_new_today if work_market_data else None
+            ),
+            "number_of_job_active": (
+                work_market_data.quantity_job_recruitment if work_market_data else None
+            ),
+            "number_of_company_active": (
+                work_market_data.quantity_company_recruitment
+                if work_market_data
+                else None
+            ),
+            "time_scan": str(time_scan),
+        }
 
-        response = None
-        params = JobCount(
-            job_status=JobStatus.PUBLISHED,
-            job_approve_status=JobApprovalStatus.APPROVED,
+    async def rebuild_search_index(self, db: Session, redis: Redis):
+        count = await job_helper.rebuild_search_index(db, redis)
+
+        return CustomResponse(
+            msg="Rebuild search index success", data={"count": count}
         )
-        work_market_data: WorkMarket = None
 
-        try:
-            response = await job_cache_service.get_cache_job_cruiment_demand(redis)
-        except Exception as e:
-            print(e)
+    async def rebuild_facet_index(self, db: Session):
+        count = job_helper.rebuild_facet_index(db)
 
-        if not response:
-            number_of_job_24h = await job_cache_service.get_cache_count_job_24h(redis)
-            if not number_of_job_24h:
-                work_market_data = work_marketCRUD.get_lastest(db)
-                if work_market_data:
-                    number_of_job_24h = work_market_data.quantity_job_new_today
-                try:
-                    await job_cache_service.cache_count_job_24h(
-                        redis, number_of_job_24h
-                    )
-                except Exception as e:
-                    print(e)
+        return CustomResponse(msg="Rebuild facet index success", data={"count": count})
 
-            number_of_job_active = await job_cache_service.get_cache_count_job_active(
-                redis
-            )
-            if not number_of_job_active:
-                if work_market_data:
-                    number_of_job_active = work_market_data.quantity_job_recruitment
-                else:
-                    work_market_data = work_marketCRUD.get_lastest(db)
-                    if work_market_data:
-                        number_of_job_active = work_market_data.quantity_job_recruitment
-                try:
-                    await job_cache_service.cache_count_job_active(
-                        redis, number_of_job_active
-                    )
-                except Exception as e:
-                    print(e)
-            number_of_company_active = (
-                await job_cache_service.get_cache_count_job_active(redis)
-            )
-            if not number_of_company_active:
-                if work_market_data:
-                    number_of_company_active = (
-                        work_market_data.quantity_company_recruitment
-                    )
-                else:
-                    work_market_data = work_marketCRUD.get_lastest(db)
-                    if work_market_data:
-                        number_of_company_active = (
-                            work_market_data.quantity_company_recruitment
-                        )
-                try:
-                    await job_cache_service.cache_count_job_active(
-                        redis, number_of_company_active
-                    )
-                except Exception as e:
-                    print(e)
-            response = {
-                "number_of_job_24h": number_of_job_24h,
-                "number_of_job_active": number_of_job_active,
-                "number_of_company_active": number_of_company_active,
-                "time_scan": str(time_scan),
-            }
-            try:
-                await job_cache_service.cache_job_cruiment_demand(redis, response)
-            except Exception as e:
-                print(e)
+    async def rebuild_job_search(self, db: Session):
+        count = job_helper.rebuild_job_search(db)
 
-        return CustomResponse(data=response)
+        return CustomResponse(
+            msg="Rebuild job search table success", data={"count": count}
+        )
 
     async def create(
         self, db: Session, redis: Redis, data: dict, current_user: Account
@@ -583,6 +650,7 @@ class JobService:
         job_helper.create_job_approval_request(
             db, job, job_data, JobApprovalStatus.PENDING
         )
+        await job_helper.sync_search_index(db, redis, job)
 
         return CustomResponse(status_code=status.HTTP_201_CREATED, data=job_response)
 
@@ -650,6 +718,7 @@ class JobService:
             await job_cache_service.delete_job_info(redis, job.id)
         except Exception as e:
             print(e)
+        await job_helper.sync_search_index(db, redis, job)
 
         return CustomResponse(
             msg="Request update job success", status=status.HTTP_200_OK
@@ -698,6 +767,7 @@ class JobService:
             await job_cache_service.delete_job_info(redis, job.id)
         except Exception as e:
             print(e)
+        await job_helper.sync_search_index(db, redis, job)
 
         return CustomResponse(
             msg="Update job status success", status=status.HTTP_200_OK
@@ -726,6 +796,7 @@ class JobService:
             await job_cache_service.delete_job_info(redis, job_id)
         except Exception as e:
             print(e)
+        await job_helper.remove_from_search_index(redis, job_id)
 
         return CustomResponse(
             msg="Delete job success", status=status.HTTP_204_NO_CONTENT
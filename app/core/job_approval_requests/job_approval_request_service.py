@@ -102,6 +102,7 @@ class JobApprovalRequestService:
             await job_cache_service.delete_job_info(redis, job.id)
         except Exception as e:
             print(e)
+        await job_helper.sync_search_index(db, redis, job)
 
         return CustomResponse(data=job_approval_request)
 
@@ -158,6 +159,7 @@ class JobApprovalRequestService:
                 await job_cache_service.delete_job_info(redis, job.id)
             except Exception as e:
                 print(e)
+            await job_helper.sync_search_index(db, redis, job)
             return CustomResponse(data=job_approval_request)
 
         if (
@@ -214,6 +216,7 @@ class JobApprovalRequestService:
             await job_cache_service.delete_job_info(redis, job.id)
         except Exception as e:
             print(e)
+        await job_helper.sync_search_index(db, redis, job)
 
         return CustomResponse(data=job_approval_request)
 
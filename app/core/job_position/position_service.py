@@ -17,60 +17,53 @@ from fastapi import status
 from app.common.exception import CustomException
 from app.common.response import CustomResponse
 from app.storage.cache.config_cache_service import config_cache_service
+from app.storage.cached import cached
 
 
 class JobPositionService:
     async def get_position(self, db: Session, redis: Redis, data: dict):
         page = Pagination(**data)
-        key = page.get_key()
-
-        response = None
-        try:
-            response = await config_cache_service.get_cache_position(redis, key)
-        except Exception as e:
-            print(e)
-
-        if not response:
-            job_positions = job_positionCRUD.get_multi(db, **page.model_dump())
-            response = [
-                job_position_helper.get_info(db, job_position)
-                for job_position in job_positions
-            ]
-            try:
-                await config_cache_service.cache_position(redis, key, response)
-            except Exception as e:
-                print(e)
+        response = await self.get_position_list(db, redis, page)
 
         return CustomResponse(data=response)
 
+    @cached(
+        config_cache_service,
+        config_cache_service.position_key + "{page.key}",
+        expire=60 * 60 * 24 * 30,
+        codec=config_cache_service.position_codec,
+    )
+    async def get_position_list(self, db: Session, redis: Redis, page: Pagination):
+        job_positions = job_positionCRUD.get_multi(db, **page.model_dump())
+        return [
+            job_position_helper.get_info(db, job_position)
+            for job_position in job_positions
+        ]
+
     async def get_group(self, db: Session, redis: Redis, data: dict):
         page = Pagination(**data)
-        key = page.get_key()
-
-        response = None
-        try:
-            response = await config_cache_service.get_cache_position_group(redis, key)
-        except Exception as e:
-            print(e)
-
-        if not response:
-            group_positions = group_positionCRUD.get_multi(db, **page.model_dump())
-            response = [
-                GroupPositionItemResponse(
-                    **group_position.__dict__,
-                    tags=job_position_helper.get_list_info(
-                        db, group_position.job_positions
-                    )
-                )
-                for group_position in group_positions
-            ]
-            try:
-                await config_cache_service.cache_position_group(redis, key, response)
-            except Exception as e:
-                print(e)
+        response = await self.get_group_list(db, redis, page)
 
         return CustomResponse(data=response)
 
+    @cached(
+        config_cache_service,
+        config_cache_service.position_group_key + "{page.key}",
+        expire=60 * 60 * 24 * 30,
+        codec=config_cache_service.position_group_codec,
+    )
+    async def get_group_list(self, db: Session, redis: Redis, page: Pagination):
+        group_positions = group_positionCRUD.get_multi(db, **page.model_dump())
+        return [
+            GroupPositionItemResponse(
+                **group_position.__dict__,
+                tags=job_position_helper.get_list_info(
+                    db, group_position.job_positions
+                ),
+            )
+            for group_position in group_positions
+        ]
+
     async def get_position_by_id(self, db: Session, id: int):
         job_position = job_positionCRUD.get(db, id)
         if not job_position:
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Dict
 
 from app.model import Province, District
 from app.crud import province as provinceCRUD, district as districtCRUD
@@ -7,13 +8,29 @@ from app.schema.province import ProvinceItemResponse
 from app.schema.district import DistrictItemResponse
 from app.common.exception import CustomException
 from fastapi import status
+from app.storage.lookup import Lookup
 
 
 class LocationHelper:
+    def __init__(self):
+        self.district_lookup = Lookup(
+            "district",
+            lambda db: {
+                district.id: self.get_district_info(district)
+                for district in districtCRUD.get_all(db)
+            },
+        )
+
     def get_province_info_by_id(self, db: Session, id: int) -> ProvinceItemResponse:
         province = provinceCRUD.get(db, id)
         return ProvinceItemResponse(**province.__dict__) if province else None
 
+    async def async_get_province_info_by_id(
+        self, db: AsyncSession, id: int
+    ) -> ProvinceItemResponse:
+        province = await provinceCRUD.async_get(db, id)
+        return self.get_province_info(province)
+
     def get_province_info(self, province: Province) -> ProvinceItemResponse:
         return ProvinceItemResponse(**province.__dict__) if province else None
 
@@ -21,9 +38,21 @@ class LocationHelper:
         district = districtCRUD.get(db, id)
         return DistrictItemResponse(**district.__dict__) if district else None
 
+    async def async_get_district_info_by_id(
+        self, db: AsyncSession, id: int
+    ) -> DistrictItemResponse:
+        district = await districtCRUD.async_get(db, id)
+        return self.get_district_info(district)
+
     def get_district_info(self, district: District) -> DistrictItemResponse:
         return DistrictItemResponse(**district.__dict__) if district else None
 
+    def get_district_lookup(
+        self, db: Session, ids: List[int]
+    ) -> Dict[int, DistrictItemResponse]:
+        """In-memory district lookup, reloaded when an id is missing"""
+        return self.district_lookup.get(db, ids)
+
     def get_list_province_info(
         self, db: Session, data: dict
     ) -> List[ProvinceItemResponse]:
@@ -36,6 +65,18 @@ class LocationHelper:
         districts = districtCRUD.get_multi_by_province(db, **data)
         return [DistrictItemResponse(**district.__dict__) for district in districts]
 
+    async def async_get_list_province_info(
+        self, db: AsyncSession, data: dict
+    ) -> List[ProvinceItemResponse]:
+        provinces = await provinceCRUD.async_get_multi(db, **data)
+        return [ProvinceItemResponse(**province.__dict__) for province in provinces]
+
+    async def async_get_list_district_info(
+        self, db: AsyncSession, data: dict
+    ) -> List[DistrictItemResponse]:
+        districts = await districtCRUD.async_get_multi_by_province(db, **data)
+        return [DistrictItemResponse(**district.__dict__) for district in districts]
+
     def check_valid_province_district(
         self, db: Session, province_id: int, district_id: int
     ) -> None:
@@ -1,104 +1,91 @@
 from fastapi import status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
 from app.core import constant
 from app.schema.page import Pagination
 from app.storage.cache.location_cache_service import location_cache_service
+from app.storage.cached import cached
 from app.core.location.location_helper import location_helper
 from app.common.exception import CustomException
 from app.common.response import CustomResponse
 
 
 class LocationService:
-    async def get_province(self, db: Session, redis: Redis, data: dict):
+    async def get_province(self, db: AsyncSession, redis: Redis, data: dict):
         page = Pagination(**data)
-        key = page.get_key()
-
-        response = None
-        try:
-            response = await location_cache_service.get_cache_list_province(redis, key)
-        except Exception as e:
-            print(e)
-
-        if not response:
-            response = location_helper.get_list_province_info(db, page.model_dump())
-            try:
-                await location_cache_service.cache_list_province(redis, key, response)
-            except Exception as e:
-                print(e)
+        response = await self.get_list_province(db, redis, page)
 
         return CustomResponse(data=response)
 
-    async def get_district(self, db: Session, redis: Redis, data: dict):
+    @cached(
+        location_cache_service,
+        location_cache_service.province_key + "{page.key}",
+        expire=60 * 60 * 24,
+        codec=location_cache_service.province_list_codec,
+    )
+    async def get_list_province(self, db: AsyncSession, redis: Redis, page: Pagination):
+        return await location_helper.async_get_list_province_info(db, page.model_dump())
+
+    async def get_district(self, db: AsyncSession, redis: Redis, data: dict):
         page = Pagination(**data)
         province_id = data.get("province_id")
-        response = None
-        key = page.get_key() + f"_{province_id}"
 
         if not province_id:
             raise CustomException(
                 status_code=status.HTTP_400_BAD_REQUEST, msg="Province id is required"
             )
 
-        try:
-            response = await location_cache_service.get_cache_district_of_province(
-                redis, key
-            )
-        except Exception as e:
-            print(e)
-
-        if not response:
-            response = location_helper.get_list_district_info(
-                db, {**page.model_dump(), "province_id": province_id}
-            )
-            try:
-                await location_cache_service.cache_district_of_province(
-                    redis, key, response
-                )
-            except Exception as e:
-                print(e)
+        response = await self.get_list_district(db, redis, page, province_id)
 
         return CustomResponse(data=response)
 
-    async def get_province_by_id(self, db: Session, redis: Redis, id: int):
-        response = None
-        try:
-            await location_cache_service.get_cache_province(redis, id)
-        except Exception as e:
-            print(e)
-
+    @cached(
+        location_cache_service,
+        location_cache_service.district_key + "{page.key}_{province_id}",
+        expire=60 * 60 * 24,
+        codec=location_cache_service.district_list_codec,
+    )
+    async def get_list_district(
+        self, db: AsyncSession, redis: Redis, page: Pagination, province_id: int
+    ):
+        return await location_helper.async_get_list_district_info(
+            db, {**page.model_dump(), "province_id": province_id}
+        )
+
+    async def get_province_by_id(self, db: AsyncSession, redis: Redis, id: int):
+        response = await self.get_province_info(db, redis, id)
         if not response:
-            response = location_helper.get_province_info_by_id(db, id)
-            if not response:
-                raise CustomException(
-                    status_code=status.HTTP_404_NOT_FOUND, msg="Province not found"
-                )
-
-            try:
-                await location_cache_service.cache_province(redis, id, response)
-            except Exception as e:
-                print(e)
+            raise CustomException(
+                status_code=status.HTTP_404_NOT_FOUND, msg="Province not found"
+            )
 
         return CustomResponse(data=response)
 
-    async def get_district_by_id(self, db: Session, redis: Redis, id: int):
-        response = None
-        try:
-            response = await location_cache_service.get_cache_district(redis, id)
-        except Exception as e:
-            print(e)
-
+    @cached(
+        location_cache_service,
+        location_cache_service.province_key + "{id}",
+        expire=60 * 60 * 24,
+        codec=location_cache_service.province_codec,
+    )
+    async def get_province_info(self, db: AsyncSession, redis: Redis, id: int):
+        return await location_helper.async_get_province_info_by_id(db, id)
+
+    async def get_district_by_id(self, db: AsyncSession, redis: Redis, id: int):
+        response = await self.get_district_info(db, redis, id)
         if not response:
-            response = location_helper.get_district_info_by_id(db, id)
-            if not response:
-                return constant.ERROR, 404, "District not found"
-            try:
-                await location_cache_service.cache_district(redis, id, response)
-            except Exception as e:
-                print(e)
+            return constant.ERROR, 404, "District not found"
 
         return CustomResponse(data=response)
 
+    @cached(
+        location_cache_service,
+        location_cache_service.district_key + "{id}",
+        expire=60 * 60 * 24,
+        codec=location_cache_service.district_codec,
+    )
+    async def get_district_info(self, db: AsyncSession, redis: Redis, id: int):
+        return await location_helper.async_get_district_info_by_id(db, id)
+
 
 location_service = LocationService()
@@ -1,5 +1,5 @@
 from redis.asyncio import Redis
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from fastapi import status
 
@@ -31,40 +31,40 @@ from app.hepler.enum import ConversationType, MessageType
 
 
 class MessageService:
-    async def get(self, db: Session, redis: Redis, data: dict, current_user: Account):
+    async def get(
+        self, db: AsyncSession, redis: Redis, data: dict, current_user: Account
+    ):
         page = GetMessagesRequest(**data)
 
-        if not conversationCRUD.get_by_account_id_and_conversation_id(
+        if not await conversationCRUD.async_get_by_account_id_and_conversation_id(
             db, account_id=current_user.id, conversation_id=page.conversation_id
         ):
             raise CustomException(
                 status_code=status.HTTP_403_FORBIDDEN, msg="Not allowed to access"
             )
 
-        messages: List[Message] = messageCRUD.get_by_conversation_id(
+        messages: List[Message] = await messageCRUD.async_get_by_conversation_id(
             db, **page.model_dump()
         )
 
         response = []
         for message in messages:
-            parent_message: Message = None
-            message_attachments: List[MessageAttachment] = []
             user: AccountBasicResponse = conversation_helper.get_user_basic_response(
                 db, message.account
             )
-
-            if message.parent_id:
-                parent_message = messageCRUD.get(db, message.parent_id)
+            parent_message: Message = message.parent if message.parent_id else None
 
             message_attachments: List[MessageAttachment] = []
             if message.type in [MessageType.IMAGE, MessageType.FILE]:
-                message_attachments = message_attachmentCRUD.get_by_message_id(
-                    db, message_id=message.id
-                )
+                message_attachments = message.attachments
 
             response.append(
                 MessageResponse(
-                    **message.__dict__,
+                    **{
+                        key: value
+                        for key, value in message.__dict__.items()
+                        if key not in ("parent", "attachments")
+                    },
                     user=user,
                     parent=parent_message.__dict__ if parent_message else None,
                     attachments=[
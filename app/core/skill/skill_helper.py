@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Dict, Set, Tuple
 
 from app.crud import skill as skillCRUD, job_skill as job_skillCRUD
 from app.schema.skill import SkillItemResponse
@@ -17,6 +17,14 @@ class SkillHelper:
     def get_list_info(self, skills: List[Skill]) -> list:
         return [self.get_info(skill) for skill in skills]
 
+    def get_list_info_by_job_ids(
+        self, db: Session, job_ids: List[int]
+    ) -> Dict[int, List[SkillItemResponse]]:
+        response = {job_id: [] for job_id in job_ids}
+        for job_id, skill in skillCRUD.get_by_job_ids(db, job_ids):
+            response[job_id].append(self.get_info(skill))
+        return response
+
     def get_info_by_id(self, db: Session, id: int) -> dict:
         skill = skillCRUD.get(db, id)
         return self.get_info(db, skill) if skill else None
@@ -33,42 +41,70 @@ class SkillHelper:
 
         return id
 
-    def check_list_valid(self, db: Session, ids: list[int]) -> bool:
-        return [self.check_valid(db, id) for id in ids]
+    def check_list_valid(self, db: Session, ids: list[int]) -> list[int]:
+        ids = list(set(ids or []))
+        if len(skillCRUD.get_existing_ids(db, ids)) != len(ids):
+            raise CustomException(
+                status_code=status.HTTP_404_NOT_FOUND, msg="Skill not found"
+            )
+
+        return ids
+
+    def get_job_skills(
+        self, must_have_skills: list[int], should_have_skills: list[int]
+    ) -> Set[Tuple[int, JobSkillType]]:
+        return {
+            (skill_id, JobSkillType.MUST_HAVE) for skill_id in must_have_skills or []
+        } | {
+            (skill_id, JobSkillType.SHOULD_HAVE)
+            for skill_id in should_have_skills or []
+        }
 
     def create_with_job_id(
         self,
         db: Session,
         job_id: int,
-        ids: list[dict],
-        type: JobSkillType = JobSkillType.MUST_HAVE,
+        must_have_skills: list[int],
+        should_have_skills: list[int],
     ) -> list:
-        ids = list(set(ids))
-        for skill in ids:
-            skill = job_skillCRUD.create(
-                db,
-                obj_in=JobSkillCreate(job_id=job_id, skill_id=skill, type=type),
-            )
+        job_skills = self.get_job_skills(must_have_skills, should_have_skills)
+        job_skillCRUD.create_multi(
+            db,
+            objs_in=[
+                JobSkillCreate(job_id=job_id, skill_id=skill_id, type=type)
+                for skill_id, type in job_skills
+            ],
+        )
 
-        return ids
+        return list(job_skills)
 
     def update_with_job_id(
         self,
         db: Session,
         job_id: int,
-        new_skill_ids: list[dict],
-        type: JobSkillType = JobSkillType.MUST_HAVE,
+        must_have_skills: list[int],
+        should_have_skills: list[int],
     ) -> list:
-        ids = set(new_skill_ids)
-        current_skill_ids = job_skillCRUD.get_ids_by_job_id(db, job_id)
-        add_skill_ids = list(ids - set(current_skill_ids))
-        remove_skill_ids = list(set(current_skill_ids) - ids)
-
-        for skill_id in add_skill_ids:
-            job_skillCRUD.create(db, JobSkillCreate(job_id=job_id, skill_id=skill_id))
-        for skill_id in remove_skill_ids:
-            job_skillCRUD.remove_by_job_id_and_skill_id(db, job_id, skill_id)
-        return new_skill_ids
+        job_skills = self.get_job_skills(must_have_skills, should_have_skills)
+        current_job_skills = set()
+        remove_ids = []
+        for job_skill in job_skillCRUD.get_by_job_id(db, job_id):
+            key = (job_skill.skill_id, job_skill.type)
+            if key in job_skills and key not in current_job_skills:
+                current_job_skills.add(key)
+            else:
+                remove_ids.append(job_skill.id)
+
+        job_skillCRUD.remove_multi_by_ids(db, remove_ids)
+        job_skillCRUD.create_multi(
+            db,
+            objs_in=[
+                JobSkillCreate(job_id=job_id, skill_id=skill_id, type=type)
+                for skill_id, type in job_skills - current_job_skills
+            ],
+        )
+
+        return list(job_skills)
 
 
 skill_helper = SkillHelper()
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import status
 from redis.asyncio import Redis
 
@@ -7,31 +8,31 @@ from app.schema.skill import SkillCreateRequest, SkillUpdateRequest
 from app.schema.page import Pagination
 from app.core import constant
 from app.storage.cache.config_cache_service import config_cache_service
+from app.storage.cache.job_cache_service import job_cache_service
+from app.storage.cached import cached
 from app.core.skill.skill_helper import skill_helper
 from app.common.exception import CustomException
 from app.common.response import CustomResponse
 
 
 class SkillService:
-    async def get(self, db: Session, redis: Redis, data: dict):
+    async def get(self, db: AsyncSession, redis: Redis, data: dict):
         page = Pagination(**data)
-        key = page.get_key()
-
-        response = None
-        try:
-            response = await config_cache_service.get_cache_skill(redis, key)
-        except Exception as e:
-            print(e)
-        if not response:
-            skills = skillCRUD.get_multi(db, **page.model_dump())
-            response = skill_helper.get_list_info(skills)
-            try:
-                await config_cache_service.cache_skill(redis, key, response)
-            except Exception as e:
-                print(e)
+        response = await self.get_list(db, redis, page)
 
         return CustomResponse(data=response)
 
+    @cached(
+        config_cache_service,
+        config_cache_service.skill_key + "{page.key}",
+        expire=60 * 60 * 24 * 30,
+        codec=config_cache_service.skill_codec,
+        tags=[config_cache_service.skill_key],
+    )
+    async def get_list(self, db: AsyncSession, redis: Redis, page: Pagination):
+        skills = await skillCRUD.async_get_multi(db, **page.model_dump())
+        return skill_helper.get_list_info(skills)
+
     async def get_by_id(self, db: Session, id: int):
         response = skill_helper.get_info_by_id(db, id)
         if not response:
@@ -41,13 +42,16 @@ class SkillService:
 
         return CustomResponse(data=response)
 
-    async def create(self, db: Session, data: dict):
+    async def create(self, db: Session, redis: Redis, data: dict):
         skill_data = SkillCreateRequest(**data)
         response = skillCRUD.create(db, obj_in=skill_data)
+        await config_cache_service.invalidate_tags(
+            redis, [config_cache_service.skill_key]
+        )
 
         return CustomResponse(data=response)
 
-    async def update(self, db: Session, id: int, data: dict):
+    async def update(self, db: Session, redis: Redis, id: int, data: dict):
         skill = skillCRUD.get(db, id)
         if not skill:
             return constant.ERROR, 404, "Skill not found"
@@ -55,15 +59,23 @@ class SkillService:
         skill_data = SkillUpdateRequest(**data)
 
         response = skillCRUD.update(db, db_obj=skill, obj_in=skill_data)
+        await config_cache_service.invalidate_tags(
+            redis,
+            [config_cache_service.skill_key, job_cache_service.skill_tag(id)],
+        )
 
         return CustomResponse(data=response)
 
-    async def delete(self, db: Session, id: int):
+    async def delete(self, db: Session, redis: Redis, id: int):
         skill = skillCRUD.get(db, id)
         if not skill:
             return constant.ERROR, 404, "Skill not found"
 
         skillCRUD.remove(db, id=id)
+        await config_cache_service.invalidate_tags(
+            redis,
+            [config_cache_service.skill_key, job_cache_service.skill_tag(id)],
+        )
 
         return CustomResponse(msg="Skill has been deleted")
 
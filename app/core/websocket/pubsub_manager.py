@@ -1,6 +1,6 @@
 from redis.asyncio import Redis
 
-from app.storage.redis import get_redis
+from app.storage.redis import get_pubsub_redis
 
 
 class RedisPubSubManager:
@@ -8,7 +8,7 @@ class RedisPubSubManager:
         self.redis: Redis = None
 
     async def connect(self) -> None:
-        self.redis = await get_redis()
+        self.redis = await get_pubsub_redis()
         self.pubsub = self.redis.pubsub()
 
     async def subscribe(self, chat_id: int) -> Redis:
@@ -1,8 +1,12 @@
 from fastapi import status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Dict
 
-from app.crud import work_location as work_locationCRUD
+from app.crud import (
+    work_location as work_locationCRUD,
+    province as provinceCRUD,
+    district as districtCRUD,
+)
 from app.schema.work_location import (
     WorkLocatioCreate,
     WorkLocatioResponse,
@@ -21,6 +25,35 @@ class WorkLocationHepler:
             work_locations_response.append(self.get_info(db, work_location))
         return work_locations_response
 
+    def get_by_job_ids(
+        self, db: Session, job_ids: List[int]
+    ) -> Dict[int, List[WorkLocatioResponse]]:
+        work_locations = work_locationCRUD.get_by_job_ids(db, job_ids)
+        provinces = {
+            province.id: location_helper.get_province_info(province)
+            for province in provinceCRUD.get_multi_by_ids(
+                db, list({item.province_id for item in work_locations})
+            )
+        }
+        districts = {
+            district.id: location_helper.get_district_info(district)
+            for district in districtCRUD.get_multi_by_ids(
+                db,
+                list({item.district_id for item in work_locations if item.district_id}),
+            )
+        }
+
+        response = {job_id: [] for job_id in job_ids}
+        for work_location in work_locations:
+            response[work_location.job_id].append(
+                WorkLocatioResponse(
+                    **work_location.__dict__,
+                    province=provinces.get(work_location.province_id),
+                    district=districts.get(work_location.district_id),
+                )
+            )
+        return response
+
     def get_by_id(self, db: Session, id: int) -> dict:
         work_location = work_locationCRUD.get(db, id)
         if not work_location:
@@ -34,34 +67,29 @@ class WorkLocationHepler:
         work_locations = [self.get_by_id(db, id) for id in ids]
         return work_locations
 
-    def create_with_job_id(
-        self, db: Session, job_id: int, data: List[dict]
-    ) -> List[dict]:
-        return [
-            self.create(
-                db,
-                WorkLocatioCreate(job_id=job_id, **work_location),
-            )
-            for work_location in data
-        ]
+    def create_with_job_id(self, db: Session, job_id: int, data: List[dict]) -> None:
+        work_locationCRUD.create_multi(
+            db,
+            objs_in=[
+                WorkLocatioCreate(job_id=job_id, **work_location)
+                for work_location in data or []
+            ],
+        )
 
     def create(self, db: Session, data: WorkLocatioCreate) -> dict:
         work_location = work_locationCRUD.create(db, obj_in=data)
 
         return self.get_info(db, work_location)
 
-    def update_with_job_id(
-        self, db: Session, job_id: int, data: List[dict]
-    ) -> List[dict]:
-        work_locationCRUD.remove_by_job_id(db, job_id)
-
-        return [
-            self.create(
-                db,
-                WorkLocatioUpdate(job_id=job_id, **work_location),
-            )
-            for work_location in data
-        ]
+    def update_with_job_id(self, db: Session, job_id: int, data: List[dict]) -> None:
+        work_locationCRUD.remove_by_job_id(db, job_id, commit=False)
+        work_locationCRUD.create_multi(
+            db,
+            objs_in=[
+                WorkLocatioUpdate(job_id=job_id, **work_location)
+                for work_location in data or []
+            ],
+        )
 
     def update(self, db: Session, id: int, data: dict) -> WorkLocatioResponse:
         work_location = work_locationCRUD.get(db, id)
@@ -111,7 +139,21 @@ class WorkLocationHepler:
         if not data or data is None:
             return data
 
-        return [self.check_valid(db, province_district) for province_district in data]
+        province_ids = list({item["province_id"] for item in data})
+        if len(provinceCRUD.get_existing_ids(db, province_ids)) != len(province_ids):
+            raise CustomException(
+                status_code=status.HTTP_400_BAD_REQUEST, msg="Province not found"
+            )
+
+        district_ids = list(
+            {item["district_id"] for item in data if item.get("district_id")}
+        )
+        if len(districtCRUD.get_existing_ids(db, district_ids)) != len(district_ids):
+            raise CustomException(
+                status_code=status.HTTP_400_BAD_REQUEST, msg="District not found"
+            )
+
+        return data
 
 
 work_location_helper = WorkLocationHepler()
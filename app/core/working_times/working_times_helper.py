@@ -1,6 +1,6 @@
 from fastapi import status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Dict
 
 from app.crud import working_time as working_timeCRUD
 from app.schema.working_time import (
@@ -21,6 +21,14 @@ class WorkingTimesHelper:
             for working_time in working_times
         ]
 
+    def get_by_job_ids(self, db: Session, job_ids: List[int]) -> Dict[int, List[dict]]:
+        response = {job_id: [] for job_id in job_ids}
+        for working_time in working_timeCRUD.get_by_job_ids(db, job_ids):
+            response[working_time.job_id].append(
+                WorkingTimeResponse(**working_time.__dict__).model_dump()
+            )
+        return response
+
     def get_by_id(self, db: Session, id: int) -> dict:
         working_time = working_timeCRUD.get(db, id)
         if not working_time:
@@ -78,37 +86,20 @@ class WorkingTimesHelper:
 
         working_timeCRUD.remove(db, id)
 
-    def create_with_job_id(
-        self, db: Session, job_id: int, data: List[dict]
-    ) -> List[dict]:
-        working_times = []
-        for working_time in data:
-            working_time_data = WorkingTimeCreate(
-                job_id=job_id, **working_time
-            ).model_dump()
-
-            working_time = working_timeCRUD.create(db, obj_in=working_time_data)
-            working_times.append(
-                WorkingTimeResponse(**working_time.__dict__).model_dump()
-            )
-
-        return working_times
+    def create_with_job_id(self, db: Session, job_id: int, data: List[dict]) -> None:
+        working_timeCRUD.create_multi(
+            db,
+            objs_in=[
+                WorkingTimeCreate(job_id=job_id, **working_time)
+                for working_time in data or []
+            ],
+        )
 
     def update_with_job_id(
         self, db: Session, job_id: int, new_working_times: List[dict]
-    ) -> List[dict]:
-        working_timeCRUD.remove_by_job_id(db, job_id)
-        working_times = []
-        for working_time in new_working_times:
-            working_time_in = WorkingTimeCreate(
-                job_id=job_id, **working_time
-            ).model_dump()
-            working_time = working_timeCRUD.create(db, obj_in=working_time_in)
-            working_times.append(
-                WorkingTimeResponse(**working_time.__dict__).model_dump()
-            )
-
-        return working_times
+    ) -> None:
+        working_timeCRUD.remove_by_job_id(db, job_id, commit=False)
+        self.create_with_job_id(db, job_id, new_working_times)
 
     def delete_with_job_id(self, db: Session, job_id: int) -> None:
         working_timeCRUD.remove_by_job_id(db, job_id)
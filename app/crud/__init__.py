@@ -16,6 +16,7 @@ from .verify_code import verify_code
 from .verify_code_block import verify_code_block
 from .experience import experience
 from .job import job
+from .job_search import job_search
 from .job_category import job_category
 from .job_skill import job_skill
 from .skill import skill
@@ -1,10 +1,14 @@
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from datetime import datetime, date
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import or_, and_, select, insert
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base_class import Base
 from app.hepler.enum import Role
+from app.hepler.common import CommonHelper
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -12,15 +16,55 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    # named loader options for the relationships a response builder walks
+    profiles: Dict[str, List[Any]] = {}
+    # column naming the row in keyset cursors and breaking sort ties
+    cursor_id: str = "id"
+
     def __init__(self, model: Type[ModelType]):
         self.model = model
 
-    def get(self, db: Session, id: int) -> Optional[ModelType]:
-        return db.query(self.model).filter(self.model.id == id).first()
+    def get_profile_options(self, profile: Optional[str]) -> List[Any]:
+        return self.profiles[profile] if profile else []
+
+    def get(
+        self, db: Session, id: int, profile: Optional[str] = None
+    ) -> Optional[ModelType]:
+        return (
+            db.query(self.model)
+            .options(*self.get_profile_options(profile))
+            .filter(self.model.id == id)
+            .first()
+        )
+
+    def load_profile(
+        self, db: Session, objs: List[ModelType], profile: str
+    ) -> List[ModelType]:
+        """Eager load the relationships of `profile` on rows already loaded
+
+        The rows are selected again by id with the profile options, which fills
+        their unloaded relationships in a fixed number of queries.
+        """
+        ids = [obj.id for obj in objs]
+        if ids:
+            db.query(self.model).options(*self.get_profile_options(profile)).filter(
+                self.model.id.in_(ids)
+            ).all()
+        return objs
 
     def get_multi_by_ids(self, db: Session, ids: List[int]) -> List[ModelType]:
         return db.query(self.model).filter(self.model.id.in_(ids)).all()
 
+    def get_all(self, db: Session) -> List[ModelType]:
+        return db.query(self.model).all()
+
+    def get_existing_ids(self, db: Session, ids: List[int]) -> List[int]:
+        if not ids:
+            return []
+        return [
+            id for (id,) in db.query(self.model.id).filter(self.model.id.in_(ids)).all()
+        ]
+
     def get_multi(
         self,
         db: Session,
@@ -43,6 +87,127 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             .all()
         )
 
+    async def async_get(self, db: AsyncSession, id: int) -> Optional[ModelType]:
+        return await db.get(self.model, id)
+
+    async def async_get_multi_by_ids(
+        self, db: AsyncSession, ids: List[int]
+    ) -> List[ModelType]:
+        result = await db.execute(select(self.model).filter(self.model.id.in_(ids)))
+        return result.scalars().all()
+
+    async def async_get_all(self, db: AsyncSession) -> List[ModelType]:
+        result = await db.execute(select(self.model))
+        return result.scalars().all()
+
+    async def async_get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 10,
+        sort_by: str = "id",
+        order_by: str = "desc",
+    ) -> List[ModelType]:
+        result = await db.execute(
+            select(self.model)
+            .order_by(
+                getattr(self.model, sort_by).desc()
+                if order_by == "desc"
+                else getattr(self.model, sort_by)
+            )
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    def apply_sort(self, query, sort_by: str = "id", order_by: str = "desc"):
+        column = getattr(self.model, sort_by)
+        cursor_id = getattr(self.model, self.cursor_id)
+        if order_by == "desc":
+            return query.order_by(column.desc(), cursor_id.desc())
+        return query.order_by(column, cursor_id)
+
+    def apply_keyset(
+        self, query, *, after: str, sort_by: str = "id", order_by: str = "desc"
+    ):
+        """Continue after the row encoded in `after`, using `id` as tie-break."""
+        cursor = CommonHelper.decode_cursor(after)
+        column = getattr(self.model, sort_by)
+        cursor_id = getattr(self.model, self.cursor_id)
+        last_id = cursor["i"]
+        value = self.parse_cursor_value(column, cursor["v"])
+        is_desc = order_by == "desc"
+
+        if sort_by == self.cursor_id:
+            return query.filter(cursor_id < last_id if is_desc else cursor_id > last_id)
+
+        # MySQL sorts NULL first in ascending order and last in descending order
+        if value is None:
+            if is_desc:
+                return query.filter(column.is_(None), cursor_id < last_id)
+            return query.filter(
+                or_(column.isnot(None), cursor_id > last_id),
+            )
+
+        if is_desc:
+            conditions = [
+                column < value,
+                and_(column == value, cursor_id < last_id),
+            ]
+            if column.property.columns[0].nullable:
+                conditions.append(column.is_(None))
+        else:
+            conditions = [
+                column > value,
+                and_(column == value, cursor_id > last_id),
+            ]
+        return query.filter(or_(*conditions))
+
+    def apply_pagination(self, query, **kwargs):
+        skip = kwargs.get("skip", 0)
+        limit = kwargs.get("limit", 10)
+        sort_by = kwargs.get("sort_by", "id")
+        order_by = kwargs.get("order_by", "desc")
+        after = kwargs.get("after")
+
+        if after:
+            query = self.apply_keyset(
+                query, after=after, sort_by=sort_by, order_by=order_by
+            )
+            return self.apply_sort(query, sort_by, order_by).limit(limit)
+        return self.apply_sort(query, sort_by, order_by).offset(skip).limit(limit)
+
+    def parse_cursor_value(self, column, value: Any) -> Any:
+        if value is None:
+            return None
+        python_type = column.property.columns[0].type.python_type
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        return value
+
+    def get_next_cursor(
+        self,
+        items: List[Any],
+        *,
+        limit: int = 10,
+        sort_by: str = "id",
+        order_by: str = "desc",
+    ) -> Optional[str]:
+        if not items or len(items) < limit:
+            return None
+        last = items[-1]
+        return CommonHelper.encode_cursor(
+            {
+                "s": sort_by,
+                "o": order_by,
+                "v": getattr(last, sort_by),
+                "i": last.id,
+            }
+        )
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)
@@ -51,6 +216,23 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.refresh(db_obj)
         return db_obj
 
+    def create_multi(
+        self,
+        db: Session,
+        *,
+        objs_in: List[Union[CreateSchemaType, Dict[str, Any]]],
+    ) -> None:
+        """Insert all rows in one executemany, the caller commits."""
+        if not objs_in:
+            return
+        db.execute(
+            insert(self.model),
+            [
+                obj_in if isinstance(obj_in, dict) else obj_in.model_dump()
+                for obj_in in objs_in
+            ],
+        )
+
     def update(
         self,
         db: Session,
@@ -77,3 +259,11 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.delete(obj)
         db.commit()
         return obj
+
+    def remove_multi_by_ids(self, db: Session, ids: List[int]) -> None:
+        """Delete all rows in one statement, the caller commits."""
+        if not ids:
+            return
+        db.query(self.model).filter(self.model.id.in_(ids)).delete(
+            synchronize_session=False
+        )
@@ -1,10 +1,10 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from datetime import date, timedelta
 from sqlalchemy.sql import func, text
 from typing import List
 
 from .base import CRUDBase
-from app.model import Job, Campaign, CVApplication
+from app.model import Job, Campaign, CVApplication, Business, Manager
 from app.schema.campaign import CampaignCreate, CampaignUpdate
 from app.hepler.enum import (
     CampaignStatus,
@@ -16,6 +16,17 @@ from app.hepler.enum import (
 
 
 class CRUDCampaign(CRUDBase[Campaign, CampaignCreate, CampaignUpdate]):
+    profiles = {
+        # campaign_helper.get_info
+        "campaign_dashboard": [
+            joinedload(Campaign.job),
+            joinedload(Campaign.company),
+            joinedload(Campaign.business)
+            .joinedload(Business.manager)
+            .joinedload(Manager.account),
+        ],
+    }
+
     def get_multi(
         self,
         db: Session,
@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Session
+from typing import List, Tuple
 
 from .base import CRUDBase
-from app.model import Category
+from app.model import Category, JobCategory
 from app.schema.category import CategoryCreate, CategoryUpdate
 
 
@@ -9,5 +10,15 @@ class CRUDCategory(CRUDBase[Category, CategoryCreate, CategoryUpdate]):
     def get_by_name(self, db: Session, name: str) -> Category:
         return db.query(self.model).filter(self.model.name == name).first()
 
+    def get_by_job_ids(
+        self, db: Session, job_ids: List[int]
+    ) -> List[Tuple[int, Category]]:
+        return (
+            db.query(JobCategory.job_id, self.model)
+            .join(JobCategory, JobCategory.category_id == self.model.id)
+            .filter(JobCategory.job_id.in_(job_ids))
+            .all()
+        )
+
 
 category = CRUDCategory(Category)
@@ -14,6 +14,16 @@ class CRUDCompany(CRUDBase[Company, CompanyCreate, CompanyUpdate]):
             db.query(self.model).filter(self.model.business_id == business_id).first()
         )
 
+    def get_by_business_ids(
+        self, db: Session, business_ids: List[int]
+    ) -> List[Company]:
+        return (
+            db.query(self.model)
+            .filter(self.model.business_id.in_(business_ids))
+            .order_by(self.model.id)
+            .all()
+        )
+
     def get_company_by_tax_code(self, db: Session, tax_code: str) -> Company:
         return db.query(self.model).filter(self.model.tax_code == tax_code).first()
 
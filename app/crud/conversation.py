@@ -1,14 +1,26 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from sqlalchemy.sql import func
 
 from .base import CRUDBase
+from .conversation_member import CRUDConversationMember
 from app.model import Conversation, ConversationMember, Message
 from app.schema.conversation import ConversationCreate, ConversationUpdate
 from app.hepler.enum import ConversationType
 
 
 class CRUDConversation(CRUDBase[Conversation, ConversationCreate, ConversationUpdate]):
+    profiles = {
+        # conversation_helper.get_private_conversation_response
+        "conversation_member": [
+            selectinload(Conversation.conversation_member_secondary).options(
+                *CRUDConversationMember.profiles["conversation_member"]
+            ),
+        ],
+    }
+
     def get_private_conversation(
         self, db: Session, first_account_id: int, second_account_id: int
     ) -> Conversation:
@@ -65,6 +77,21 @@ class CRUDConversation(CRUDBase[Conversation, ConversationCreate, ConversationUp
             .first()
         )
 
+    async def async_get_by_account_id_and_conversation_id(
+        self, db: AsyncSession, account_id: int, conversation_id: int
+    ) -> Conversation:
+        result = await db.execute(
+            select(Conversation)
+            .join(
+                ConversationMember,
+                ConversationMember.conversation_id == Conversation.id,
+            )
+            .filter(ConversationMember.account_id == account_id)
+            .filter(ConversationMember.conversation_id == conversation_id)
+            .limit(1)
+        )
+        return result.scalars().first()
+
     def get_by_lastest_message(
         self, db: Session, *, account_id: int, limit: int = 10, skip: int = 0, **kwargs
     ) -> Conversation:
@@ -1,10 +1,10 @@
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm import Session, aliased, joinedload
 from sqlalchemy.sql import func
 from sqlalchemy import case
 from typing import List
 
 from .base import CRUDBase
-from app.model import ConversationMember, Account, Message
+from app.model import ConversationMember, Account, Manager, Message
 from app.schema.conversation_member import (
     ConversationMemberCreate,
     ConversationMemberUpdate,
@@ -15,6 +15,16 @@ from app.hepler.enum import MemberType
 class CRUDConversationMember(
     CRUDBase[ConversationMember, ConversationMemberCreate, ConversationMemberUpdate]
 ):
+    profiles = {
+        # conversation_helper.get_member_response
+        "conversation_member": [
+            joinedload(ConversationMember.account)
+            .joinedload(Account.manager)
+            .joinedload(Manager.business),
+            joinedload(ConversationMember.account).joinedload(Account.user),
+        ],
+    }
+
     def get_by_account_ids(self, db: Session, account_ids: list[int]) -> int:
         num_users = len(account_ids)
         # SELECT cm.conversation_id
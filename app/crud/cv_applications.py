@@ -1,10 +1,10 @@
 from typing import Type, List
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.sql import func
 from sqlalchemy import or_
 
 from app.crud.base import CRUDBase
-from app.model import Job, CVApplication, Campaign
+from app.model import Job, CVApplication, Campaign, User
 from app.schema.cv_application import CVApplicationCreate, CVApplicationUpdate
 from app.hepler.enum import (
     CVApplicationStatus,
@@ -16,6 +16,19 @@ from app.hepler.enum import (
 class CRUDCVApplication(
     CRUDBase[CVApplication, CVApplicationCreate, CVApplicationUpdate]
 ):
+    profiles = {
+        # cv_applications_helper.get_info
+        "cv_application_user": [
+            joinedload(CVApplication.user).joinedload(User.account),
+        ],
+        # cv_applications_helper.get_full_info
+        "cv_application_card": [
+            joinedload(CVApplication.user).joinedload(User.account),
+            joinedload(CVApplication.campaign).joinedload(Campaign.job),
+            joinedload(CVApplication.campaign).joinedload(Campaign.company),
+        ],
+    }
+
     def __init__(self, model: Type[CVApplication]):
         super().__init__(model)
 
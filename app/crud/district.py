@@ -1,4 +1,6 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from .base import CRUDBase
@@ -33,5 +35,28 @@ class CRUDDistrict(CRUDBase[District, DistrictCreate, DistrictUpdate]):
             .all()
         )
 
+    async def async_get_multi_by_province(
+        self,
+        db: AsyncSession,
+        *,
+        province_id: int,
+        skip: int = 0,
+        limit: int = 1000,
+        sort_by: str = "id",
+        order_by: str = "asc",
+    ) -> List[District]:
+        result = await db.execute(
+            select(self.model)
+            .filter(self.model.province_id == province_id)
+            .order_by(
+                getattr(self.model, sort_by).desc()
+                if order_by == "asc"
+                else getattr(self.model, sort_by)
+            )
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
 
 district = CRUDDistrict(District)
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from typing import List
 
 from app.model.job_experience import JobExperience
 
@@ -10,5 +11,8 @@ class CRUDExperience:
     def get(self, db: Session, id: int) -> JobExperience:
         return db.query(self.model).filter(self.model.id == id).first()
 
+    def get_all(self, db: Session) -> List[JobExperience]:
+        return db.query(self.model).all()
+
 
 experience = CRUDExperience(JobExperience)
@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Session
+from typing import List, Tuple
 
 from .base import CRUDBase
-from app.model import Field
+from app.model import Field, CompanyField
 from app.schema.field import FieldCreate, FieldUpdate
 
 
@@ -9,5 +10,15 @@ class CRUDField(CRUDBase[Field, FieldCreate, FieldUpdate]):
     def get_by_name(self, db: Session, name: str) -> Field:
         return db.query(self.model).filter(self.model.name == name).first()
 
+    def get_by_company_ids(
+        self, db: Session, company_ids: List[int]
+    ) -> List[Tuple[int, Field]]:
+        return (
+            db.query(CompanyField.company_id, self.model)
+            .join(CompanyField, CompanyField.field_id == self.model.id)
+            .filter(CompanyField.company_id.in_(company_ids))
+            .all()
+        )
+
 
 field = CRUDField(Field)
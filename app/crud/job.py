@@ -1,10 +1,11 @@
-from typing import Type, List
-from sqlalchemy.orm import Session
+from typing import Type, List, Optional
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.sql import func
 from sqlalchemy import distinct
 from sqlalchemy import case, func, or_, and_, text, exists
 
 from .base import CRUDBase
+from .job_search import job_search as job_searchCRUD
 from app.model import (
     Job,
     JobApprovalRequest,
@@ -20,6 +21,9 @@ from app.model import (
 )
 from app.schema.job import JobCreate, JobUpdate
 from app.hepler.enum import JobStatus, SalaryType, JobApprovalStatus
+from app.hepler.common import CommonHelper
+from app.core import constant
+from app.core.config import settings
 
 
 class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
@@ -51,21 +55,7 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
             query,
             **kwargs,
         )
-        skip = kwargs.get("skip", 0)
-        limit = kwargs.get("limit", 10)
-        sort_by = kwargs.get("sort_by", "id")
-        order_by = kwargs.get("order_by", "desc")
-        return (
-            query.order_by(
-                getattr(self.model, sort_by).desc()
-                if order_by == "desc"
-                else getattr(self.model, sort_by)
-            )
-            .offset(skip)
-            .limit(limit)
-            .distinct()
-            .all()
-        )
+        return self.apply_pagination(query, **kwargs).distinct().all()
 
     def get_by_campaign_id(self, db: Session, campaign_id: int) -> Job:
         return (
@@ -95,10 +85,6 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         db: Session,
         **kwargs,
     ) -> List[Job]:
-        skip = kwargs.get("skip", 0)
-        limit = kwargs.get("limit", 10)
-        sort_by = kwargs.get("sort_by", "id")
-        order_by = kwargs.get("order_by", "desc")
         province_id = kwargs.get("province_id")
         district_id = kwargs.get("district_id")
 
@@ -107,18 +93,8 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
             jobs_query = jobs_query.join(
                 self.work_location, self.model.id == self.work_location.job_id
             )
-        jobs = (
-            self.apply_filters(jobs_query, **kwargs)
-            .order_by(
-                getattr(self.model, sort_by).desc()
-                if order_by == "desc"
-                else getattr(self.model, sort_by)
-            )
-            .offset(skip)
-            .limit(limit)
-            .distinct()
-            .all()
-        )
+        jobs_query = self.apply_filters(jobs_query, **kwargs)
+        jobs = self.apply_pagination(jobs_query, **kwargs).distinct().all()
 
         return jobs
 
@@ -127,6 +103,9 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         db: Session,
         **kwargs,
     ) -> int:
+        if settings.JOB_SEARCH_TABLE_ENABLED:
+            return job_searchCRUD.count_jobs(db, **kwargs)
+
         query = db.query(func.count(self.model.id)).filter(
             Job.status == JobStatus.PUBLISHED, Job.deadline >= func.now()
         )
@@ -140,27 +119,148 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         db: Session,
         **kwargs,
     ) -> List[Job]:
-        skip = kwargs.get("skip", 0)
-        limit = kwargs.get("limit", 10)
-        sort_by = kwargs.get("sort_by", "id")
-        order_by = kwargs.get("order_by", "desc")
+        if settings.JOB_SEARCH_TABLE_ENABLED:
+            job_ids = job_searchCRUD.search_job_ids(db, **kwargs)
+            jobs = {job.id: job for job in self.get_multi_by_ids(db, job_ids)}
+            return [jobs[job_id] for job_id in job_ids if job_id in jobs]
 
         query = db.query(Job).filter(
             Job.status == JobStatus.PUBLISHED, Job.deadline >= func.now()
         )
 
-        query = (
-            self.user_apply_filters(query, **kwargs)
-            .order_by(
-                getattr(self.model, sort_by).desc()
-                if order_by == "desc"
-                else getattr(self.model, sort_by)
+        query = self.user_apply_filters(query, **kwargs)
+        jobs = self.apply_pagination(query, **kwargs).all()
+        return jobs
+
+    def user_search_ids(self, db: Session, **kwargs) -> List[int]:
+        if settings.JOB_SEARCH_TABLE_ENABLED:
+            return job_searchCRUD.get_job_ids(db, **kwargs)
+
+        query = db.query(self.model.id).filter(
+            Job.status == JobStatus.PUBLISHED, Job.deadline >= func.now()
+        )
+        query = self.user_apply_filters(query, **kwargs)
+        return [job_id for (job_id,) in query.distinct().all()]
+
+    def user_search_by_ranked_ids(
+        self,
+        db: Session,
+        ranked_ids: List[int],
+        **kwargs,
+    ) -> List[Job]:
+        start = self.get_ranked_start(**kwargs)
+        limit = kwargs.get("limit", 10)
+        if not ranked_ids:
+            return []
+
+        matched_ids = set(self.user_search_ids(db, **{**kwargs, "job_ids": ranked_ids}))
+
+        page_ids = [job_id for job_id in ranked_ids if job_id in matched_ids][
+            start : start + limit
+        ]
+        jobs = {job.id: job for job in self.get_multi_by_ids(db, page_ids)}
+        return [jobs[job_id] for job_id in page_ids if job_id in jobs]
+
+    def is_ranked_cursor(self, after: str) -> bool:
+        """Whether `after` continues a ranked keyword search, not a keyset one"""
+        return "r" in CommonHelper.decode_cursor(after)
+
+    def get_ranked_start(self, **kwargs) -> int:
+        """Position of the page in the ranked ids, from `after` or `skip`"""
+        after = kwargs.get("after")
+        if after:
+            return CommonHelper.decode_cursor(after)["r"]
+        return kwargs.get("skip", 0)
+
+    def get_next_ranked_cursor(self, items: List, **kwargs) -> Optional[str]:
+        """Cursor of the page after `items` in a ranked keyword search"""
+        limit = kwargs.get("limit", 10)
+        if not items or len(items) < limit:
+            return None
+        return CommonHelper.encode_cursor(
+            {
+                "s": kwargs.get("sort_by"),
+                "o": kwargs.get("order_by"),
+                "v": None,
+                "i": items[-1].id,
+                "r": self.get_ranked_start(**kwargs) + limit,
+            }
+        )
+
+    def get_published(
+        self, db: Session, *, after_id: int = 0, limit: int = 1000
+    ) -> List[Job]:
+        """One page of published jobs after `after_id`, skills loaded"""
+        return (
+            db.query(self.model)
+            .options(
+                selectinload(self.model.must_have_skills),
+                selectinload(self.model.should_have_skills),
+            )
+            .filter(
+                self.model.id > after_id,
+                self.model.status == JobStatus.PUBLISHED,
+                self.model.deadline >= func.now(),
             )
-            .offset(skip)
+            .order_by(self.model.id)
             .limit(limit)
+            .all()
         )
-        jobs = query.all()
-        return jobs
+
+    def apply_published(self, query, job_ids: List[int] = None):
+        query = query.filter(
+            self.model.status == JobStatus.PUBLISHED,
+            self.model.deadline >= func.now(),
+        )
+        if job_ids is not None:
+            query = query.filter(self.model.id.in_(job_ids))
+        return query
+
+    def get_facet_rows(self, db: Session, job_ids: List[int] = None) -> dict:
+        jobs = self.apply_published(
+            db.query(
+                self.model.id,
+                self.campaign.company_id,
+                self.model.employment_type,
+                self.model.job_experience_id,
+                self.model.job_position_id,
+                self.model.salary_type,
+                self.model.min_salary,
+                self.model.max_salary,
+                self.model.deadline,
+            ).outerjoin(self.campaign, self.model.campaign_id == self.campaign.id),
+            job_ids,
+        ).all()
+        locations = self.apply_published(
+            db.query(
+                self.work_location.job_id,
+                self.work_location.province_id,
+                self.work_location.district_id,
+            ).join(self.model, self.work_location.job_id == self.model.id),
+            job_ids,
+        ).all()
+        categories = self.apply_published(
+            db.query(
+                self.job_category.job_id,
+                self.job_category.category_id,
+            ).join(self.model, self.job_category.job_id == self.model.id),
+            job_ids,
+        ).all()
+        fields = self.apply_published(
+            db.query(self.model.id, self.company_field.field_id)
+            .join(self.campaign, self.model.campaign_id == self.campaign.id)
+            .join(
+                self.company_field,
+                self.campaign.company_id == self.company_field.company_id,
+            ),
+            job_ids,
+        ).all()
+        return {
+            "jobs": jobs,
+            "locations": locations,
+            "categories": categories,
+            "fields": fields,
+        }
 
     def user_apply_filters(self, query, **filters):
         company_id = filters.get("company_id")
@@ -175,6 +275,7 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         max_salary = filters.get("max_salary")
         salary_type = filters.get("salary_type")
         keyword = filters.get("keyword")
+        job_ids = filters.get("job_ids")
         updated_at = filters.get("updated_at")
 
         if updated_at:
@@ -220,7 +321,9 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
             query = query.filter(self.model.salary_type == salary_type)
         if min_salary or max_salary and not salary_type:
             query = query.filter(self.model.salary_type != SalaryType.DEAL)
-        if keyword:
+        if job_ids is not None:
+            query = query.filter(self.model.id.in_(job_ids))
+        elif keyword:
             query = query.filter(self.model.title.ilike(f"%{keyword}%"))
         return query
 
@@ -254,6 +357,7 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         salary_type = filters.get("salary_type")
         deadline = filters.get("deadline")
         keyword = filters.get("keyword")
+        job_ids = filters.get("job_ids")
         approved_time = filters.get("approved_time")
 
         if company_id or field_id:
@@ -316,7 +420,9 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
             query = query.filter(self.model.salary_type != SalaryType.DEAL)
         if deadline:
             query = query.filter(self.model.deadline >= deadline)
-        if keyword:
+        if job_ids is not None:
+            query = query.filter(self.model.id.in_(job_ids))
+        elif keyword:
             query = query.filter(self.model.title.ilike(f"%{keyword}%"))
         return query
 
@@ -337,7 +443,7 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         return query.all()
 
     def count_job_by_salary(self, db: Session, salary_ranges):
-        unit = 1000000
+        unit = constant.SALARY_UNIT
 
         query = (
             db.query(
@@ -396,7 +502,7 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         )
 
     def update_expired_job(self, db: Session):
-        return (
+        count = (
             db.query(self.model)
             .filter(
                 self.model.deadline < func.now(),
@@ -404,6 +510,8 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
             )
             .update({"status": JobStatus.EXPIRED}, synchronize_session=False)
         )
+        db.commit()
+        return count
 
     def update_status_job(self, db: Session, job: Job, status: JobStatus):
         job.status = status
@@ -25,6 +25,15 @@ class CRUDJobCategory(CRUDBase[JobCategory, JobCategoryCreate, JobCategoryUpdate
         ).delete()
         db.commit()
 
+    def remove_by_job_id_and_category_ids(
+        self, db: Session, job_id: int, category_ids: List[int]
+    ) -> None:
+        if not category_ids:
+            return
+        db.query(self.model).filter(self.model.job_id == job_id).filter(
+            self.model.category_id.in_(category_ids)
+        ).delete(synchronize_session=False)
+
     def get_by_job_id(self, db: Session, job_id: int) -> List[JobCategory]:
         return db.query(self.model).filter(self.model.job_id == job_id).all()
 
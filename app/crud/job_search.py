@@ -0,0 +1,215 @@
+from typing import List
+from sqlalchemy.orm import Session
+from sqlalchemy import distinct, exists, func, or_
+
+from .base import CRUDBase
+from app.model import (
+    JobSearch,
+    Job,
+    Campaign,
+    WorkLocation,
+    JobCategory,
+    CompanyField,
+)
+from app.schema.job_search import JobSearchCreate, JobSearchUpdate
+from app.hepler.enum import JobStatus, SalaryType
+
+
+class CRUDJobSearch(CRUDBase[JobSearch, JobSearchCreate, JobSearchUpdate]):
+    cursor_id = "job_id"
+
+    def get_source_rows(self, db: Session, job_ids: List[int]) -> dict:
+        """Published jobs among `job_ids` with their locations, categories, fields"""
+        jobs = (
+            db.query(
+                Job.id,
+                Campaign.company_id,
+                Job.title,
+                Job.employment_type,
+                Job.job_experience_id,
+                Job.job_position_id,
+                Job.salary_type,
+                Job.min_salary,
+                Job.max_salary,
+                Job.quantity,
+                Job.deadline,
+                Job.created_at,
+                Job.updated_at,
+            )
+            .outerjoin(Campaign, Job.campaign_id == Campaign.id)
+            .filter(
+                Job.id.in_(job_ids),
+                Job.status == JobStatus.PUBLISHED,
+                Job.deadline >= func.now(),
+            )
+            .all()
+        )
+        published_ids = [job.id for job in jobs]
+        company_ids = list({job.company_id for job in jobs if job.company_id})
+        if not published_ids:
+            return {"jobs": [], "locations": [], "categories": [], "fields": []}
+
+        locations = (
+            db.query(
+                WorkLocation.job_id,
+                WorkLocation.province_id,
+                WorkLocation.district_id,
+            )
+            .filter(WorkLocation.job_id.in_(published_ids))
+            .all()
+        )
+        categories = (
+            db.query(JobCategory.job_id, JobCategory.category_id)
+            .filter(JobCategory.job_id.in_(published_ids))
+            .all()
+        )
+        fields = (
+            db.query(CompanyField.company_id, CompanyField.field_id)
+            .filter(CompanyField.company_id.in_(company_ids))
+            .all()
+            if company_ids
+            else []
+        )
+        return {
+            "jobs": jobs,
+            "locations": locations,
+            "categories": categories,
+            "fields": fields,
+        }
+
+    def get_published_job_ids(
+        self, db: Session, *, after_id: int = 0, limit: int = 1000
+    ) -> List[int]:
+        return [
+            job_id
+            for (job_id,) in db.query(Job.id)
+            .filter(
+                Job.id > after_id,
+                Job.status == JobStatus.PUBLISHED,
+                Job.deadline >= func.now(),
+            )
+            .order_by(Job.id)
+            .limit(limit)
+            .all()
+        ]
+
+    def get_job_ids_by_company_id(self, db: Session, company_id: int) -> List[int]:
+        return [
+            job_id
+            for (job_id,) in db.query(distinct(self.model.job_id))
+            .filter(self.model.company_id == company_id)
+            .all()
+        ]
+
+    def replace(self, db: Session, job_ids: List[int], rows: List[dict]) -> None:
+        """Swap the rows of `job_ids` for `rows` in one transaction"""
+        if not job_ids:
+            return
+        db.query(self.model).filter(self.model.job_id.in_(job_ids)).delete(
+            synchronize_session=False
+        )
+        self.create_multi(db, objs_in=rows)
+        db.commit()
+
+    def remove_unpublished(self, db: Session) -> int:
+        """Delete the rows of expired jobs and of jobs no longer published"""
+        count = (
+            db.query(self.model)
+            .filter(
+                or_(
+                    self.model.deadline < func.now(),
+                    ~exists().where(
+                        Job.id == self.model.job_id,
+                        Job.status == JobStatus.PUBLISHED,
+                    ),
+                )
+            )
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return count
+
+    def search_job_ids(self, db: Session, **kwargs) -> List[int]:
+        sort_by = kwargs.get("sort_by") or "id"
+        if sort_by == "id":
+            sort_by = self.cursor_id
+        # DISTINCT needs the sort column in the select list
+        columns = [self.model.job_id]
+        if sort_by != self.cursor_id:
+            columns.append(getattr(self.model, sort_by))
+
+        query = self.get_search_query(db, *columns, **kwargs).distinct()
+        query = self.apply_pagination(query, **{**kwargs, "sort_by": sort_by})
+        return [row[0] for row in query.all()]
+
+    def get_job_ids(self, db: Session, **kwargs) -> List[int]:
+        query = self.get_search_query(db, self.model.job_id, **kwargs).distinct()
+        return [job_id for (job_id,) in query.all()]
+
+    def count_jobs(self, db: Session, **kwargs) -> int:
+        return self.get_search_query(
+            db, func.count(distinct(self.model.job_id)), **kwargs
+        ).scalar()
+
+    def get_search_query(self, db: Session, *columns, **kwargs):
+        """Rows with an open deadline matching the filters, selecting `columns`"""
+        query = db.query(*columns).filter(self.model.deadline >= func.now())
+        return self.apply_filters(query, **kwargs)
+
+    def apply_filters(self, query, **filters):
+        """Single-table counterpart of jobCRUD.user_apply_filters"""
+        company_id = filters.get("company_id")
+        field_id = filters.get("field_id")
+        province_id = filters.get("province_id")
+        district_id = filters.get("district_id")
+        category_id = filters.get("category_id")
+        employment_type = filters.get("employment_type")
+        job_experience_id = filters.get("job_experience_id")
+        job_position_id = filters.get("job_position_id")
+        min_salary = filters.get("min_salary")
+        max_salary = filters.get("max_salary")
+        salary_type = filters.get("salary_type")
+        keyword = filters.get("keyword")
+        job_ids = filters.get("job_ids")
+        updated_at = filters.get("updated_at")
+
+        if updated_at:
+            query = query.filter(self.model.updated_at >= updated_at)
+        if company_id:
+            query = query.filter(self.model.company_id == company_id)
+        if field_id:
+            query = query.filter(
+                func.json_contains(self.model.field_ids, func.json_array(field_id))
+            )
+        if province_id:
+            query = query.filter(self.model.province_id == province_id)
+        if district_id:
+            query = query.filter(self.model.district_id == district_id)
+        if category_id:
+            query = query.filter(
+                func.json_contains(
+                    self.model.category_ids, func.json_array(category_id)
+                )
+            )
+        if employment_type:
+            query = query.filter(self.model.employment_type == employment_type)
+        if job_experience_id:
+            query = query.filter(self.model.job_experience_id == job_experience_id)
+        if job_position_id:
+            query = query.filter(self.model.job_position_id == job_position_id)
+        if salary_type:
+            query = query.filter(self.model.salary_type == salary_type)
+        if min_salary:
+            query = query.filter(self.model.min_salary >= min_salary)
+        if max_salary:
+            query = query.filter(self.model.max_salary <= max_salary)
+        if min_salary or max_salary and not salary_type:
+            query = query.filter(self.model.salary_type != SalaryType.DEAL)
+        if job_ids is not None:
+            query = query.filter(self.model.job_id.in_(job_ids))
+        elif keyword:
+            query = query.filter(self.model.title.ilike(f"%{keyword}%"))
+        return query
+
+
+job_search = CRUDJobSearch(JobSearch)
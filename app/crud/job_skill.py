@@ -25,6 +25,9 @@ class CRUDJobSkill(CRUDBase[JobSkill, JobSkillCreate, JobSkillUpdate]):
         ).delete()
         db.commit()
 
+    def get_by_job_id(self, db: Session, job_id: int) -> List[JobSkill]:
+        return db.query(self.model).filter(self.model.job_id == job_id).all()
+
     def get_ids_by_job_id(self, db: Session, job_id: int) -> List[int]:
         return (
             skill_id
@@ -1,10 +1,11 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 from sqlalchemy.sql.expression import select
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import CRUDBase
-from app.model import Message, ConversationMember
+from app.model import Message, ConversationMember, Account, Manager, Business
 from app.schema.message import MessageCreate, MessageUpdate
 
 
@@ -27,6 +28,34 @@ class MessageCRUD(CRUDBase[Message, MessageCreate, MessageUpdate]):
             .all()
         )
 
+    async def async_get_by_conversation_id(
+        self,
+        db: AsyncSession,
+        *,
+        conversation_id: int,
+        limit: int = 20,
+        skip: int = 0,
+        **kwargs
+    ):
+        """Messages with their sender, parent and attachments loaded up front"""
+        account = selectinload(Message.account)
+        result = await db.execute(
+            select(Message)
+            .options(
+                account.selectinload(Account.user),
+                account.selectinload(Account.manager)
+                .selectinload(Manager.business)
+                .selectinload(Business.company),
+                selectinload(Message.parent),
+                selectinload(Message.attachments),
+            )
+            .filter(Message.conversation_id == conversation_id)
+            .order_by(Message.created_at.desc())
+            .limit(limit)
+            .offset(skip)
+        )
+        return result.scalars().all()
+
     def get_count_message_unread_by_account_id_and_conversation_id(
         self, db: Session, account_id: int, conversation_id: int
     ) -> int:
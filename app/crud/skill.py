@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Session
+from typing import List, Tuple
 
 from .base import CRUDBase
-from app.model import Skill
+from app.model import Skill, JobSkill
 from app.schema.skill import SkillCreate, SkillUpdate
 
 
@@ -9,5 +10,15 @@ class CRUDSkill(CRUDBase[Skill, SkillCreate, SkillUpdate]):
     def get_by_name(self, db: Session, name: str) -> Skill:
         return db.query(self.model).filter(self.model.name == name).first()
 
+    def get_by_job_ids(
+        self, db: Session, job_ids: List[int]
+    ) -> List[Tuple[int, Skill]]:
+        return (
+            db.query(JobSkill.job_id, self.model)
+            .join(JobSkill, JobSkill.skill_id == self.model.id)
+            .filter(JobSkill.job_id.in_(job_ids))
+            .all()
+        )
+
 
 skill = CRUDSkill(Skill)
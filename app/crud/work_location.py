@@ -11,9 +11,13 @@ class CRUDWorkLocation(CRUDBase[WorkLocation, WorkLocatioCreate, WorkLocatioUpda
         work_locations = db.query(self.model).filter(self.model.job_id == job_id).all()
         return work_locations
 
-    def remove_by_job_id(self, db: Session, job_id: int) -> None:
+    def get_by_job_ids(self, db: Session, job_ids: List[int]) -> List[WorkLocation]:
+        return db.query(self.model).filter(self.model.job_id.in_(job_ids)).all()
+
+    def remove_by_job_id(self, db: Session, job_id: int, commit: bool = True) -> None:
         db.query(self.model).filter(self.model.job_id == job_id).delete()
-        db.commit()
+        if commit:
+            db.commit()
 
 
 work_location = CRUDWorkLocation(WorkLocation)
@@ -1,11 +1,21 @@
 import sys
 from sqlalchemy import create_engine, Engine
-from sqlalchemy.orm import sessionmaker
-from typing import Generator
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
+from typing import Any, Callable, Generator, AsyncGenerator, Union
+from fastapi import Request
 
 
 from app.core.config import settings
 from app.core.loggers import logger
+from app.db.replica import ReplicaRouter
+from app.db.slow_query import register_slow_query_log
+from app.storage.redis import get_counter_redis
 
 
 def create_engine_and_session(url: str) -> Engine:
@@ -32,9 +42,38 @@ def create_engine_and_session(url: str) -> Engine:
         return engine, db_session
 
 
+def create_async_engine_and_session(url: str) -> AsyncEngine:
+    try:
+        engine = create_async_engine(
+            url,
+            pool_pre_ping=True,
+            pool_size=20,
+            max_overflow=100,
+            connect_args={"connect_timeout": 10},
+        )
+    except Exception as e:
+        logger.error(f"Failed to connect to Database: {e}")
+        sys.exit(1)
+
+    else:
+        db_session = async_sessionmaker(
+            engine,
+            expire_on_commit=False,
+        )
+        return engine, db_session
+
+
 MYSQL_URL = f"mysql+pymysql://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_HOST}:{settings.MYSQL_PORT}/{settings.MYSQL_DATABASE}"
+MYSQL_ASYNC_URL = f"mysql+aiomysql://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_HOST}:{settings.MYSQL_PORT}/{settings.MYSQL_DATABASE}"
 
+register_slow_query_log()
 engine, SessionLocal = create_engine_and_session(MYSQL_URL)
+async_engine, AsyncSessionLocal = create_async_engine_and_session(MYSQL_ASYNC_URL)
+replica_router = ReplicaRouter(
+    settings.DATABASE_REPLICA_URLS,
+    settings.DATABASE_REPLICA_HEALTH_INTERVAL,
+    settings.DATABASE_STICKY_SECONDS,
+)
 
 
 def get_db() -> Generator:
@@ -46,3 +85,63 @@ def get_db() -> Generator:
         raise e
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator:
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            await db.rollback()
+            raise e
+
+
+async def get_replica_session(request: Request, is_async: bool = False):
+    """Session factory of a healthy replica, None when the primary must be used"""
+    if not replica_router.replicas:
+        return None
+    try:
+        redis = await get_counter_redis()
+        if await replica_router.is_sticky(redis, replica_router.get_identity(request)):
+            return None
+    except Exception as e:
+        logger.error(f"Failed to check replica stickiness: {e}")
+    replica = replica_router.get_replica(is_async)
+    if not replica:
+        return None
+    return replica.async_session if is_async else replica.session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator:
+    db = (await get_replica_session(request) or SessionLocal)()
+    try:
+        yield db
+    except Exception as e:
+        db.rollback()
+        raise e
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator:
+    session = await get_replica_session(request, is_async=True)
+    async with (session or AsyncSessionLocal)() as db:
+        try:
+            yield db
+        except Exception as e:
+            await db.rollback()
+            raise e
+
+
+async def run_sync(
+    db: Union[Session, AsyncSession], fn: Callable, *args, **kwargs
+) -> Any:
+    """Call fn(session, *args, **kwargs) with a sync session
+
+    Lets helpers written against Session serve an AsyncSession too: with an
+    AsyncSession fn runs through AsyncSession.run_sync, so lazy loads inside
+    it work, otherwise it is called directly.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return fn(db, *args, **kwargs)
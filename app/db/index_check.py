@@ -0,0 +1,177 @@
+"""Check that job search queries can use their composite indexes.
+
+Every case builds the query CRUDJob.user_apply_filters produces for one filter
+combination, or for job_search cases the one CRUDJobSearch.get_search_query
+produces, runs EXPLAIN on it and looks for the expected index on the expected
+table. The job_search multi-valued indexes need MySQL 8.0.17+ and a filled
+job_search table. By default the index only has to be a candidate (`possible_keys`). With
+--strict the optimizer has to pick it, which needs realistic table statistics:
+on an empty or small database seed it first.
+
+    python -m app.db.index_check
+    python -m app.db.seed_jobs && python -m app.db.index_check --strict
+"""
+
+import argparse
+import sys
+from typing import List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.crud import job as jobCRUD, job_search as job_searchCRUD
+from app.db.base import SessionLocal
+from app.hepler.enum import JobType, SalaryType
+from app.model import Job, JobSearch
+
+# name, filter arguments, sort_by, table, expected index, query job_search
+CASES: List[Tuple[str, dict, str, str, str, bool]] = [
+    ("published", {}, None, "job", "idx_job_status_deadline", False),
+    (
+        "published by updated_at",
+        {},
+        "updated_at",
+        "job",
+        "idx_job_status_updated_at_deadline",
+        False,
+    ),
+    (
+        "employment_type",
+        {"employment_type": JobType.FULL_TIME},
+        None,
+        "job",
+        "idx_job_status_employment_type_deadline",
+        False,
+    ),
+    (
+        "job_position_id",
+        {"job_position_id": 1},
+        None,
+        "job",
+        "idx_job_status_job_position_id_deadline",
+        False,
+    ),
+    (
+        "job_experience_id",
+        {"job_experience_id": 1},
+        None,
+        "job",
+        "idx_job_status_job_experience_id_deadline",
+        False,
+    ),
+    (
+        "salary",
+        {"salary_type": SalaryType.VND, "min_salary": 10000000},
+        None,
+        "job",
+        "idx_job_status_salary_type_min_salary_max_salary",
+        False,
+    ),
+    (
+        "province_id",
+        {"province_id": 1},
+        None,
+        "work_location",
+        "idx_work_location_province_id_district_id_job_id",
+        False,
+    ),
+    (
+        "province_id and district_id",
+        {"province_id": 1, "district_id": 1},
+        None,
+        "work_location",
+        "idx_work_location_province_id_district_id_job_id",
+        False,
+    ),
+    (
+        "category_id",
+        {"category_id": 1},
+        None,
+        "job_category",
+        "idx_job_category_category_id_job_id",
+        False,
+    ),
+    (
+        "job_search category_id",
+        {"category_id": 1},
+        None,
+        "job_search",
+        "idx_job_search_category_ids",
+        True,
+    ),
+    (
+        "job_search field_id",
+        {"field_id": 1},
+        None,
+        "job_search",
+        "idx_job_search_field_ids",
+        True,
+    ),
+    (
+        "job_search province_id and district_id",
+        {"province_id": 1, "district_id": 1},
+        None,
+        "job_search",
+        "idx_job_search_province_id_district_id_deadline",
+        True,
+    ),
+]
+
+
+def get_statement(
+    db: Session, filters: dict, sort_by: str = None, job_search: bool = False
+) -> str:
+    if job_search:
+        query = job_searchCRUD.get_search_query(
+            db, JobSearch.job_id, **filters
+        ).distinct()
+        crud = job_searchCRUD
+    else:
+        query = jobCRUD.user_apply_filters(
+            jobCRUD.apply_published(db.query(Job.id)), **filters
+        )
+        crud = jobCRUD
+    if sort_by:
+        query = crud.apply_pagination(query, sort_by=sort_by)
+    return str(
+        query.statement.compile(
+            dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def explain(db: Session, statement: str) -> List[dict]:
+    result = db.connection().exec_driver_sql(f"EXPLAIN {statement}")
+    return [dict(row._mapping) for row in result]
+
+
+def check(db: Session, strict: bool) -> bool:
+    passed = True
+    for name, filters, sort_by, table, index, job_search in CASES:
+        plan = explain(db, get_statement(db, filters, sort_by, job_search))
+        row = next((row for row in plan if row["table"] == table), None)
+        possible_keys = ((row or {}).get("possible_keys") or "").split(",")
+        key = (row or {}).get("key")
+        ok = key == index if strict else index in possible_keys
+        passed = passed and ok
+        print(
+            f"{'ok' if ok else 'FAIL':4} {name}: {table} uses {key}, "
+            f"expected {index} (rows {(row or {}).get('rows')})"
+        )
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.db.index_check")
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Require the optimizer to choose the index, not only consider it.",
+    )
+    args = parser.parse_args()
+    with SessionLocal() as db:
+        passed = check(db, args.strict)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import os
+import re
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+# collapse expanded IN lists so "IN (%s, %s)" and "IN (%s)" share a shape
+PLACEHOLDER = r"(?:%s|\?|%\(\w+\)s|:\w+)"
+IN_LIST = re.compile(
+    rf"\bIN\s*\(\s*{PLACEHOLDER}(?:\s*,\s*{PLACEHOLDER})*\s*\)", re.IGNORECASE
+)
+WHITESPACE = re.compile(r"\s+")
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def get_shape(statement: str) -> str:
+    return IN_LIST.sub("IN (...)", WHITESPACE.sub(" ", statement).strip())
+
+
+def get_stack_sample(limit: int = 8) -> List[str]:
+    """Innermost application frames that issued the statement"""
+    frames = [
+        frame
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(ROOT_DIR)
+        and "site-packages" not in frame.filename
+        and frame.filename != __file__
+    ]
+    return [
+        f"{os.path.relpath(frame.filename, ROOT_DIR)}:{frame.lineno} {frame.name}"
+        for frame in frames[-limit:]
+    ]
+
+
+class QueryStats:
+    """Statements issued while serving one request, with repeated shapes sampled"""
+
+    def __init__(self, repeat_threshold: int = None):
+        self.repeat_threshold = (
+            repeat_threshold or settings.QUERY_STATS_REPEAT_THRESHOLD
+        )
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter[str] = Counter()
+        self.stacks: Dict[str, List[str]] = {}
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+        shape = get_shape(statement)
+        self.shapes[shape] += 1
+        if self.shapes[shape] == self.repeat_threshold:
+            self.stacks[shape] = get_stack_sample()
+
+    def get_repeated(self) -> List[dict]:
+        return [
+            {
+                "statement": shape,
+                "count": self.shapes[shape],
+                "stack": stack,
+            }
+            for shape, stack in self.stacks.items()
+        ]
+
+    def get_stats(self) -> dict:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.seconds * 1000, 3),
+            "repeated": self.get_repeated(),
+        }
+
+    def get_server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.3f};desc="{self.count} queries"'
+
+
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(repeat_threshold: int = None):
+    """Count the statements executed inside the block on every engine"""
+    stats = QueryStats(repeat_threshold)
+    token = query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int, allow_repeated: bool = False):
+    """Fail with AssertionError when the block issues more than `max_queries`
+
+    Meant to back a pytest fixture, e.g.
+
+        @pytest.fixture
+        def budget():
+            return query_budget
+
+        def test_list_campaign(client, budget):
+            with budget(10):
+                client.get("/api/v1/campaign")
+    """
+    with track_queries() as stats:
+        yield stats
+    problems = []
+    if stats.count > max_queries:
+        problems.append(f"{stats.count} queries issued, budget is {max_queries}")
+    if not allow_repeated:
+        problems.extend(
+            f"{item['count']}x {item['statement']}\n    " + "\n    ".join(item["stack"])
+            for item in stats.get_repeated()
+        )
+    assert not problems, "\n".join(problems)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if query_stats.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats.get()
+    started = conn.info.get("query_started")
+    if stats is not None and started:
+        stats.record(statement, time.perf_counter() - started.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def handle_error(context):
+    started = (
+        context.connection.info.get("query_started") if context.connection else None
+    )
+    if started:
+        started.pop()
@@ -0,0 +1,120 @@
+import asyncio
+import time
+import hashlib
+from typing import List, Optional
+from redis.asyncio import Redis
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.core.loggers import logger
+
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+class Replica:
+    """One read replica with its sync and async session factories"""
+
+    def __init__(self, url: str):
+        url = make_url(url)
+        connect_args = (
+            {"connect_timeout": 10} if url.get_backend_name() == "mysql" else {}
+        )
+        self.name = url.render_as_string(hide_password=True)
+        self.engine = create_engine(url, pool_pre_ping=True, connect_args=connect_args)
+        self.session = sessionmaker(self.engine, expire_on_commit=False)
+        self.async_session = None
+        async_driver = ASYNC_DRIVERS.get(url.get_backend_name())
+        if async_driver:
+            try:
+                self.async_session = async_sessionmaker(
+                    create_async_engine(
+                        url.set(drivername=async_driver),
+                        pool_pre_ping=True,
+                        connect_args=connect_args,
+                    ),
+                    expire_on_commit=False,
+                )
+            except Exception as e:
+                logger.error(f"Async driver unavailable for replica {self.name}: {e}")
+        self.healthy = True
+        self.checked_at = 0.0
+
+    def check(self) -> bool:
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            self.healthy = True
+        except Exception as e:
+            logger.error(f"Replica {self.name} is unhealthy: {e}")
+            self.healthy = False
+        self.checked_at = time.monotonic()
+        return self.healthy
+
+
+class ReplicaRouter:
+    """Round-robin over healthy replicas; callers fall back to the primary on None
+
+    Health checks run from a background task (`start`) in the threadpool, so
+    routing a request only reads the last result.
+    """
+
+    def __init__(self, urls: List[str], health_interval: int, sticky_seconds: int):
+        self.replicas = [Replica(url) for url in urls if url]
+        self.health_interval = health_interval
+        self.sticky_seconds = sticky_seconds
+        self.sticky_key = "db_sticky_"
+        self.index = 0
+        self.task: asyncio.Task = None
+
+    def get_replica(self, is_async: bool = False) -> Optional[Replica]:
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self.index % len(self.replicas)]
+            self.index += 1
+            if is_async and replica.async_session is None:
+                continue
+            if replica.healthy:
+                return replica
+        return None
+
+    async def check_all(self):
+        for replica in self.replicas:
+            await run_in_threadpool(replica.check)
+
+    def start(self):
+        if self.task is None and self.replicas:
+            self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def run(self):
+        while True:
+            await self.check_all()
+            await asyncio.sleep(self.health_interval)
+
+    def get_identity(self, request: Request) -> str:
+        """Token of the caller, or its address for anonymous requests"""
+        identity = request.headers.get("Authorization") or (
+            request.client.host if request.client else ""
+        )
+        return hashlib.sha1(identity.encode()).hexdigest()
+
+    async def mark_write(self, redis: Redis, identity: str):
+        """Pin the client to the primary for a short window after a write"""
+        await redis.set(self.sticky_key + identity, 1, self.sticky_seconds)
+
+    async def is_sticky(self, redis: Redis, identity: str) -> bool:
+        return bool(await redis.exists(self.sticky_key + identity))
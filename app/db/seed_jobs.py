@@ -0,0 +1,346 @@
+"""Fill a development database with synthetic jobs for query plan checks.
+
+Creates businesses with their company, then jobs with one campaign each, one or
+two work locations and one to three categories. Statuses, deadlines, salaries
+and facets are skewed the way production data is (few published jobs with an
+open deadline, most jobs in the largest provinces), and ANALYZE TABLE runs at
+the end so the optimizer statistics match the new rows. That is what makes
+`python -m app.db.index_check --strict` meaningful.
+
+Provinces, districts, categories, job experiences and job positions already in
+the database are reused and only created when missing. Seeded managers and
+companies use the @seed.invalid email domain. The job_search table is not
+filled, rebuild it with POST /api/v1/admin/search_index/job_search/rebuild.
+
+    python -m app.db.seed_jobs
+    python -m app.db.seed_jobs --jobs 200000 --businesses 2000 --seed 7
+"""
+
+import argparse
+import json
+import random
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.hepler.enum import (
+    CampaignStatus,
+    CompanyType,
+    Gender,
+    JobStatus,
+    JobType,
+    Role,
+    SalaryType,
+    TypeAccount,
+)
+from app.model import (
+    Account,
+    Business,
+    Campaign,
+    Category,
+    Company,
+    CompanyBusiness,
+    District,
+    Job,
+    JobCategory,
+    JobExperience,
+    JobPosition,
+    Manager,
+    Province,
+    WorkLocation,
+)
+
+ANALYZE_TABLES = ["job", "work_location", "job_category", "campaign"]
+# share of jobs per status, deadlines are spread around today on top of it
+STATUSES = {
+    JobStatus.PUBLISHED: 35,
+    JobStatus.EXPIRED: 30,
+    JobStatus.PENDING: 15,
+    JobStatus.STOPPED: 10,
+    JobStatus.REJECTED: 10,
+}
+SALARY_TYPES = {SalaryType.VND: 70, SalaryType.DEAL: 20, SalaryType.USD: 10}
+WORDS = (
+    "nhân viên kinh doanh kế toán lập trình viên python java senior junior "
+    "marketing thiết kế đồ họa chăm sóc khách hàng kỹ sư phần mềm quản lý dự án"
+).split()
+
+
+def get_next_id(db: Session, model) -> int:
+    return (db.scalar(select(func.max(model.id))) or 0) + 1
+
+
+def ensure_rows(
+    db: Session, model, count: int, make_row: Callable[[int], dict]
+) -> List[int]:
+    """Ids of `model`, inserting rows until there are at least `count`"""
+    ids = list(db.scalars(select(model.id).order_by(model.id)))
+    if len(ids) < count:
+        start = get_next_id(db, model)
+        rows = [
+            {"id": id, **make_row(id)} for id in range(start, start + count - len(ids))
+        ]
+        db.execute(insert(model), rows)
+        db.commit()
+        ids.extend(row["id"] for row in rows)
+    return ids
+
+
+def ensure_lookups(db: Session) -> dict:
+    province_ids = ensure_rows(
+        db,
+        Province,
+        10,
+        lambda id: {
+            "name": f"Seed province {id}",
+            "code": f"sp{id}",
+            "name_with_type": f"Tỉnh Seed province {id}",
+            "slug": f"seed-province-{id}",
+            "type": "tinh",
+        },
+    )
+    ensure_rows(
+        db,
+        District,
+        5 * len(province_ids),
+        lambda id: {
+            "name": f"Seed district {id}",
+            "code": f"sd{id}",
+            "name_with_type": f"Quận Seed district {id}",
+            "slug": f"seed-district-{id}",
+            "type": "quan",
+            "province_id": province_ids[id % len(province_ids)],
+        },
+    )
+    districts: Dict[int, List[int]] = {}
+    for district_id, province_id in db.execute(
+        select(District.id, District.province_id)
+    ):
+        districts.setdefault(province_id, []).append(district_id)
+
+    return {
+        "province_ids": province_ids,
+        "districts": districts,
+        "category_ids": ensure_rows(
+            db,
+            Category,
+            20,
+            lambda id: {"name": f"Seed category {id}", "slug": f"seed-category-{id}"},
+        ),
+        "job_experience_ids": ensure_rows(
+            db,
+            JobExperience,
+            6,
+            lambda id: {
+                "title": f"Seed experience {id}",
+                "from_year": id,
+                "to_year": id + 1,
+            },
+        ),
+        "job_position_ids": ensure_rows(
+            db,
+            JobPosition,
+            20,
+            lambda id: {"name": f"Seed position {id}", "slug": f"seed-position-{id}"},
+        ),
+    }
+
+
+def skewed(rng: random.Random, values: list) -> int:
+    """Pick a value, the first ones far more often, like jobs per province"""
+    return values[(int(rng.paretovariate(1.2)) - 1) % len(values)]
+
+
+def seed_businesses(
+    db: Session, rng: random.Random, count: int, lookups: dict
+) -> List[dict]:
+    """Create `count` businesses with their manager account and company"""
+    account_id = get_next_id(db, Account)
+    company_id = get_next_id(db, Company)
+    businesses = []
+    accounts, managers, rows, companies, links = [], [], [], [], []
+    for index in range(count):
+        id = account_id + index
+        province_id = skewed(rng, lookups["province_ids"])
+        accounts.append(
+            {
+                "id": id,
+                "full_name": f"Seed business {index}",
+                "role": Role.BUSINESS,
+                "type_account": TypeAccount.BUSINESS,
+            }
+        )
+        managers.append(
+            {
+                "id": id,
+                "email": f"business-{id}@seed.invalid",
+                "hashed_password": "-",
+                "phone_number": "0900000000",
+            }
+        )
+        rows.append(
+            {
+                "id": id,
+                "province_id": province_id,
+                "gender": Gender.OTHER,
+                "company_name": f"Seed company {index}",
+                "work_position": "HR",
+                "is_verified_email": True,
+            }
+        )
+        companies.append(
+            {
+                "id": company_id + index,
+                "name": f"Seed company {company_id + index}",
+                "email": f"company-{company_id + index}@seed.invalid",
+                "type": CompanyType.COMPANY,
+                "address": "-",
+                "phone_number": "0900000000",
+                "scale": "100-499",
+                "tax_code": f"SEED{company_id + index}",
+                "business_id": id,
+            }
+        )
+        links.append({"business_id": id, "company_id": company_id + index})
+        businesses.append({"business_id": id, "company_id": company_id + index})
+
+    for model, values in (
+        (Account, accounts),
+        (Manager, managers),
+        (Business, rows),
+        (Company, companies),
+        (CompanyBusiness, links),
+    ):
+        db.execute(insert(model), values)
+    db.commit()
+    return businesses
+
+
+def get_job(
+    rng: random.Random, id: int, campaign_id: int, business: dict, lookups: dict
+) -> dict:
+    created_at = datetime.now() - timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+    salary_type = rng.choices(list(SALARY_TYPES), list(SALARY_TYPES.values()))[0]
+    if salary_type == SalaryType.DEAL:
+        min_salary = max_salary = 0
+    elif salary_type == SalaryType.USD:
+        min_salary = rng.randint(5, 40) * 100
+        max_salary = min_salary + rng.randint(2, 20) * 100
+    else:
+        min_salary = rng.randint(5, 40) * 1000000
+        max_salary = min_salary + rng.randint(2, 20) * 1000000
+    title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 6)))
+    return {
+        "id": id,
+        "business_id": business["business_id"],
+        "campaign_id": campaign_id,
+        "job_experience_id": rng.choice(lookups["job_experience_ids"]),
+        "job_position_id": skewed(rng, lookups["job_position_ids"]),
+        "title": title,
+        "job_description": json.dumps(f"<p>{title}</p>", ensure_ascii=False),
+        "job_requirement": json.dumps("<p>-</p>"),
+        "job_benefit": json.dumps("<p>-</p>"),
+        "job_location": "-",
+        "min_salary": min_salary,
+        "max_salary": max_salary,
+        "salary_type": salary_type,
+        "quantity": rng.randint(1, 10),
+        "full_name_contact": "Seed",
+        "phone_number_contact": "0900000000",
+        "email_contact": ["hr@seed.invalid"],
+        "status": rng.choices(list(STATUSES), list(STATUSES.values()))[0],
+        "employment_type": rng.choices(list(JobType), [80, 15, 5])[0],
+        "gender_requirement": Gender.OTHER,
+        "deadline": date.today() + timedelta(days=rng.randint(-180, 60)),
+        "created_at": created_at,
+        "updated_at": created_at + timedelta(minutes=rng.randint(0, 30 * 24 * 60)),
+    }
+
+
+def seed_jobs(
+    db: Session,
+    rng: random.Random,
+    count: int,
+    businesses: List[dict],
+    lookups: dict,
+    batch_size: int,
+):
+    job_id = get_next_id(db, Job)
+    campaign_id = get_next_id(db, Campaign)
+    for start in range(0, count, batch_size):
+        campaigns, jobs, locations, categories = [], [], [], []
+        for index in range(start, min(start + batch_size, count)):
+            business = rng.choice(businesses)
+            job = get_job(rng, job_id + index, campaign_id + index, business, lookups)
+            campaigns.append(
+                {
+                    "id": campaign_id + index,
+                    "title": job["title"],
+                    "status": (
+                        CampaignStatus.OPEN
+                        if job["status"] == JobStatus.PUBLISHED
+                        else CampaignStatus.STOPPED
+                    ),
+                    "business_id": business["business_id"],
+                    "company_id": business["company_id"],
+                    "created_at": job["created_at"],
+                }
+            )
+            jobs.append(job)
+            for province_id in {
+                skewed(rng, lookups["province_ids"]) for _ in range(rng.randint(1, 2))
+            }:
+                district_ids = lookups["districts"].get(province_id) or [None]
+                locations.append(
+                    {
+                        "job_id": job["id"],
+                        "province_id": province_id,
+                        "district_id": rng.choice(district_ids),
+                    }
+                )
+            categories.extend(
+                {"job_id": job["id"], "category_id": category_id}
+                for category_id in {
+                    skewed(rng, lookups["category_ids"])
+                    for _ in range(rng.randint(1, 3))
+                }
+            )
+
+        db.execute(insert(Campaign), campaigns)
+        db.execute(insert(Job), jobs)
+        db.execute(insert(WorkLocation), locations)
+        db.execute(insert(JobCategory), categories)
+        db.commit()
+        print(f"{start + len(jobs)}/{count} jobs")
+
+
+def analyze(db: Session):
+    if db.get_bind().dialect.name != "mysql":
+        return
+    for table in ANALYZE_TABLES:
+        db.execute(text(f"ANALYZE TABLE {table}"))
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.db.seed_jobs")
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--businesses", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with SessionLocal() as db:
+        lookups = ensure_lookups(db)
+        businesses = seed_businesses(db, rng, args.businesses, lookups)
+        seed_jobs(db, rng, args.jobs, businesses, lookups, args.batch_size)
+        analyze(db)
+    print(f"seeded {args.jobs} jobs for {args.businesses} businesses")
+
+
+if __name__ == "__main__":
+    main()
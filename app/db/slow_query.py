@@ -0,0 +1,225 @@
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.loggers import get_logger
+from app.db.query_stats import get_shape
+
+logger = get_logger(__name__)
+
+STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'")
+NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+# sync driver per backend, EXPLAIN of statements on an async engine runs on it
+SYNC_DRIVERS = {"mysql": "pymysql", "sqlite": "pysqlite"}
+CRUD_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "crud"
+)
+
+
+def get_fingerprint(statement: str) -> str:
+    """Statement shape with literals replaced, equal for every parameter set"""
+    statement = get_shape(statement)
+    statement = STRING_LITERAL.sub("?", statement)
+    return NUMBER_LITERAL.sub("?", statement)
+
+
+def get_origin() -> Optional[str]:
+    """Innermost CRUD method on the stack, e.g. `CRUDJob.user_search`"""
+    frame = sys._getframe(1)
+    while frame:
+        if frame.f_code.co_filename.startswith(CRUD_DIR):
+            name = getattr(frame.f_code, "co_qualname", None)
+            if not name:
+                owner = frame.f_locals.get("self")
+                name = frame.f_code.co_name
+                if owner is not None:
+                    name = f"{type(owner).__name__}.{name}"
+            return f"{name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
+
+
+class SlowQueryLog:
+    """Statements slower than SLOW_QUERY_THRESHOLD_MS, aggregated by fingerprint
+
+    A sample of slow SELECT fingerprints is explained once in a background
+    thread, on its own connection, so the request that was slow never waits on
+    it. Statements of an async engine are explained through a sync engine on
+    the same database. Aggregates live in the worker that saw the statement.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: int,
+        explain_sample_rate: float,
+        max_fingerprints: int,
+    ):
+        self.threshold = threshold_ms / 1000
+        self.explain_sample_rate = explain_sample_rate
+        self.max_fingerprints = max_fingerprints
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dropped = 0
+        self.lock = threading.Lock()
+        self.explain_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="slow-query-explain"
+        )
+        self.explain_pending = set()
+        self.explain_engines: Dict[str, Engine] = {}
+
+    def record(
+        self, conn, statement: str, parameters: Any, seconds: float, executemany: bool
+    ):
+        if seconds < self.threshold or statement.startswith("EXPLAIN "):
+            return
+
+        fingerprint = get_fingerprint(statement)
+        key = hashlib.md5(fingerprint.encode()).hexdigest()[:16]
+        origin = get_origin()
+        parameters_repr = repr(parameters)[:500]
+        duration_ms = round(seconds * 1000, 3)
+        logger.warning(
+            "Slow query: "
+            + json.dumps(
+                {
+                    "fingerprint": key,
+                    "duration_ms": duration_ms,
+                    "origin": origin,
+                    "statement": fingerprint,
+                    "parameters": parameters_repr,
+                }
+            )
+        )
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                if len(self.entries) >= self.max_fingerprints:
+                    self.dropped += 1
+                    return
+                entry = self.entries[key] = {
+                    "fingerprint": key,
+                    "statement": fingerprint,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "origins": Counter(),
+                    "last_parameters": None,
+                    "explain": None,
+                }
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+            entry["origins"][origin] += 1
+            entry["last_parameters"] = parameters_repr
+            explain = (
+                entry["explain"] is None
+                and key not in self.explain_pending
+                and not executemany
+                and statement.lstrip()[:6].upper() == "SELECT"
+                and random.random() < self.explain_sample_rate
+            )
+            if explain:
+                self.explain_pending.add(key)
+
+        if explain:
+            self.explain_executor.submit(
+                self.explain, conn.engine, key, statement, parameters
+            )
+
+    def get_explain_engine(self, engine: Engine) -> Engine:
+        """The engine itself, or a sync engine on the database of an async one"""
+        if not engine.dialect.is_async:
+            return engine
+        backend = engine.url.get_backend_name()
+        url = engine.url.set(drivername=f"{backend}+{SYNC_DRIVERS[backend]}")
+        key = url.render_as_string(hide_password=False)
+        if key not in self.explain_engines:
+            # explains are rare, no connection is kept open for them
+            self.explain_engines[key] = create_engine(url, poolclass=NullPool)
+        return self.explain_engines[key]
+
+    def explain(self, engine: Engine, key: str, statement: str, parameters: Any):
+        try:
+            with self.get_explain_engine(engine).connect() as conn:
+                result = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+                plan = [dict(row._mapping) for row in result]
+        except Exception as e:
+            plan = {"error": str(e)}
+        with self.lock:
+            self.explain_pending.discard(key)
+            if key in self.entries:
+                self.entries[key]["explain"] = plan
+
+    def get_report(self, limit: int = 50, order_by: str = "total_ms") -> dict:
+        with self.lock:
+            entries = [
+                {
+                    **entry,
+                    "total_ms": round(entry["total_ms"], 3),
+                    "avg_ms": round(entry["total_ms"] / entry["count"], 3),
+                    "origins": dict(entry["origins"].most_common()),
+                }
+                for entry in self.entries.values()
+            ]
+            dropped = self.dropped
+        entries.sort(key=lambda entry: entry[order_by], reverse=True)
+        return {
+            "threshold_ms": round(self.threshold * 1000, 3),
+            "fingerprints": len(entries),
+            "dropped": dropped,
+            "entries": entries[:limit],
+        }
+
+    def reset(self):
+        with self.lock:
+            self.entries.clear()
+            self.dropped = 0
+
+
+slow_query_log = SlowQueryLog(
+    settings.SLOW_QUERY_THRESHOLD_MS,
+    settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+    settings.SLOW_QUERY_MAX_FINGERPRINTS,
+)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("slow_query_started")
+    if started:
+        seconds = time.perf_counter() - started.pop()
+        slow_query_log.record(conn, statement, parameters, seconds, executemany)
+
+
+def handle_error(context):
+    connection = context.connection
+    started = connection.info.get("slow_query_started") if connection else None
+    if started:
+        started.pop()
+
+
+def register_slow_query_log():
+    """Time every statement of every engine when SLOW_QUERY_ENABLED is on"""
+    if not settings.SLOW_QUERY_ENABLED or event.contains(
+        Engine, "after_cursor_execute", after_cursor_execute
+    ):
+        return
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(Engine, "handle_error", handle_error)
@@ -1,4 +1,6 @@
 import json
+import base64
+import hashlib
 from typing import Any
 import datetime
 from sqlalchemy.orm import Session
@@ -43,6 +45,25 @@ class CommonHelper:
         except json.JSONDecodeError:
             return v
 
+    @staticmethod
+    def encode_cursor(v: dict) -> str:
+        """Encode keyset pagination values into an opaque url-safe token."""
+        raw = json.dumps(v, default=str, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(v: str) -> dict:
+        """Decode a token produced by `encode_cursor`."""
+        padded = v + "=" * (-len(v) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+    @staticmethod
+    def get_cache_key(v: dict) -> str:
+        """Hash the non-empty values of a dict into an order-independent cache key."""
+        canonical = {key: value for key, value in v.items() if value not in (None, "")}
+        raw = json.dumps(canonical, default=str, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(raw.encode()).hexdigest()
+
     @staticmethod
     def get_timestamp(v: datetime.datetime) -> float:
         """Extract timestamp from datetime object and round for 3 decimal digits."""
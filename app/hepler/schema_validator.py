@@ -224,6 +224,27 @@ class SchemaValidator:
             raise ValueError("Invalid skip")
         return v or 0
 
+    @staticmethod
+    def validate_cursor(v, values):
+        if not v:
+            return v
+        try:
+            cursor = CommonHelper.decode_cursor(v)
+        except Exception:
+            raise ValueError("Invalid cursor")
+        if not isinstance(cursor, dict) or not {"s", "o", "v", "i"} <= cursor.keys():
+            raise ValueError("Invalid cursor")
+        # position in a ranked keyword search
+        if "r" in cursor and (
+            not isinstance(cursor["r"], int) or not 0 <= cursor["r"] <= 100000
+        ):
+            raise ValueError("Invalid cursor")
+        if cursor["s"] != values.get("sort_by") or cursor["o"] != values.get(
+            "order_by"
+        ):
+            raise ValueError("Cursor does not match sort_by and order_by")
+        return v
+
     @staticmethod
     def validate_job_sort_by(v):
         if v and v == SortByJob.SALARY:
@@ -1,7 +1,14 @@
-from fastapi import FastAPI
+import json
+import time
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.loggers import logger
+from app.db.base import replica_router
+from app.db.query_stats import track_queries
+from app.storage.redis import get_counter_redis
 
 
 def register_middleware(app: FastAPI) -> None:
@@ -12,3 +19,44 @@ def register_middleware(app: FastAPI) -> None:
         allow_methods=settings.CORS_ALLOW_METHODS,
         allow_headers=settings.CORS_ALLOW_HEADERS,
     )
+
+    @app.middleware("http")
+    async def stick_to_primary_after_write(request: Request, call_next):
+        response = await call_next(request)
+        if (
+            replica_router.replicas
+            and request.method not in ("GET", "HEAD", "OPTIONS")
+            and response.status_code < 400
+        ):
+            try:
+                redis = await get_counter_redis()
+                await replica_router.mark_write(
+                    redis, replica_router.get_identity(request)
+                )
+            except Exception as e:
+                logger.error(f"Failed to mark replica stickiness: {e}")
+        return response
+
+    if settings.QUERY_STATS_ENABLED:
+
+        @app.middleware("http")
+        async def count_queries(request: Request, call_next):
+            started = time.perf_counter()
+            with track_queries() as stats:
+                response = await call_next(request)
+            total_ms = round((time.perf_counter() - started) * 1000, 3)
+            response.headers.append("Server-Timing", stats.get_server_timing())
+            response.headers.append("Server-Timing", f"app;dur={total_ms}")
+
+            record = {
+                "method": request.method,
+                "path": request.url.path,
+                "status": response.status_code,
+                "total_ms": total_ms,
+                **stats.get_stats(),
+            }
+            if record["repeated"]:
+                logger.warning(f"Repeated queries, likely N+1: {json.dumps(record)}")
+            else:
+                logger.debug(f"Request queries: {json.dumps(record)}")
+            return response
@@ -36,6 +36,7 @@ from .verify_code import VerifyCode
 from .verify_code_block import VerifyCodeBlock
 from .social_network import SocialNetwork
 from .work_location import WorkLocation
+from .job_search import JobSearch
 from .conversation import Conversation
 from .message import Message
 from .conversation_member import ConversationMember
@@ -104,6 +104,29 @@ class Job(Base):
         Index(
             "idx_job_salary_status_dealine", min_salary, max_salary, status, deadline
         ),
+        # published jobs: status = PUBLISHED AND deadline >= now() plus one facet,
+        # ORDER BY id is served by ix_job_status which InnoDB extends with the id
+        Index("idx_job_status_deadline", status, deadline),
+        Index("idx_job_status_updated_at_deadline", status, updated_at, deadline),
+        Index(
+            "idx_job_status_employment_type_deadline", status, employment_type, deadline
+        ),
+        Index(
+            "idx_job_status_job_position_id_deadline", status, job_position_id, deadline
+        ),
+        Index(
+            "idx_job_status_job_experience_id_deadline",
+            status,
+            job_experience_id,
+            deadline,
+        ),
+        Index(
+            "idx_job_status_salary_type_min_salary_max_salary",
+            status,
+            salary_type,
+            min_salary,
+            max_salary,
+        ),
     )
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -22,3 +22,7 @@ class JobCategory(Base):
         overlaps="job_categories",
         single_parent=True,
     )
+
+    __table_args__ = (
+        Index("idx_job_category_category_id_job_id", category_id, job_id),
+    )
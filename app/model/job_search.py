@@ -0,0 +1,61 @@
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Integer,
+    String,
+    DateTime,
+    Enum,
+    Date,
+    JSON,
+    Index,
+    text,
+)
+
+from app.db.base_class import Base
+from app.hepler.enum import JobType, SalaryType
+
+
+class JobSearch(Base):
+    """Published job flattened for search, one row per work location"""
+
+    job_id = Column(
+        Integer, ForeignKey("job.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    province_id = Column(Integer, nullable=True)
+    district_id = Column(Integer, nullable=True)
+    company_id = Column(Integer, nullable=True, index=True)
+    field_ids = Column(JSON, nullable=False)
+    category_ids = Column(JSON, nullable=False)
+    title = Column(String(255), nullable=False)
+    employment_type = Column(Enum(JobType), nullable=True, index=True)
+    job_experience_id = Column(Integer, nullable=False, index=True)
+    job_position_id = Column(Integer, nullable=False, index=True)
+    salary_type = Column(Enum(SalaryType), nullable=False)
+    min_salary = Column(Integer, nullable=True)
+    max_salary = Column(Integer, nullable=True, index=True)
+    salary_band = Column(Integer, nullable=False, index=True)
+    quantity = Column(Integer, nullable=False, index=True)
+    deadline = Column(Date, nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
+    __table_args__ = (
+        Index(
+            "idx_job_search_province_id_district_id_deadline",
+            province_id,
+            district_id,
+            deadline,
+        ),
+        Index(
+            "idx_job_search_salary_type_min_salary_max_salary",
+            salary_type,
+            min_salary,
+            max_salary,
+        ),
+        # MySQL 8.0.17+ multi-valued indexes, used by JSON_CONTAINS filters
+        Index(
+            "idx_job_search_category_ids",
+            text("(CAST(category_ids AS UNSIGNED ARRAY))"),
+        ),
+        Index("idx_job_search_field_ids", text("(CAST(field_ids AS UNSIGNED ARRAY))")),
+    )
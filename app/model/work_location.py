@@ -30,4 +30,10 @@ class WorkLocation(Base):
 
     __table_args__ = (
         Index("idx_work_location_job_id_province_id", job_id, province_id),
+        Index(
+            "idx_work_location_province_id_district_id_job_id",
+            province_id,
+            district_id,
+            job_id,
+        ),
     )
@@ -15,6 +15,7 @@ from app.hepler.enum import (
 )
 from app.schema.job_approval_log import JobApprovalLogResponse
 from app.hepler.schema_validator import SchemaValidator
+from app.hepler.common import CommonHelper
 from app.schema.skill import SkillItemResponse
 from app.schema.category import CategoryItemResponse
 from app.schema.working_time import WorkingTimeResponse
@@ -145,6 +146,7 @@ class PaginationJob(BaseModel):
     limit: Optional[int] = 10
     sort_by: Optional[SortByJob] = SortByJob.CREATED_AT
     order_by: Optional[OrderType] = OrderType.DESC
+    after: Optional[str] = None
 
     model_config = ConfigDict(from_attribute=True, extra="ignore")
 
@@ -164,6 +166,10 @@ class PaginationJob(BaseModel):
     def validate_order_by(cls, v):
         return v or OrderType.DESC
 
+    @validator("after")
+    def validate_after(cls, v, values):
+        return SchemaValidator.validate_cursor(v, values)
+
 
 class JobFilterByBusiness(PaginationJob):
     job_status: Optional[JobStatus] = None
@@ -251,11 +257,53 @@ class JobSearchByUser(PaginationJob):
     def validate_job_status(cls, v):
         return v or JobStatus.PUBLISHED
 
-    def get_count_job_user_search_key(self):
-        return f"{self.province_id}_{self.district_id}_{self.province_id}_{self.category_id}_{self.field_id}_{self.employment_type}_{self.job_experience_id}_{self.job_position_id}_{self.min_salary}_{self.max_salary}_{self.salary_type}_{self.deadline}_{self.keyword}_{self.suggest}_{self.updated_at}_{self.sort_by}_{self.order_by}_{self.skip}_{self.limit}"
+    def get_cache_params(self, exclude: set = None) -> dict:
+        params = self.model_dump(exclude={"suggest", *(exclude or set())})
+        if params.get("keyword"):
+            params["keyword"] = params["keyword"].strip().lower()
+        return params
+
+    def get_search_key(self):
+        """Key of one page of results"""
+        return CommonHelper.get_cache_key(self.get_cache_params())
+
+    def get_filter_key(self):
+        """Key of the whole result set, for counts and breakdowns"""
+        return CommonHelper.get_cache_key(
+            self.get_cache_params({"skip", "limit", "sort_by", "order_by", "after"})
+        )
+
+
+class JobFacetFilter(BaseModel):
+    company_id: Optional[int] = None
+    province_id: Optional[int] = None
+    district_id: Optional[int] = None
+    category_id: Optional[int] = None
+    field_id: Optional[int] = None
+    employment_type: Optional[JobType] = None
+    job_experience_id: Optional[int] = None
+    job_position_id: Optional[int] = None
+    min_salary: Optional[int] = None
+    max_salary: Optional[int] = None
+    salary_type: Optional[SalaryType] = None
+    keyword: Optional[str] = None
+    updated_at: Optional[Any] = None
+
+    model_config = ConfigDict(from_attribute=True, extra="ignore")
+
+    @validator("keyword")
+    def validate_keyword(cls, v):
+        return v.strip() or None if v else None
+
+    @validator("updated_at")
+    def validate_updated_at(cls, v):
+        return SchemaValidator.validate_job_updated_at(v)
 
-    def get_jobs_of_district_key(self):
-        return f"{self.province_id}_{self.district_id}_{self.province_id}_{self.category_id}_{self.field_id}_{self.employment_type}_{self.job_experience_id}_{self.job_position_id}_{self.min_salary}_{self.max_salary}_{self.salary_type}_{self.deadline}_{self.keyword}_{self.suggest}_{self.updated_at}"
+    def get_facets_key(self):
+        filters = self.model_dump()
+        if filters.get("keyword"):
+            filters["keyword"] = filters["keyword"].lower()
+        return CommonHelper.get_cache_key(filters)
 
 
 class JobSearchByBusiness(PaginationJob):
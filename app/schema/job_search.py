@@ -0,0 +1,37 @@
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
+from datetime import date, datetime
+
+from app.hepler.enum import JobType, SalaryType
+
+
+class JobSearchBase(BaseModel):
+    model_config = ConfigDict(from_attribute=True, extra="ignore")
+
+    job_id: int
+    province_id: Optional[int] = None
+    district_id: Optional[int] = None
+    company_id: Optional[int] = None
+    field_ids: List[int] = []
+    category_ids: List[int] = []
+    title: str
+    employment_type: Optional[JobType] = None
+    job_experience_id: int
+    job_position_id: int
+    salary_type: SalaryType
+    min_salary: Optional[int] = None
+    max_salary: Optional[int] = None
+    salary_band: int
+    quantity: int
+    deadline: date
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+# schema
+class JobSearchCreate(JobSearchBase):
+    pass
+
+
+class JobSearchUpdate(JobSearchBase):
+    pass
@@ -30,3 +30,7 @@ class Pagination(BaseModel):
 
     def get_key(self) -> str:
         return f"{self.skip}_{self.limit}_{self.sort_by}_{self.order_by}"
+
+    @property
+    def key(self) -> str:
+        return self.get_key()
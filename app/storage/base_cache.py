@@ -1,39 +1,481 @@
 from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.asyncio.connection import Connection
+import asyncio
+import inspect
 import json
-from typing import Any, Set
+import math
+import random
+import time
+import uuid
+from typing import Any, AsyncIterator, Set, List, Dict, Tuple, Callable, Optional
 
-from app.storage.redis import redis_dependency
+from app.core.config import settings
+from app.core.loggers import get_logger
+from app.storage.redis import redis_dependency, is_cluster
+from app.storage.local_cache import LocalCache
+
+logger = get_logger(__name__)
 
 
 class BaseCache:
-    def __init__(self, key_prefix: str, expire: int):
+    instances: List["BaseCache"] = []
+    # app.storage.lookup.Lookup, evicted through the same channel
+    lookups: List[Any] = []
+    invalidation_channel = "cache_invalidation"
+    # Redis itself reports changed keys, the cluster client cannot redirect them
+    client_tracking = (
+        settings.CACHE_CLIENT_TRACKING and settings.REDIS_MODE != "cluster"
+    )
+    tag_prefix = "cache_tag:"
+    release_lock_script = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) end return 0"
+    )
+    # EXPIRE GT, which needs Redis 7, that also sets a TTL on a key without one
+    extend_expire_script = (
+        "if redis.call('ttl', KEYS[1]) < tonumber(ARGV[1]) then "
+        "return redis.call('expire', KEYS[1], ARGV[1]) end return 0"
+    )
+
+    def __init__(
+        self,
+        key_prefix: str,
+        expire: int,
+        local_size: int = 0,
+        local_expire: int = None,
+    ):
         self.key_prefix = key_prefix
         self.expire = expire
+        self.local_size = local_size
+        self.local = (
+            LocalCache(
+                local_size,
+                local_expire
+                or (
+                    settings.CACHE_CLIENT_TRACKING_EXPIRE
+                    if self.client_tracking
+                    else settings.CACHE_LOCAL_EXPIRE
+                ),
+            )
+            if local_size and settings.CACHE_LOCAL_ENABLED
+            else None
+        )
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.tracking_prefixes = [key_prefix]
+        BaseCache.instances.append(self)
+
+    def count_hits(self, responses: List[Any]):
+        hits = sum(1 for response in responses if response)
+        self.hits += hits
+        self.misses += len(responses) - hits
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "redis": {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "errors": self.errors,
+            },
+            "local": self.local.get_stats() if self.local else None,
+        }
+
+    @classmethod
+    def get_all_stats(cls) -> Dict[str, dict]:
+        return {cache.key_prefix: cache.get_stats() for cache in cls.instances}
+
+    @classmethod
+    def evict_local(cls, keys: List[str]):
+        for cache in cls.instances:
+            if cache.local:
+                for key in keys:
+                    if key.startswith(cache.key_prefix):
+                        cache.local.delete(key)
+        for lookup in cls.lookups:
+            if lookup.key in keys:
+                lookup.clear()
+
+    @classmethod
+    def get_tracking_prefixes(cls) -> Set[str]:
+        if not cls.client_tracking:
+            return set()
+        return {
+            prefix
+            for cache in cls.instances
+            if cache.local
+            for prefix in cache.tracking_prefixes
+        }
+
+    @classmethod
+    def clear_local(cls):
+        for cache in cls.instances:
+            if cache.local:
+                cache.local.clear()
+        for lookup in cls.lookups:
+            lookup.clear()
+
+    async def invalidate(self, redis: Redis, keys: List[str]):
+        """Drop Keys from the local tier of every worker"""
+        if not self.local_size or not keys:
+            return
+        await self.publish_invalidation(redis, [self.key_prefix + key for key in keys])
+
+    async def publish_invalidation(self, redis: Redis, full_keys: List[str]):
+        BaseCache.evict_local(full_keys)
+        # Redis reports tracked keys to every worker itself
+        prefixes = tuple(BaseCache.get_tracking_prefixes())
+        full_keys = [key for key in full_keys if not key.startswith(prefixes)]
+        if not full_keys:
+            return
+        try:
+            await redis.publish(self.invalidation_channel, json.dumps(full_keys))
+        except Exception as e:
+            logger.error(f"Failed to publish cache invalidation: {e}")
 
     async def get(self, redis: Redis, key: str) -> Any:
         """Get Value from Key"""
         response = await redis.get(
             self.key_prefix + key,
         )
+        self.count_hits([response])
         return response
 
+    async def get_many_decoded(
+        self, redis: Redis, keys: List[str], decode: Callable[[Any], Any]
+    ) -> List[Any]:
+        """Get decoded Values from Keys, serving hot keys from the local tier"""
+        if not self.local:
+            return [decode(response) for response in await self.get_many(redis, keys)]
+
+        values = [self.local.get(self.key_prefix + key) for key in keys]
+        missed = [index for index, value in enumerate(values) if value is None]
+        if not missed:
+            return values
+        version = self.local.version
+        responses = await self.get_many(redis, [keys[index] for index in missed])
+        for index, response in zip(missed, responses):
+            values[index] = decode(response)
+            if values[index] is not None:
+                self.local.set(
+                    self.key_prefix + keys[index], values[index], None, version
+                )
+        return values
+
+    async def get_or_compute(
+        self,
+        redis: Redis,
+        key: str,
+        compute: Callable[[], Any],
+        *,
+        encode: Callable[[Any], Any] = json.dumps,
+        decode: Callable[[Any], Any] = json.loads,
+        expire: int = None,
+        stale_expire: int = 60,
+        lock_expire: int = 10,
+        early_refresh: float = 0,
+    ) -> Any:
+        """Get Value from Key, computing it once on a miss
+
+        Concurrent callers in the process share one computation. Across workers a
+        short Redis lock lets one worker recompute while the others serve the copy
+        kept for `stale_expire` seconds past `expire`. A positive `early_refresh`
+        (XFetch beta, 1.0 is typical) refreshes hot keys shortly before they expire.
+        """
+        full_key = self.key_prefix + key
+        if self.local:
+            value = self.local.get(full_key)
+            if value is not None:
+                return value
+
+        inflight = self.inflight.get(full_key)
+        if inflight:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # the caller computing the value went away, compute it here instead
+                if not inflight.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self.inflight[full_key] = future
+        try:
+            value = await self.fetch_or_compute(
+                redis,
+                key,
+                compute,
+                encode=encode,
+                decode=decode,
+                expire=expire or self.expire,
+                stale_expire=stale_expire,
+                lock_expire=lock_expire,
+                early_refresh=early_refresh,
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            if self.inflight.get(full_key) is future:
+                del self.inflight[full_key]
+
+        future.set_result(value)
+        return value
+
+    async def fetch_or_compute(
+        self,
+        redis: Redis,
+        key: str,
+        compute: Callable[[], Any],
+        *,
+        encode: Callable[[Any], Any],
+        decode: Callable[[Any], Any],
+        expire: int,
+        stale_expire: int,
+        lock_expire: int,
+        early_refresh: float,
+    ) -> Any:
+        full_key = self.key_prefix + key
+        version = self.local.version if self.local else None
+        entry = await self.get_entry(redis, full_key, decode)
+        if entry:
+            value, expires_at, delta = entry
+            refresh_at = expires_at
+            if early_refresh:
+                refresh_at += delta * early_refresh * math.log(1 - random.random())
+            if time.time() < refresh_at:
+                if self.local:
+                    self.local.set(full_key, value, expires_at - time.time(), version)
+                return value
+
+        lock_key = full_key + ":lock"
+        token = uuid.uuid4().hex
+        try:
+            locked = await redis.set(lock_key, token, nx=True, ex=lock_expire)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Failed to lock cache key {full_key}: {e}")
+            return await self.compute_value(compute)
+
+        if not locked:
+            if entry:
+                return entry[0]
+            deadline = time.monotonic() + lock_expire
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                entry = await self.get_entry(redis, full_key, decode)
+                if entry:
+                    return entry[0]
+
+        try:
+            started = time.monotonic()
+            value = await self.compute_value(compute)
+            if value is not None:
+                await self.set_entry(
+                    redis,
+                    key,
+                    encode(value),
+                    expire,
+                    stale_expire,
+                    time.monotonic() - started,
+                )
+                if self.local:
+                    self.local.set(full_key, value, expire)
+            return value
+        finally:
+            if locked:
+                try:
+                    await redis.eval(self.release_lock_script, 1, lock_key, token)
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"Failed to unlock cache key {full_key}: {e}")
+
+    async def compute_value(self, compute: Callable[[], Any]) -> Any:
+        value = compute()
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    async def get_entry(
+        self, redis: Redis, full_key: str, decode: Callable[[Any], Any]
+    ) -> Optional[Tuple[Any, float, float]]:
+        """Get (value, expires_at, compute seconds) written by set_entry"""
+        try:
+            response = await redis.get(full_key)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Failed to get cache key {full_key}: {e}")
+            response = None
+        self.count_hits([response])
+        if not response:
+            return None
+
+        try:
+            expires_at, delta, payload = response.split(b" ", 2)
+            value = decode(payload)
+        except Exception:
+            # written by another format, recompute
+            return None
+        if value is None:
+            return None
+        return value, float(expires_at), float(delta)
+
+    async def set_entry(
+        self,
+        redis: Redis,
+        key: str,
+        payload: Any,
+        expire: int,
+        stale_expire: int,
+        delta: float,
+    ):
+        if isinstance(payload, str):
+            payload = payload.encode()
+        header = f"{time.time() + expire:.3f} {delta:.3f} ".encode()
+        try:
+            await self.set(redis, key, header + payload, expire + stale_expire)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Failed to set cache key {self.key_prefix + key}: {e}")
+
+    async def add_tags(self, redis: Redis, key: str, tags: List[str], expire: int):
+        """Register Key under dependency Tags, tag sets outlive their longest key"""
+        await self.add_many_tags(redis, [(key, tags, expire)])
+
+    async def add_many_tags(
+        self, redis: Redis, items: List[Tuple[str, List[str], int]]
+    ):
+        """Register (key, tags, expire) items in one pipelined round-trip"""
+        if not any(tags for _, tags, _ in items):
+            return
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, tags, expire in items:
+                    for tag in tags:
+                        pipe.sadd(self.tag_prefix + tag, self.key_prefix + key)
+                        pipe.eval(
+                            self.extend_expire_script, 1, self.tag_prefix + tag, expire
+                        )
+                await pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Failed to tag cache keys: {e}")
+
+    async def invalidate_tags(
+        self, redis: Redis, tags: List[str], batch_size: int = 500
+    ) -> int:
+        """Delete every Key registered under Tags
+
+        Keys are popped from the tag set `batch_size` at a time, each UNLINK is
+        pipelined with the next SPOP, so keys tagged meanwhile are never dropped
+        from the set without being deleted.
+        """
+        local = any(cache.local_size for cache in BaseCache.instances)
+        deleted = 0
+        for tag in tags:
+            tag_key = self.tag_prefix + tag
+            try:
+                keys = await redis.spop(tag_key, batch_size)
+                while keys:
+                    async with redis.pipeline(transaction=False) as pipe:
+                        # one UNLINK per key, tagged keys may live in any slot
+                        for key in keys:
+                            pipe.unlink(key)
+                        pipe.spop(tag_key, batch_size)
+                        *counts, next_keys = await pipe.execute()
+                    deleted += sum(counts)
+                    if local:
+                        await self.publish_invalidation(
+                            redis, [key.decode() for key in keys]
+                        )
+                    keys = next_keys
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Failed to invalidate cache tag {tag}: {e}")
+        return deleted
+
     async def set(self, redis: Redis, key: str, value: Any, expire: int = None):
         """Set Value to Key"""
         await redis.set(self.key_prefix + key, value, expire or self.expire)
+        await self.invalidate(redis, [key])
+
+    async def get_many(self, redis: Redis, keys: List[str]) -> List[Any]:
+        """Get Values from Keys in one round-trip"""
+        if not keys:
+            return []
+        keys = [self.key_prefix + key for key in keys]
+        if is_cluster(redis):
+            responses = await redis.mget_nonatomic(keys)
+        else:
+            responses = await redis.mget(keys)
+        self.count_hits(responses)
+        return responses
+
+    async def set_many(self, redis: Redis, items: List[Tuple[str, Any, int]]):
+        """Set (key, value, expire) items in one pipelined round-trip"""
+        if not items:
+            return
+        async with redis.pipeline(transaction=False) as pipe:
+            for key, value, expire in items:
+                pipe.set(self.key_prefix + key, value, expire or self.expire)
+            await pipe.execute()
+        await self.invalidate(redis, [key for key, _, _ in items])
 
     async def keys(self, redis: Redis, pattern: str) -> Set[str]:
         """Get Keys by Pattern"""
-        return await redis.keys(self.key_prefix + pattern)
+        return {key async for key in self.scan_iter(redis, pattern)}
+
+    async def scan_iter(
+        self, redis: Redis, pattern: str = "*", count: int = 1000
+    ) -> AsyncIterator[str]:
+        """Iterate full Keys by Pattern with SCAN, without blocking the server"""
+        async for key in redis.scan_iter(match=self.key_prefix + pattern, count=count):
+            yield key.decode() if isinstance(key, bytes) else key
+
+    async def purge(
+        self, redis: Redis, pattern: str = "*", batch_size: int = 500
+    ) -> int:
+        """Delete Keys by Pattern, one UNLINK per `batch_size` scanned keys"""
+        deleted = 0
+        batch = []
+        async for key in self.scan_iter(redis, pattern, batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await self.unlink(redis, batch)
+                batch = []
+        if batch:
+            deleted += await self.unlink(redis, batch)
+        return deleted
+
+    async def unlink(self, redis: Redis, full_keys: List[str]) -> int:
+        """Delete full Keys, freeing their memory in the background"""
+        deleted = await redis.unlink(*full_keys)
+        if self.local_size:
+            await self.publish_invalidation(redis, full_keys)
+        return deleted
 
     async def set_list(self, redis: Redis, key: str, value: list, expire: int = None):
-        """Set Value to Key"""
-        for v in value:
-            await redis.rpush(self.key_prefix + key, json.dumps(v))
-        await redis.expire(self.key_prefix + key, expire or self.expire)
+        """Replace List at Key in one MULTI/EXEC round-trip"""
+        async with redis.pipeline(transaction=not is_cluster(redis)) as pipe:
+            pipe.delete(self.key_prefix + key)
+            if value:
+                pipe.rpush(self.key_prefix + key, *[json.dumps(v) for v in value])
+                pipe.expire(self.key_prefix + key, expire or self.expire)
+            await pipe.execute()
 
     async def get_list(self, redis: Redis, key: str) -> list:
         """Get Value from Key"""
-        return [json.loads(v) for v in await redis.lrange(self.key_prefix + key, 0, -1)]
+        values = await redis.lrange(self.key_prefix + key, 0, -1)
+        if not values:
+            return []
+        return json.loads(b"[" + b",".join(values) + b"]")
 
     async def add_to_list(self, redis: Redis, key: str, value: Any):
         """Add Value to List"""
@@ -72,3 +514,111 @@ class BaseCache:
     async def delete(self, redis: Redis, key: str):
         """Delete Key"""
         await redis.delete(self.key_prefix + key)
+        await self.invalidate(redis, [key])
+
+
+class CacheInvalidationListener:
+    """Evicts local cache entries written or deleted by other workers
+
+    With client tracking, Redis 6+ reports every change under the tracking
+    prefixes of local caches (writes, expiry, eviction, flushes) on
+    `tracking_channel`, so those entries may live as long as their Redis key. One
+    connection turns tracking on in BCAST mode and redirects the reports to the
+    listening one.
+    """
+
+    tracking_channel = "__redis__:invalidate"
+    ping_interval = 5
+
+    def __init__(self):
+        self.task: asyncio.Task = None
+
+    def start(self, redis: Redis):
+        if self.task is None and (
+            BaseCache.lookups or any(cache.local for cache in BaseCache.instances)
+        ):
+            self.task = asyncio.create_task(self.listen(redis))
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def listen(self, redis: Redis):
+        while True:
+            tracker = None
+            try:
+                async with redis.pubsub() as pubsub:
+                    if BaseCache.client_tracking:
+                        tracker = await self.start_tracking(redis, pubsub)
+                        await pubsub.subscribe(self.tracking_channel)
+                    await pubsub.subscribe(BaseCache.invalidation_channel)
+                    # invalidations sent while disconnected are lost
+                    BaseCache.clear_local()
+                    pinged_at = time.monotonic()
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=self.ping_interval
+                        )
+                        if message:
+                            self.handle_message(message)
+                        if (
+                            tracker
+                            and time.monotonic() - pinged_at > self.ping_interval
+                        ):
+                            # tracking stops silently with its connection
+                            await self.execute(tracker, "PING")
+                            pinged_at = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache invalidation listener failed: {e}")
+                await asyncio.sleep(1)
+            finally:
+                if tracker:
+                    await tracker.disconnect()
+                    await redis.connection_pool.release(tracker)
+
+    async def start_tracking(self, redis: Redis, pubsub: PubSub) -> Connection:
+        """Redirect tracking of the local cache prefixes to the PubSub connection"""
+        pubsub.connection = await redis.connection_pool.get_connection("pubsub")
+        client_id = await self.execute(pubsub.connection, "CLIENT", "ID")
+        tracker = await redis.connection_pool.get_connection("tracking")
+        prefixes = BaseCache.get_tracking_prefixes()
+        try:
+            await self.execute(
+                tracker,
+                "CLIENT",
+                "TRACKING",
+                "ON",
+                "REDIRECT",
+                client_id,
+                "BCAST",
+                *[arg for prefix in sorted(prefixes) for arg in ("PREFIX", prefix)],
+            )
+        except Exception:
+            await redis.connection_pool.release(tracker)
+            raise
+        return tracker
+
+    async def execute(self, connection: Connection, *args) -> Any:
+        await connection.send_command(*args)
+        return await connection.read_response()
+
+    def handle_message(self, message: dict):
+        if message["type"] != "message":
+            return
+        if message["channel"] == BaseCache.invalidation_channel.encode():
+            BaseCache.evict_local(json.loads(message["data"]))
+        elif message["data"] is None:
+            # FLUSHDB / FLUSHALL
+            BaseCache.clear_local()
+        else:
+            BaseCache.evict_local([key.decode() for key in message["data"]])
+
+
+cache_invalidation_listener = CacheInvalidationListener()
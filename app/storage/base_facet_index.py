@@ -0,0 +1,301 @@
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from fastapi.concurrency import run_in_threadpool
+from redis.asyncio import Redis
+
+from app.core.loggers import get_logger
+
+logger = get_logger(__name__)
+
+
+class BaseFacetIndex:
+    """In-process facet index.
+
+    Documents are numbered densely as they are indexed and each facet value
+    owns a bitmap over those numbers (a Python int where bit N is set when
+    document number N has that value), so filter intersections are big-int
+    ANDs and counts are popcounts. A bitmap is as long as the number of
+    indexed documents, not the largest document id, and numbers of removed
+    documents are reused.
+    """
+
+    def __init__(self, refresh_interval: int):
+        self.refresh_interval = refresh_interval
+        self.bitmaps: Dict[str, Dict[Any, int]] = {}
+        self.documents: Dict[int, Dict[str, List[Any]]] = {}
+        # doc_id -> ordinal and ordinal -> doc_id
+        self.ordinals: Dict[int, int] = {}
+        self.doc_ids: List[Optional[int]] = []
+        self.free: List[int] = []
+        self.all = 0
+        self.built_at: Optional[float] = None
+        # doc ids changed while a rebuild runs, see FacetIndexRefresher
+        self.changed: Optional[Set[int]] = None
+
+    @staticmethod
+    def ordinals_to_bitmap(ordinals: Iterable[int]) -> int:
+        """Build a bitmap from ordinals in linear time"""
+        ordinals = list(ordinals)
+        if not ordinals:
+            return 0
+        bits = bytearray((max(ordinals) >> 3) + 1)
+        for ordinal in ordinals:
+            bits[ordinal >> 3] |= 1 << (ordinal & 7)
+        return int.from_bytes(bits, "little")
+
+    @staticmethod
+    def bitmap_to_ordinals(bitmap: int) -> List[int]:
+        """List ordinals of a bitmap in ascending order"""
+        ordinals = []
+        bits = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+        for index, byte in enumerate(bits):
+            while byte:
+                low = byte & -byte
+                ordinals.append((index << 3) + low.bit_length() - 1)
+                byte ^= low
+        return ordinals
+
+    def to_bitmap(self, doc_ids: Iterable[int]) -> int:
+        """Bitmap of the indexed documents among doc_ids"""
+        ordinals = self.ordinals
+        return self.ordinals_to_bitmap(
+            ordinals[doc_id] for doc_id in doc_ids if doc_id in ordinals
+        )
+
+    def to_ids(self, bitmap: int) -> List[int]:
+        """List document ids of a bitmap in ascending order"""
+        return sorted(
+            self.doc_ids[ordinal] for ordinal in self.bitmap_to_ordinals(bitmap)
+        )
+
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    def prepare(self, documents: Dict[int, Dict[str, List[Any]]]) -> dict:
+        """Compute a whole index without touching the live one"""
+        doc_ids = sorted(documents)
+        ordinals = {doc_id: ordinal for ordinal, doc_id in enumerate(doc_ids)}
+        postings: Dict[str, Dict[Any, List[int]]] = {}
+        for doc_id, facets in documents.items():
+            ordinal = ordinals[doc_id]
+            for facet, values in facets.items():
+                for value in values:
+                    postings.setdefault(facet, {}).setdefault(value, []).append(ordinal)
+
+        return {
+            "bitmaps": {
+                facet: {
+                    value: self.ordinals_to_bitmap(ordinals)
+                    for value, ordinals in values.items()
+                }
+                for facet, values in postings.items()
+            },
+            "documents": documents,
+            "ordinals": ordinals,
+            "doc_ids": doc_ids,
+            "all": (1 << len(doc_ids)) - 1,
+        }
+
+    def swap(self, state: dict):
+        """Replace the whole index with a prepared one"""
+        self.bitmaps = state["bitmaps"]
+        self.documents = state["documents"]
+        self.ordinals = state["ordinals"]
+        self.doc_ids = state["doc_ids"]
+        self.free = []
+        self.all = state["all"]
+        self.built_at = time.monotonic()
+
+    def build(self, documents: Dict[int, Dict[str, List[Any]]]):
+        """Replace the whole index"""
+        self.swap(self.prepare(documents))
+
+    def add(self, doc_id: int, facets: Dict[str, List[Any]]):
+        """Add or replace one document"""
+        self.remove(doc_id)
+        if self.free:
+            ordinal = self.free.pop()
+            self.doc_ids[ordinal] = doc_id
+        else:
+            ordinal = len(self.doc_ids)
+            self.doc_ids.append(doc_id)
+        self.ordinals[doc_id] = ordinal
+        bit = 1 << ordinal
+        for facet, values in facets.items():
+            facet_bitmaps = self.bitmaps.setdefault(facet, {})
+            for value in values:
+                facet_bitmaps[value] = facet_bitmaps.get(value, 0) | bit
+        self.documents[doc_id] = facets
+        self.all |= bit
+        if self.changed is not None:
+            self.changed.add(doc_id)
+
+    def remove(self, doc_id: int):
+        """Remove one document"""
+        if self.changed is not None:
+            self.changed.add(doc_id)
+        facets = self.documents.pop(doc_id, None)
+        if facets is None:
+            return
+        ordinal = self.ordinals.pop(doc_id)
+        self.doc_ids[ordinal] = None
+        self.free.append(ordinal)
+        mask = ~(1 << ordinal)
+        for facet, values in facets.items():
+            facet_bitmaps = self.bitmaps.get(facet, {})
+            for value in values:
+                if value in facet_bitmaps:
+                    facet_bitmaps[value] &= mask
+                    if not facet_bitmaps[value]:
+                        del facet_bitmaps[value]
+        self.all &= mask
+
+    def update_documents(
+        self, doc_ids: List[int], documents: Dict[int, Dict[str, List[Any]]]
+    ):
+        """Re-index the given documents; ids missing from documents are dropped"""
+        for doc_id in doc_ids:
+            if doc_id in documents:
+                self.add(doc_id, documents[doc_id])
+            else:
+                self.remove(doc_id)
+
+    def get(self, facet: str, value: Any) -> int:
+        return self.bitmaps.get(facet, {}).get(value, 0)
+
+    def intersect(self, filters: Dict[str, Any], base: Optional[int] = None) -> int:
+        """AND the bitmaps of every (facet, value) filter, skipping None values"""
+        bitmap = self.all if base is None else base
+        for facet, value in filters.items():
+            if value is None:
+                continue
+            bitmap &= self.get(facet, value)
+            if not bitmap:
+                break
+        return bitmap
+
+    def count(self, bitmap: int) -> int:
+        return bitmap.bit_count()
+
+    def breakdown(self, facet: str, bitmap: int) -> Dict[Any, int]:
+        """Count documents of a bitmap per value of a facet"""
+        response = {}
+        for value, facet_bitmap in self.bitmaps.get(facet, {}).items():
+            count = (facet_bitmap & bitmap).bit_count()
+            if count:
+                response[value] = count
+        return response
+
+
+class FacetIndexRefresher:
+    """Keeps the facet index of every worker in step with the database
+
+    `load(doc_ids)` returns the documents of doc_ids, or of every document for
+    None. A background task rebuilds the whole index every refresh interval:
+    loading and preparing the bitmaps run in the threadpool and the prepared
+    index is swapped in on the event loop, so requests never wait on a
+    rebuild. Documents changed while a rebuild runs are loaded again once it
+    is swapped in.
+
+    A worker that changes documents publishes their ids on `channel` and every
+    other worker re-indexes them, so no worker answers from a stale index until
+    its next rebuild. Changes published while a worker is disconnected are
+    lost, it rebuilds as soon as it subscribes again.
+    """
+
+    ping_interval = 5
+
+    def __init__(
+        self,
+        index: BaseFacetIndex,
+        load: Callable[[Optional[List[int]]], Dict[int, Dict[str, List[Any]]]],
+        channel: str,
+    ):
+        self.index = index
+        self.load = load
+        self.channel = channel
+        self.sender = uuid.uuid4().hex
+        self.wake = asyncio.Event()
+        self.task: asyncio.Task = None
+        self.listener: asyncio.Task = None
+
+    def start(self, redis: Optional[Redis] = None):
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+        if redis is not None and self.listener is None:
+            self.listener = asyncio.create_task(self.listen(redis))
+
+    async def stop(self):
+        for task in (self.task, self.listener):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self.task = None
+        self.listener = None
+
+    async def refresh(self):
+        self.index.changed = set()
+        try:
+            state = await run_in_threadpool(lambda: self.index.prepare(self.load(None)))
+            self.index.swap(state)
+        finally:
+            changed, self.index.changed = list(self.index.changed), None
+        if changed:
+            documents = await run_in_threadpool(self.load, changed)
+            self.index.update_documents(changed, documents)
+
+    async def run(self):
+        while True:
+            self.wake.clear()
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Failed to refresh facet index: {e}")
+            try:
+                await asyncio.wait_for(self.wake.wait(), self.index.refresh_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def publish(self, redis: Redis, doc_ids: List[int]):
+        """Have every other worker re-index doc_ids"""
+        try:
+            await redis.publish(
+                self.channel, json.dumps({"sender": self.sender, "ids": doc_ids})
+            )
+        except Exception as e:
+            logger.error(f"Failed to publish facet index changes: {e}")
+
+    async def apply(self, doc_ids: List[int]):
+        # a rebuild in progress reloads them once it is swapped in
+        if not self.index.is_built() and self.index.changed is None:
+            return
+        documents = await run_in_threadpool(self.load, doc_ids)
+        self.index.update_documents(doc_ids, documents)
+
+    async def listen(self, redis: Redis):
+        while True:
+            try:
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    if self.index.is_built():
+                        self.wake.set()
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=self.ping_interval
+                        )
+                        if not message or message["type"] != "message":
+                            continue
+                        data = json.loads(message["data"])
+                        if data["sender"] != self.sender:
+                            await self.apply(data["ids"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Facet index listener failed: {e}")
+                await asyncio.sleep(1)
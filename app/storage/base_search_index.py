@@ -0,0 +1,129 @@
+from redis.asyncio import Redis
+import re
+import unicodedata
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+from app.storage.redis import scan_batches
+
+
+class BaseSearchIndex:
+    """Inverted index stored in Redis.
+
+    Every term owns a sorted set of document ids scored by term weight and
+    every document keeps the set of terms it was indexed under, so a document
+    can be re-indexed or removed without scanning the whole index.
+    """
+
+    token_pattern = re.compile(r"\w+", re.UNICODE)
+    tag_pattern = re.compile(r"<[^>]+>")
+    # single characters matter: "C", "C#", "R"
+    min_token_length = 1
+
+    def __init__(self, key_prefix: str, expire_search: int = 30):
+        self.key_prefix = key_prefix
+        self.expire_search = expire_search
+        self.term_key = "term:"
+        self.doc_key = "doc:"
+        self.search_key = "search:"
+        self.built_key = "built"
+
+    @staticmethod
+    def fold(text: str) -> str:
+        """Lowercase and strip diacritics (Vietnamese included)"""
+        text = text.lower().replace("đ", "d")
+        text = unicodedata.normalize("NFD", text)
+        return "".join(c for c in text if unicodedata.category(c) != "Mn")
+
+    def tokenize(self, text: str) -> List[str]:
+        """Split text into folded tokens"""
+        if not text:
+            return []
+        text = self.fold(self.tag_pattern.sub(" ", text))
+        return [
+            token
+            for token in self.token_pattern.findall(text)
+            if len(token) >= self.min_token_length
+        ]
+
+    def score_terms(self, fields: List[Tuple[str, int]]) -> Dict[str, float]:
+        """Sum field weights per term"""
+        scores: Dict[str, float] = {}
+        for text, weight in fields:
+            for token in self.tokenize(text):
+                scores[token] = scores.get(token, 0) + weight
+        return scores
+
+    async def index_document(
+        self, redis: Redis, doc_id: int, fields: List[Tuple[str, int]]
+    ):
+        """Replace the terms of a document"""
+        terms = self.score_terms(fields)
+        doc_key = self.key_prefix + self.doc_key + str(doc_id)
+        old_terms = await redis.smembers(doc_key)
+
+        async with redis.pipeline(transaction=True) as pipe:
+            for term in old_terms:
+                term = term.decode() if isinstance(term, bytes) else term
+                if term not in terms:
+                    pipe.zrem(self.key_prefix + self.term_key + term, doc_id)
+            pipe.delete(doc_key)
+            for term, score in terms.items():
+                pipe.zadd(self.key_prefix + self.term_key + term, {doc_id: score})
+            if terms:
+                pipe.sadd(doc_key, *terms.keys())
+            await pipe.execute()
+
+    async def remove_document(self, redis: Redis, doc_id: int):
+        """Remove a document from every term it was indexed under"""
+        doc_key = self.key_prefix + self.doc_key + str(doc_id)
+        terms = await redis.smembers(doc_key)
+
+        async with redis.pipeline(transaction=True) as pipe:
+            for term in terms:
+                term = term.decode() if isinstance(term, bytes) else term
+                pipe.zrem(self.key_prefix + self.term_key + term, doc_id)
+            pipe.delete(doc_key)
+            await pipe.execute()
+
+    async def search(
+        self, redis: Redis, query: str
+    ) -> Optional[List[Tuple[int, float]]]:
+        """Return (doc_id, score) of documents matching every query term, best first
+
+        None when the query has no indexable term, the index can not answer it.
+        """
+        terms = sorted(set(self.tokenize(query)))
+        if not terms:
+            return None
+
+        term_keys = [self.key_prefix + self.term_key + term for term in terms]
+        if len(term_keys) == 1:
+            response = await redis.zrevrange(term_keys[0], 0, -1, withscores=True)
+        else:
+            search_key = (
+                self.key_prefix
+                + self.search_key
+                + hashlib.md5("_".join(terms).encode()).hexdigest()
+            )
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.zinterstore(search_key, term_keys, aggregate="SUM")
+                pipe.expire(search_key, self.expire_search)
+                pipe.zrevrange(search_key, 0, -1, withscores=True)
+                response = (await pipe.execute())[-1]
+
+        return [(int(doc_id), score) for doc_id, score in response]
+
+    async def is_built(self, redis: Redis) -> bool:
+        """Check whether a full build has completed"""
+        return bool(await redis.exists(self.key_prefix + self.built_key))
+
+    async def mark_built(self, redis: Redis):
+        """Mark the index as fully built"""
+        await redis.set(self.key_prefix + self.built_key, 1)
+
+    async def clear(self, redis: Redis):
+        """Drop every key of the index, unmarking it as built first"""
+        await redis.delete(self.key_prefix + self.built_key)
+        async for keys in scan_batches(redis, self.key_prefix + "*"):
+            await redis.unlink(*keys)
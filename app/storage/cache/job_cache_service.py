@@ -2,24 +2,38 @@ import json
 from redis.asyncio import Redis
 from datetime import datetime, date
 from enum import Enum
-from typing import List
+from typing import List, Dict, Tuple
 
 from app.storage.base_cache import BaseCache
+from app.storage.codec import ModelCodec
 from app.schema.job import JobItemResponse
 
 
 class JobCacheService(BaseCache):
     def __init__(self):
-        super().__init__("job_cache_", 86400)
+        # job cards are only kept in process when Redis reports their changes
+        super().__init__(
+            "job_cache_", 86400, local_size=4096 if self.client_tracking else 0
+        )
         self.user_search_count_key = "user_search_count"
         self.province_district_search_key = "province_district_search"
         self.count_job_by_salary_key = "count_job_by_salary"
         self.count_job_by_category_key = "count_job_by_category"
-        self.count_job_active_key = "count_job_active"
-        self.count_job_24h_key = "count_job_24h"
         self.job_cruiment_demand_key = "job_cruiment_demand"
         self.job_info_key = "job_info"
         self.user_search_key = "user_search"
+        self.job_facets_key = "job_facets"
+        self.catalogue_generation_key = "catalogue_generation"
+        self.job_info_codec = ModelCodec(JobItemResponse)
+        self.user_search_codec = ModelCodec(List[JobItemResponse])
+        # searches churn too fast to be worth tracking
+        self.tracking_prefixes = [self.key_prefix + self.job_info_key]
+
+    async def get_catalogue_generation(self, redis: Redis) -> int:
+        return await self.get_number(redis, self.catalogue_generation_key) or 0
+
+    async def bump_catalogue_generation(self, redis: Redis):
+        await self.incr(redis, self.catalogue_generation_key)
 
     async def cache_count_search_by_user(self, redis: Redis, key: str, value: int):
         expire_time = 60 * 60
@@ -43,78 +57,119 @@ class JobCacheService(BaseCache):
         response = await self.get_list(redis, self.province_district_search_key + key)
         return response if response else None
 
-    async def cache_count_job_by_salary(self, redis: Redis, value: list):
-        expire_time = 60 * 60 * 12
-        value = [(idx, count) for (idx, count) in value]
-        await self.set_list(redis, self.count_job_by_salary_key, value, expire_time)
+    def get_job_info_expire_time(self, value: JobItemResponse) -> int:
+        deadline = datetime.fromisoformat(str(value.deadline))
+        expire_time = int((deadline - datetime.now()).total_seconds())
+        return expire_time > 0 and expire_time or 60 * 60 * 24 * 7
 
-    async def get_cache_count_job_by_salary(self, redis: Redis) -> list:
-        response = await self.get_list(redis, self.count_job_by_salary_key)
-        return response if response else None
+    def get_job_info_tags(self, value: JobItemResponse) -> List[str]:
+        """Tags of the entities embedded in a job card"""
 
-    async def cache_count_job_by_category(self, redis: Redis, value: list):
-        expire_time = 60 * 60 * 12
-        await self.set_list(redis, self.count_job_by_category_key, value, expire_time)
+        def get_id(item) -> int:
+            return item["id"] if isinstance(item, dict) else item.id
 
-    async def get_cache_count_job_by_category(self, redis: Redis) -> list:
-        response = await self.get_list(redis, self.count_job_by_category_key)
-        return response if response else None
+        tags = [self.job_tag(value.id)]
+        if value.company:
+            tags.append(self.company_tag(get_id(value.company)))
+        tags.extend(self.category_tag(get_id(item)) for item in value.categories)
+        tags.extend(
+            self.skill_tag(get_id(item))
+            for item in value.must_have_skills + value.should_have_skills
+        )
+        return tags
 
-    async def cache_count_job_active(self, redis: Redis, value: int):
-        expire_time = 60 * 60 * 12
-        await self.set(redis, self.count_job_active_key, value, expire_time)
+    def job_tag(self, id: int) -> str:
+        return f"job:{id}"
 
-    async def get_cache_count_job_active(self, redis: Redis) -> int:
-        response = await self.get(redis, self.count_job_active_key)
-        return int(response) if response else None
+    def company_tag(self, id: int) -> str:
+        return f"company:{id}"
 
-    async def cache_count_job_24h(self, redis: Redis, value: int):
-        expire_time = 60 * 60 * 12
-        await self.set(redis, self.count_job_active_key, value, expire_time)
+    def category_tag(self, id: int) -> str:
+        return f"category:{id}"
 
-    async def get_cache_count_job_24h(self, redis: Redis) -> int:
-        response = await self.get(redis, self.count_job_active_key)
-        return int(response) if response else None
-
-    async def cache_job_cruiment_demand(self, redis: Redis, value: object):
-        expire_time = 60 * 60 * 12
-        await self.set(
-            redis, self.job_cruiment_demand_key, json.dumps(value), expire_time
-        )
-
-    async def get_cache_job_cruiment_demand(self, redis: Redis) -> object:
-        response = await self.get(redis, self.job_cruiment_demand_key)
-        return json.loads(response) if response else None
+    def skill_tag(self, id: int) -> str:
+        return f"skill:{id}"
 
     async def cache_job_info(self, redis: Redis, key: int, value: JobItemResponse):
-        deadline = str(value.deadline)
-        value = json.dumps(value.model_dump(), default=str)
-        expire_time = int(
-            (datetime.fromisoformat(deadline) - datetime.now()).total_seconds()
-        )
+        expire_time = self.get_job_info_expire_time(value)
         await self.set(
             redis,
             self.job_info_key + str(key),
-            value,
-            expire_time > 0 and expire_time or 60 * 60 * 24 * 7,
+            self.job_info_codec.dumps(value),
+            expire_time,
+        )
+        await self.add_tags(
+            redis,
+            self.job_info_key + str(key),
+            self.get_job_info_tags(value),
+            expire_time,
+        )
+
+    async def cache_many_job_info(self, redis: Redis, values: List[JobItemResponse]):
+        items = [
+            (
+                self.job_info_key + str(value.id),
+                self.job_info_codec.dumps(value),
+                self.get_job_info_expire_time(value),
+            )
+            for value in values
+        ]
+        await self.set_many(redis, items)
+        await self.add_many_tags(
+            redis,
+            [
+                (key, self.get_job_info_tags(value), expire_time)
+                for (key, _, expire_time), value in zip(items, values)
+            ],
         )
 
     async def delete_job_info(self, redis: Redis, key: int):
         await self.delete(redis, self.job_info_key + str(key))
+        await self.invalidate_tags(redis, [self.job_tag(key)])
 
     async def get_cache_job_info(self, redis: Redis, key: int) -> JobItemResponse:
-        response = await self.get(redis, self.job_info_key + str(key))
-        return JobItemResponse(**json.loads(response)) if response else None
+        responses = await self.get_many_decoded(
+            redis, [self.job_info_key + str(key)], self.job_info_codec.loads
+        )
+        return responses[0]
+
+    async def get_many_job_info(
+        self, redis: Redis, keys: List[int]
+    ) -> Tuple[Dict[int, JobItemResponse], List[int]]:
+        values = await self.get_many_decoded(
+            redis,
+            [self.job_info_key + str(key) for key in keys],
+            self.job_info_codec.loads,
+        )
+        hits, misses = {}, []
+        for key, value in zip(keys, values):
+            if value:
+                hits[key] = value
+            else:
+                misses.append(key)
+        return hits, misses
+
+    async def cache_job_facets(self, redis: Redis, key: str, value: dict):
+        expire_time = 60 * 10
+        await self.set(
+            redis,
+            self.job_facets_key + key,
+            json.dumps(value, default=str),
+            expire_time,
+        )
+
+    async def get_cache_job_facets(self, redis: Redis, key: str) -> dict:
+        response = await self.get(redis, self.job_facets_key + key)
+        return json.loads(response) if response else None
 
     async def cache_user_search(
         self, redis: Redis, key: str, value: List[JobItemResponse]
     ):
         expire_time = 60
-        serialized_value = [job.model_dump() for job in value]
         await self.set(
             redis,
             self.user_search_key + key,
-            json.dumps(serialized_value, default=str),
+            self.user_search_codec.dumps(value),
             expire_time,
         )
 
@@ -122,11 +177,7 @@ class JobCacheService(BaseCache):
         self, redis: Redis, key: str
     ) -> List[JobItemResponse]:
         response = await self.get(redis, self.user_search_key + key)
-        return (
-            [JobItemResponse(**job) for job in json.loads(response)]
-            if response
-            else None
-        )
+        return self.user_search_codec.loads(response)
 
 
 job_cache_service = JobCacheService()
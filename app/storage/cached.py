@@ -0,0 +1,151 @@
+import functools
+import inspect
+import json
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.loggers import get_logger
+from app.storage.base_cache import BaseCache
+
+logger = get_logger(__name__)
+
+cache_bypass: ContextVar[bool] = ContextVar("cache_bypass", default=False)
+
+
+async def bypass_cache(request: Request):
+    """Route dependency that lets a benchmark skip the @cached lookups
+
+    A request sending `X-Cache-Bypass: 1` runs uncached while
+    CACHE_BYPASS_ENABLED is on; it is off by default so clients can not
+    force database work in production.
+    """
+    if settings.CACHE_BYPASS_ENABLED and request.headers.get("X-Cache-Bypass") == "1":
+        cache_bypass.set(True)
+
+
+class CachedStats:
+    outcomes = ("hit", "miss", "error", "bypass")
+
+    def __init__(self):
+        self.counts = {outcome: 0 for outcome in self.outcomes}
+        self.seconds = {outcome: 0.0 for outcome in self.outcomes}
+
+    def record(self, outcome: str, seconds: float):
+        self.counts[outcome] += 1
+        self.seconds[outcome] += seconds
+
+    def get_stats(self) -> dict:
+        total = self.counts["hit"] + self.counts["miss"]
+        return {
+            **{
+                outcome: {
+                    "count": count,
+                    "avg_ms": (
+                        round(self.seconds[outcome] / count * 1000, 3) if count else 0.0
+                    ),
+                }
+                for outcome, count in self.counts.items()
+            },
+            "hit_ratio": round(self.counts["hit"] / total, 4) if total else 0.0,
+        }
+
+
+class cached:
+    """Cache the result of an async function through `cache.get_or_compute`
+
+    The function must take a `redis` argument. `key` is a `str.format` template over
+    the bound arguments (e.g. "province{id}", "district{page.key}_{province_id}").
+    `tags` are templates too and register the key for tag invalidation. With
+    `fallback`, a failing cache layer calls the function directly instead of
+    raising.
+    """
+
+    registry: Dict[str, "cached"] = {}
+
+    def __init__(
+        self,
+        cache: BaseCache,
+        key: str,
+        *,
+        expire: int = None,
+        codec: Any = None,
+        tags: List[str] = None,
+        stale_expire: int = 60,
+        early_refresh: float = 0,
+        fallback: bool = True,
+    ):
+        self.cache = cache
+        self.key = key
+        self.expire = expire
+        self.encode: Callable[[Any], Any] = codec.dumps if codec else json.dumps
+        self.decode: Callable[[Any], Any] = codec.loads if codec else json.loads
+        self.tags = tags or []
+        self.stale_expire = stale_expire
+        self.early_refresh = early_refresh
+        self.fallback = fallback
+        self.stats = CachedStats()
+
+    @classmethod
+    def get_all_stats(cls) -> Dict[str, dict]:
+        return {name: item.stats.get_stats() for name, item in cls.registry.items()}
+
+    def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+        cached.registry[func.__qualname__] = self
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            if cache_bypass.get():
+                value = await func(*args, **kwargs)
+                self.stats.record("bypass", time.perf_counter() - started)
+                return value
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            redis = arguments["redis"]
+            key = self.key.format(**arguments)
+            computed = False
+
+            async def compute():
+                nonlocal computed
+                computed = True
+                return await func(*args, **kwargs)
+
+            try:
+                value = await self.cache.get_or_compute(
+                    redis,
+                    key,
+                    compute,
+                    encode=self.encode,
+                    decode=self.decode,
+                    expire=self.expire,
+                    stale_expire=self.stale_expire,
+                    early_refresh=self.early_refresh,
+                )
+            except Exception as e:
+                if computed or not self.fallback:
+                    raise
+                logger.error(f"Cache failed for {self.cache.key_prefix + key}: {e}")
+                value = await func(*args, **kwargs)
+                self.stats.record("error", time.perf_counter() - started)
+                return value
+
+            if computed and self.tags and value is not None:
+                await self.cache.add_tags(
+                    redis,
+                    key,
+                    [tag.format(**arguments) for tag in self.tags],
+                    (self.expire or self.cache.expire) + self.stale_expire,
+                )
+            self.stats.record(
+                "miss" if computed else "hit", time.perf_counter() - started
+            )
+            return value
+
+        wrapper.cached = self
+        return wrapper
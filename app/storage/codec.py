@@ -0,0 +1,97 @@
+import time
+from typing import Any, Dict, Optional
+
+import zstandard
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+
+class ModelCodec:
+    """Serialize cache payloads with pydantic-core's JSON encoder.
+
+    Payloads start with a format byte, `version` for plain JSON or
+    `compressed_version` for zstd frames of JSON larger than
+    CACHE_COMPRESS_MIN_SIZE. Entries written by another version, including plain
+    `json.dumps` values, decode to None and count as a miss.
+    """
+
+    version = b"\x01"
+    compressed_version = b"\x02"
+    instances: Dict[str, "ModelCodec"] = {}
+
+    def __init__(self, type_: Any):
+        self.adapter = TypeAdapter(type_)
+        self.name = getattr(type_, "__name__", None) or str(type_)
+        self.min_size = (
+            settings.CACHE_COMPRESS_MIN_SIZE if settings.CACHE_COMPRESS_ENABLED else 0
+        )
+        self.compressor = zstandard.ZstdCompressor(level=settings.CACHE_COMPRESS_LEVEL)
+        self.decompressor = zstandard.ZstdDecompressor()
+        self.encoded = 0
+        self.compress_calls = 0
+        self.compressed = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+        self.compress_seconds = 0.0
+        self.decompressed = 0
+        self.decompress_seconds = 0.0
+        ModelCodec.instances[self.name] = self
+
+    @classmethod
+    def get_all_stats(cls) -> Dict[str, dict]:
+        return {name: codec.get_stats() for name, codec in cls.instances.items()}
+
+    def get_stats(self) -> dict:
+        return {
+            "encoded": self.encoded,
+            "compressed": self.compressed,
+            "raw_bytes": self.raw_bytes,
+            "stored_bytes": self.stored_bytes,
+            "ratio": (
+                round(self.raw_bytes / self.stored_bytes, 3)
+                if self.stored_bytes
+                else 0.0
+            ),
+            "compress_avg_ms": (
+                round(self.compress_seconds / self.compress_calls * 1000, 3)
+                if self.compress_calls
+                else 0.0
+            ),
+            "decompress_avg_ms": (
+                round(self.decompress_seconds / self.decompressed * 1000, 3)
+                if self.decompressed
+                else 0.0
+            ),
+        }
+
+    def dumps(self, value: Any) -> bytes:
+        data = self.adapter.dump_json(value)
+        self.encoded += 1
+        self.raw_bytes += len(data)
+        if self.min_size and len(data) >= self.min_size:
+            started = time.perf_counter()
+            compressed = self.compressor.compress(data)
+            self.compress_seconds += time.perf_counter() - started
+            self.compress_calls += 1
+            if len(compressed) < len(data):
+                self.compressed += 1
+                self.stored_bytes += len(compressed)
+                return self.compressed_version + compressed
+        self.stored_bytes += len(data)
+        return self.version + data
+
+    def loads(self, data: Optional[bytes]) -> Any:
+        if not data:
+            return None
+        if data[:1] == self.compressed_version:
+            started = time.perf_counter()
+            try:
+                data = self.version + self.decompressor.decompress(data[1:])
+            except zstandard.ZstdError:
+                return None
+            self.decompressed += 1
+            self.decompress_seconds += time.perf_counter() - started
+        if data[:1] != self.version:
+            return None
+        return self.adapter.validate_json(data[1:])
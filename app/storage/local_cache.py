@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class LocalCache:
+    """Bounded in-process LRU whose entries expire on their own TTL
+
+    `version` counts invalidations. A caller reads it before fetching a value
+    from Redis and passes it to `set`, which drops the value when its key was
+    invalidated in between. Invalidations of other keys do not matter.
+    """
+
+    def __init__(self, max_size: int, expire: int):
+        self.max_size = max_size
+        self.expire = expire
+        self.items: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self.version = 0
+        # key -> version of its last invalidation, the oldest are forgotten
+        self.invalidated: OrderedDict[str, int] = OrderedDict()
+        # values read before this version are dropped whatever their key
+        self.invalidated_before = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        item = self.items.get(key)
+        if item is None or item[0] <= time.monotonic():
+            if item is not None:
+                del self.items[key]
+            self.misses += 1
+            return None
+
+        self.items.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def set(
+        self, key: str, value: Any, expire: Optional[float] = None, version: int = None
+    ):
+        """Store unless `key` was invalidated since `version` was read"""
+        if version is not None and (
+            version < self.invalidated_before or self.invalidated.get(key, 0) > version
+        ):
+            return
+        expire = min(expire, self.expire) if expire and expire > 0 else self.expire
+        self.items[key] = (time.monotonic() + expire, value)
+        self.items.move_to_end(key)
+        while len(self.items) > self.max_size:
+            self.items.popitem(last=False)
+
+    def delete(self, key: str):
+        self.version += 1
+        self.invalidated[key] = self.version
+        self.invalidated.move_to_end(key)
+        if len(self.invalidated) > self.max_size:
+            _, version = self.invalidated.popitem(last=False)
+            self.invalidated_before = max(self.invalidated_before, version)
+        self.items.pop(key, None)
+
+    def clear(self):
+        self.version += 1
+        self.invalidated.clear()
+        self.invalidated_before = self.version
+        self.items.clear()
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self.items),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,57 @@
+from redis.asyncio import Redis
+from sqlalchemy.orm import Session
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.loggers import get_logger
+from app.storage.base_cache import BaseCache
+
+logger = get_logger(__name__)
+
+
+class Lookup:
+    """In-process copy of a small table keyed by id, e.g. categories
+
+    Reloaded when an id is missing or after `expire` seconds. `invalidate`
+    drops it on every worker through the local cache invalidation channel.
+    """
+
+    key_prefix = "lookup:"
+
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[Session], Dict[int, Any]],
+        expire: int = None,
+    ):
+        self.key = self.key_prefix + name
+        self.load = load
+        self.expire = expire or settings.LOOKUP_EXPIRE
+        self.values: Dict[int, Any] = {}
+        self.loaded_at: Optional[float] = None
+        BaseCache.lookups.append(self)
+
+    def is_expired(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.expire
+
+    def get(self, db: Session, ids: List[int]) -> Dict[int, Any]:
+        if self.is_expired() or any(
+            id not in self.values for id in ids if id is not None
+        ):
+            self.values = self.load(db)
+            self.loaded_at = time.monotonic()
+        return self.values
+
+    def clear(self):
+        self.values = {}
+        self.loaded_at = None
+
+    async def invalidate(self, redis: Redis):
+        """Drop the lookup here and on every other worker"""
+        self.clear()
+        try:
+            await redis.publish(BaseCache.invalidation_channel, json.dumps([self.key]))
+        except Exception as e:
+            logger.error(f"Failed to publish lookup invalidation: {e}")
@@ -1,15 +1,45 @@
 from redis.asyncio import Redis, ConnectionPool
+from redis.asyncio.cluster import RedisCluster
+from redis.asyncio.sentinel import Sentinel
 import json
-from typing import Any, Optional, Annotated
+from typing import Any, AsyncIterator, Dict, List, Optional, Annotated, Set
 from fastapi import Depends
 
 from app.core.config import settings
-from typing import Set, Any, Optional
 from app.core.loggers import get_logger
 
 logger = get_logger(__name__)
 
 
+def is_cluster(redis: Redis) -> bool:
+    return isinstance(redis, RedisCluster)
+
+
+async def scan_batches(
+    redis: Redis, pattern: str, count: int = 1000
+) -> AsyncIterator[List[str]]:
+    """Iterate Keys by Pattern, one SCAN page at a time
+
+    SCAN only walks the keyspace of the node it is sent to, so a cluster is
+    scanned primary by primary.
+    """
+    nodes = redis.get_primaries() if is_cluster(redis) else [None]
+    for node in nodes:
+        cursor = 0
+        while True:
+            if node is None:
+                cursor, keys = await redis.scan(cursor, match=pattern, count=count)
+            else:
+                cursors, keys = await redis.scan(
+                    cursor, match=pattern, count=count, target_nodes=node
+                )
+                cursor = cursors[node.name]
+            if keys:
+                yield [key.decode() if isinstance(key, bytes) else key for key in keys]
+            if not cursor:
+                break
+
+
 class RedisBackend:
     def __init__(
         self,
@@ -18,16 +48,62 @@ class RedisBackend:
         password: str,
         db: int,
         expire: int,
+        max_connections: int = 10,
+        mode: str = "standalone",
     ):
         self.expire = expire
-        self.connection_pool = ConnectionPool(
-            host=host,
-            port=port,
-            password=password,
-            db=db,
-            max_connections=settings.REDIS_MAX_CONNECTIONS or 10,
-        )
-        self.connection = Redis(connection_pool=self.connection_pool)
+        self.mode = mode
+        if mode == "cluster":
+            # cluster clients keep one pool per node, db is always 0
+            self.connection = RedisCluster(
+                host=host,
+                port=port,
+                password=password or None,
+                max_connections=max_connections,
+            )
+        elif mode == "sentinel":
+            sentinel = Sentinel(
+                [
+                    (node.split(":")[0], int(node.split(":")[1]))
+                    for node in settings.REDIS_SENTINELS
+                ],
+                sentinel_kwargs={"password": settings.REDIS_SENTINEL_PASSWORD or None},
+            )
+            self.connection = sentinel.master_for(
+                settings.REDIS_SENTINEL_MASTER,
+                password=password or None,
+                db=db,
+                max_connections=max_connections,
+            )
+        else:
+            self.connection = Redis(
+                connection_pool=ConnectionPool(
+                    host=host,
+                    port=port,
+                    password=password,
+                    db=db,
+                    max_connections=max_connections,
+                )
+            )
+        self.connection_pool = getattr(self.connection, "connection_pool", None)
+
+    def get_pool_stats(self) -> dict:
+        if self.mode == "cluster":
+            nodes = self.connection.get_nodes()
+            max_connections = sum(node.max_connections for node in nodes)
+            available = sum(len(node._free) for node in nodes)
+            in_use = sum(len(node._connections) for node in nodes) - available
+        else:
+            max_connections = self.connection_pool.max_connections
+            available = len(self.connection_pool._available_connections)
+            in_use = len(self.connection_pool._in_use_connections)
+        return {
+            "mode": self.mode,
+            "max_connections": max_connections,
+            "in_use": in_use,
+            "available": available,
+            "usage": round(in_use / max_connections, 4) if max_connections else 0.0,
+        }
 
     async def get(self, key: str) -> Any:
         """Get Value from Key"""
@@ -42,17 +118,50 @@ class RedisBackend:
 
     async def keys(self, pattern: str) -> Set[str]:
         """Get Keys by Pattern"""
-        return await self.connection.keys(pattern)
+        return {key async for key in self.scan_iter(pattern)}
+
+    async def scan_iter(self, pattern: str, count: int = 1000) -> AsyncIterator[str]:
+        """Iterate Keys by Pattern with SCAN, without blocking the server"""
+        async for keys in self.scan_batches(pattern, count):
+            for key in keys:
+                yield key
+
+    async def scan_batches(
+        self, pattern: str, count: int = 1000
+    ) -> AsyncIterator[List[str]]:
+        """Iterate Keys by Pattern, one SCAN page at a time"""
+        async for keys in scan_batches(self.connection, pattern, count):
+            yield keys
+
+    async def unlink(self, keys: List[str]) -> int:
+        """Delete Keys, freeing their memory in the background"""
+        if not keys:
+            return 0
+        return await self.connection.unlink(*keys)
+
+    async def purge(self, pattern: str, count: int = 1000) -> int:
+        """Delete Keys by Pattern, one SCAN page per UNLINK"""
+        deleted = 0
+        async for keys in self.scan_batches(pattern, count):
+            deleted += await self.unlink(keys)
+        return deleted
 
     async def set_list(self, key: str, value: list, expire: int = None):
-        """Set Value to Key"""
-        for v in value:
-            await self.connection.rpush(key, json.dumps(v))
-        await self.connection.expire(key, expire or self.expire)
+        """Replace List at Key in one MULTI/EXEC round-trip"""
+        transaction = not is_cluster(self.connection)
+        async with self.connection.pipeline(transaction=transaction) as pipe:
+            pipe.delete(key)
+            if value:
+                pipe.rpush(key, *[json.dumps(v) for v in value])
+                pipe.expire(key, expire or self.expire)
+            await pipe.execute()
 
     async def get_list(self, key: str) -> list:
         """Get Value from Key"""
-        return [json.loads(v) for v in await self.connection.lrange(key, 0, -1)]
+        values = await self.connection.lrange(key, 0, -1)
+        if not values:
+            return []
+        return json.loads(b"[" + b",".join(values) + b"]")
 
     async def set_dict(self, key: str, value: dict, expire: int = None):
         """Set Value to Key"""
@@ -69,36 +178,87 @@ class RedisBackend:
 
 
 class RedisDependency:
-    redis: Optional[RedisBackend] = None
+    """Lazily connected client of one workload, each workload owns its pool"""
+
+    instances: Dict[str, "RedisDependency"] = {}
+
+    def __init__(self, purpose: str, max_connections: int):
+        self.purpose = purpose
+        self.max_connections = max_connections
+        self.redis: Optional[RedisBackend] = None
+        RedisDependency.instances[purpose] = self
 
     async def __call__(self):
         return self.redis
 
+    def create_backend(self) -> RedisBackend:
+        mode = settings.REDIS_MODE
+        if mode == "cluster" and self.purpose == "pubsub":
+            # the cluster client has no pub/sub, messages reach every node anyway
+            mode = "standalone"
+        return RedisBackend(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            password=settings.REDIS_PASSWORD,
+            db=settings.REDIS_DB,
+            expire=settings.REDIS_EXPIRE,
+            max_connections=self.max_connections or 10,
+            mode=mode,
+        )
+
     async def init(self):
         try:
-            self.redis = RedisBackend(
-                host=settings.REDIS_HOST,
-                port=settings.REDIS_PORT,
-                password=settings.REDIS_PASSWORD,
-                db=settings.REDIS_DB,
-                expire=settings.REDIS_EXPIRE,
-            )
+            self.redis = self.create_backend()
             await self.redis.connection.ping()
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
+            logger.error(f"Failed to connect to Redis ({self.purpose}): {e}")
 
     async def close(self):
         if self.redis:
             await self.redis.connection.close()
+            if self.redis.connection_pool:
+                # a client does not close the pool it was given
+                await self.redis.connection_pool.disconnect()
 
     async def get_redis(self):
+        if self.redis is None:
+            await self.init()
         return self.redis.connection
 
+    @classmethod
+    async def init_all(cls):
+        for dependency in cls.instances.values():
+            await dependency.init()
 
-redis_dependency = RedisDependency()
+    @classmethod
+    async def close_all(cls):
+        for dependency in cls.instances.values():
+            await dependency.close()
+
+    @classmethod
+    def get_all_pool_stats(cls) -> Dict[str, dict]:
+        return {
+            purpose: dependency.redis.get_pool_stats() if dependency.redis else None
+            for purpose, dependency in cls.instances.items()
+        }
+
+
+redis_dependency = RedisDependency("cache", settings.REDIS_MAX_CONNECTIONS)
+pubsub_redis_dependency = RedisDependency(
+    "pubsub", settings.REDIS_PUBSUB_MAX_CONNECTIONS
+)
+counter_redis_dependency = RedisDependency(
+    "counter", settings.REDIS_COUNTER_MAX_CONNECTIONS
+)
 
 
 async def get_redis() -> Redis:
-    if redis_dependency.redis is None:
-        await redis_dependency.init()
     return await redis_dependency.get_redis()
+
+
+async def get_pubsub_redis() -> Redis:
+    return await pubsub_redis_dependency.get_redis()
+
+
+async def get_counter_redis() -> Redis:
+    return await counter_redis_dependency.get_redis()
@@ -0,0 +1,182 @@
+from datetime import datetime, date
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.storage.base_facet_index import BaseFacetIndex
+from app.core.config import settings
+from app.core import constant
+from app.hepler.enum import SalaryType
+
+
+class JobFacetIndex(BaseFacetIndex):
+    """Facet bitmaps of published jobs, used to count search results"""
+
+    # search filter -> facet
+    filter_facets = {
+        "company_id": "company",
+        "field_id": "field",
+        "province_id": "province",
+        "district_id": "district",
+        "category_id": "category",
+        "employment_type": "employment_type",
+        "job_experience_id": "experience",
+        "job_position_id": "position",
+        "salary_type": "salary_type",
+    }
+    # filters the index can not answer
+    unsupported_filters = ["min_salary", "max_salary", "updated_at"]
+
+    def __init__(self):
+        super().__init__(settings.JOB_FACET_INDEX_REFRESH_SECONDS)
+
+    @staticmethod
+    def get_salary_band(salary_type, min_salary, max_salary) -> int:
+        """Mirror the salary buckets of jobCRUD.count_job_by_salary"""
+        salary_ranges = constant.SALARY_RANGES
+        unit = constant.SALARY_UNIT
+        if min_salary is not None and max_salary is not None:
+            for idx, (min, max, range_type) in enumerate(salary_ranges):
+                if (
+                    salary_type == range_type
+                    and min_salary >= min * unit
+                    and max_salary < max * unit
+                ):
+                    return idx
+        if salary_type == SalaryType.DEAL:
+            return len(salary_ranges)
+        if salary_type == SalaryType.USD:
+            return len(salary_ranges) + 1
+        return len(salary_ranges) + 2
+
+    def get_documents(self, rows: dict) -> Dict[int, Dict[str, List[Any]]]:
+        """Turn jobCRUD.get_facet_rows into facet values per job"""
+        documents = {}
+        for (
+            job_id,
+            company_id,
+            employment_type,
+            job_experience_id,
+            job_position_id,
+            salary_type,
+            min_salary,
+            max_salary,
+            deadline,
+        ) in rows["jobs"]:
+            documents[job_id] = {
+                "company": [company_id],
+                "employment_type": [employment_type],
+                "experience": [job_experience_id],
+                "position": [job_position_id],
+                "salary_type": [salary_type],
+                "salary_band": [
+                    self.get_salary_band(salary_type, min_salary, max_salary)
+                ],
+                "deadline": [deadline],
+                "province": [],
+                "district": [],
+                "location": [],
+                "category": [],
+                "field": [],
+            }
+
+        for job_id, province_id, district_id in rows["locations"]:
+            if job_id not in documents:
+                continue
+            document = documents[job_id]
+            if province_id not in document["province"]:
+                document["province"].append(province_id)
+            if district_id not in document["district"]:
+                document["district"].append(district_id)
+            if (province_id, district_id) not in document["location"]:
+                document["location"].append((province_id, district_id))
+
+        for job_id, category_id in rows["categories"]:
+            if job_id in documents and category_id not in documents[job_id]["category"]:
+                documents[job_id]["category"].append(category_id)
+
+        for job_id, field_id in rows["fields"]:
+            if job_id in documents and field_id not in documents[job_id]["field"]:
+                documents[job_id]["field"].append(field_id)
+
+        return documents
+
+    def load(self, rows: dict):
+        self.build(self.get_documents(rows))
+
+    def update(self, job_ids: List[int], rows: dict):
+        """Re-index the given jobs; jobs missing from rows are dropped"""
+        self.update_documents(job_ids, self.get_documents(rows))
+
+    def can_filter(self, filters: dict, job_ids: Optional[List[int]] = None) -> bool:
+        if filters.get("keyword") and job_ids is None:
+            return False
+        return not any(filters.get(name) for name in self.unsupported_filters)
+
+    def get_live(self, today: Optional[date] = None) -> int:
+        """Jobs whose deadline has not passed yet
+
+        Jobs past their deadline are dropped from the index as they expire,
+        so only the distinct deadlines are compared, not their bitmaps.
+        """
+        today = today or datetime.now().date()
+        deadlines = self.bitmaps.get("deadline", {})
+        for deadline in [deadline for deadline in deadlines if deadline <= today]:
+            for job_id in self.to_ids(deadlines.get(deadline, 0)):
+                self.remove(job_id)
+        return self.all
+
+    def get_bitmap(self, filters: dict, job_ids: Optional[List[int]] = None) -> int:
+        """Bitmap of live jobs matching the search filters"""
+        bitmap = self.get_live()
+        if job_ids is not None:
+            bitmap &= self.to_bitmap(job_ids)
+        facet_filters = {
+            facet: filters.get(name) or None
+            for name, facet in self.filter_facets.items()
+        }
+        province_id = filters.get("province_id")
+        district_id = filters.get("district_id")
+        if province_id and district_id:
+            # both must match the same work location
+            facet_filters["province"] = None
+            facet_filters["district"] = None
+            facet_filters["location"] = (province_id, district_id)
+        return self.intersect(facet_filters, bitmap)
+
+    def count_jobs_of_district(
+        self,
+        bitmap: int,
+        province_id: Optional[int] = None,
+        district_id: Optional[int] = None,
+    ) -> List[Tuple[int, int]]:
+        """(district_id, count) of the jobs, within the filtered location"""
+        response: Dict[int, int] = {}
+        for (province, district), location_bitmap in self.bitmaps.get(
+            "location", {}
+        ).items():
+            if province_id and province != province_id:
+                continue
+            if district_id and district != district_id:
+                continue
+            count = (location_bitmap & bitmap).bit_count()
+            if count:
+                response[district] = response.get(district, 0) + count
+        return list(response.items())
+
+    def get_facet_counts(
+        self,
+        bitmap: int,
+        province_id: Optional[int] = None,
+        district_id: Optional[int] = None,
+    ) -> dict:
+        """Every sidebar facet of the jobs in one pass over the bitmaps"""
+        return {
+            "count": self.count(bitmap),
+            "district": self.count_jobs_of_district(bitmap, province_id, district_id),
+            "category": self.breakdown("category", bitmap),
+            "salary_band": self.breakdown("salary_band", bitmap),
+            "experience": self.breakdown("experience", bitmap),
+            "employment_type": self.breakdown("employment_type", bitmap),
+        }
+
+
+job_facet_index = JobFacetIndex()
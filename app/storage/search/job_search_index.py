@@ -0,0 +1,39 @@
+from redis.asyncio import Redis
+from typing import List, Optional
+
+from app.storage.base_search_index import BaseSearchIndex
+from app.hepler.common import CommonHelper
+from app.model import Job
+
+
+class JobSearchIndex(BaseSearchIndex):
+    def __init__(self):
+        super().__init__("job_search_index_")
+        self.title_weight = 4
+        self.skill_weight = 2
+        self.content_weight = 1
+
+    def get_fields(self, job: Job) -> list:
+        skills = {skill.id: skill.name for skill in job.must_have_skills}
+        skills.update({skill.id: skill.name for skill in job.should_have_skills})
+        return [
+            (job.title, self.title_weight),
+            (" ".join(skills.values()), self.skill_weight),
+            (str(CommonHelper.json_loads(job.job_description)), self.content_weight),
+            (str(CommonHelper.json_loads(job.job_requirement)), self.content_weight),
+        ]
+
+    async def index_job(self, redis: Redis, job: Job):
+        await self.index_document(redis, job.id, self.get_fields(job))
+
+    async def remove_job(self, redis: Redis, job_id: int):
+        await self.remove_document(redis, job_id)
+
+    async def search_job_ids(self, redis: Redis, keyword: str) -> Optional[List[int]]:
+        response = await self.search(redis, keyword)
+        if response is None:
+            return None
+        return [job_id for job_id, _ in response]
+
+
+job_search_index = JobSearchIndex()
@@ -0,0 +1,104 @@
+"""Redis maintenance commands, safe to run against production.
+
+Keys are walked with SCAN and deleted with UNLINK one page at a time, so the
+server keeps serving other clients between batches.
+
+    python -m app.storage.tools inspect job_cache_job_info
+    python -m app.storage.tools purge job_cache_job_info --batch-size 500
+"""
+
+import argparse
+import asyncio
+import json
+import re
+from collections import Counter
+
+from app.storage.base_cache import BaseCache
+from app.storage.redis import RedisBackend, redis_dependency
+
+
+def get_pattern(prefix: str) -> str:
+    """Match every key starting with Prefix, glob characters taken literally"""
+    return re.sub(r"([*?\[\]\\])", r"\\\1", prefix) + "*"
+
+
+async def inspect(redis: RedisBackend, prefix: str, batch_size: int, sample: int):
+    total = 0
+    types = Counter()
+    samples = []
+    async for keys in redis.scan_batches(get_pattern(prefix), batch_size):
+        async with redis.connection.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.type(key)
+                pipe.ttl(key)
+            responses = await pipe.execute()
+        total += len(keys)
+        for index, key in enumerate(keys):
+            key_type, ttl = responses[2 * index], responses[2 * index + 1]
+            types[key_type.decode()] += 1
+            if len(samples) < sample:
+                samples.append((key, key_type.decode(), ttl))
+
+    print(f"{total} keys match {prefix!r}")
+    for key_type, count in types.most_common():
+        print(f"  {key_type}: {count}")
+    for key, key_type, ttl in samples:
+        print(f"  {key} ({key_type}, ttl {ttl})")
+
+
+async def purge(
+    redis: RedisBackend, prefix: str, batch_size: int, pause: float, dry_run: bool
+):
+    deleted = 0
+    async for keys in redis.scan_batches(get_pattern(prefix), batch_size):
+        if dry_run:
+            deleted += len(keys)
+            continue
+        deleted += await redis.unlink(keys)
+        # drop the keys from the in-process tier of running workers
+        await redis.connection.publish(BaseCache.invalidation_channel, json.dumps(keys))
+        if pause:
+            await asyncio.sleep(pause)
+
+    action = "would delete" if dry_run else "deleted"
+    print(f"{action} {deleted} keys matching {prefix!r}")
+
+
+async def main(args: argparse.Namespace):
+    redis = redis_dependency.create_backend()
+    try:
+        if args.command == "inspect":
+            await inspect(redis, args.prefix, args.batch_size, args.sample)
+        else:
+            await purge(redis, args.prefix, args.batch_size, args.pause, args.dry_run)
+    finally:
+        await redis.connection.close()
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.storage.tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    inspect_parser = commands.add_parser("inspect", help="Count keys by prefix.")
+    inspect_parser.add_argument("prefix")
+    inspect_parser.add_argument("--batch-size", type=int, default=1000)
+    inspect_parser.add_argument(
+        "--sample", type=int, default=10, help="Number of keys to print."
+    )
+
+    purge_parser = commands.add_parser("purge", help="Delete keys by prefix.")
+    purge_parser.add_argument("prefix")
+    purge_parser.add_argument("--batch-size", type=int, default=500)
+    purge_parser.add_argument(
+        "--pause", type=float, default=0.01, help="Seconds to wait between batches."
+    )
+    purge_parser.add_argument("--dry-run", action="store_true")
+    return parser
+
+
+if __name__ == "__main__":
+    parser = get_parser()
+    args = parser.parse_args()
+    if not args.prefix:
+        parser.error("prefix must not be empty")
+    asyncio.run(main(args))
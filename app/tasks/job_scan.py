@@ -1,15 +1,36 @@
+import asyncio
 from sqlalchemy.orm import Session
 
 from app.core.celery_app import celery_app
-from app.crud import job as job_crud
+from app.core.loggers import get_logger
+from app.crud import job as job_crud, job_search as job_search_crud
 from app.db.base import SessionLocal
+from app.storage.cache.job_cache_service import job_cache_service
+from app.storage.redis import redis_dependency
+
+logger = get_logger(__name__)
+
+
+async def bump_catalogue_generation():
+    # same REDIS_MODE (standalone, sentinel or cluster) as the API workers
+    redis = redis_dependency.create_backend()
+    try:
+        await job_cache_service.bump_catalogue_generation(redis.connection)
+    finally:
+        await redis.connection.close()
 
 
 @celery_app.task(bind=True, name="app.tasks.job_scan.scan_task")
 def scan_task(self, name: str) -> str:
     try:
         db: Session = SessionLocal()
-        job_crud.update_expired_job(db)
+        if job_crud.update_expired_job(db):
+            # the expiry is committed, a retry would find nothing to expire
+            try:
+                asyncio.run(bump_catalogue_generation())
+            except Exception as e:
+                logger.error(f"Failed to bump catalogue generation: {e}")
+        job_search_crud.remove_unpublished(db)
         return f"Task {name} executed successfully"
     except Exception as exc:
         raise self.retry(exc=exc)
@@ -0,0 +1,201 @@
+"""Time cached job detail and config list reads with client tracking on and off.
+
+Runs itself once with CACHE_CLIENT_TRACKING=false and once with true, each in a
+process of its own because the local tiers are sized when the caches are
+created. Each run starts the invalidation listener like the app does, caches
+`--jobs` job cards and one page of categories and reads each once, then times
+the cache reads of GET /user/job/{job_id} (job_cache_service.get_cache_job_info)
+and GET /category (category_service.get_list), printing the median, p95 and
+p99 latency and the share served by the local tier.
+
+It then rewrites one job card from another connection, the way another worker
+would, and prints how long this worker keeps serving the old card. With
+tracking on, Redis reports the write and the local copy is dropped.
+
+Needs Redis 6+ and no database. Benchmark keys use job ids from 900000000 and
+category page skip=100000, they are deleted at the end.
+
+    python -m benchmarks.client_tracking
+    python -m benchmarks.client_tracking --jobs 2000 --reads 20000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Awaitable, Callable, List
+
+from app.core.category.category_service import category_service
+from app.schema.category import CategoryItemResponse
+from app.schema.page import Pagination
+from app.storage.base_cache import BaseCache, cache_invalidation_listener
+from app.storage.cache.config_cache_service import config_cache_service
+from app.storage.cache.job_cache_service import job_cache_service
+from app.storage.redis import (
+    RedisDependency,
+    pubsub_redis_dependency,
+    redis_dependency,
+)
+from benchmarks.codec import get_job
+
+FIRST_JOB_ID = 900000000
+PAGE = Pagination(skip=100000, limit=100)
+# stands in for another worker, without the local tiers of this one
+writer_redis_dependency = RedisDependency("benchmark_writer", 1)
+
+
+async def measure(reads: int, read: Callable[[int], Awaitable]) -> dict:
+    timings = []
+    for index in range(reads):
+        started = time.perf_counter()
+        await read(index)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+        "p99_ms": timings[int(len(timings) * 0.99) - 1],
+    }
+
+
+def get_local_hits(cache) -> int:
+    return cache.local.hits if cache.local else 0
+
+
+async def time_stale_read(redis, job_id: int, timeout: float = 2.0) -> float:
+    """ms this worker serves the old card after another client rewrites it"""
+    job = await job_cache_service.get_cache_job_info(redis, job_id)
+    changed = job.model_copy(update={"title": "changed"})
+    await writer_redis_dependency.redis.connection.set(
+        job_cache_service.key_prefix + job_cache_service.job_info_key + str(job_id),
+        job_cache_service.job_info_codec.dumps(changed),
+    )
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        job = await job_cache_service.get_cache_job_info(redis, job_id)
+        if job.title == "changed":
+            return (time.perf_counter() - started) * 1000
+        await asyncio.sleep(0.001)
+    return None
+
+
+async def run(jobs: int, reads: int, seed: int):
+    rng = random.Random(seed)
+    await RedisDependency.init_all()
+    redis = redis_dependency.redis.connection
+    cache_invalidation_listener.start(pubsub_redis_dependency.redis.connection)
+    # let the listener subscribe and turn tracking on
+    await asyncio.sleep(0.5)
+
+    job_ids = [FIRST_JOB_ID + index for index in range(jobs)]
+    categories = [
+        CategoryItemResponse(
+            id=id, name=f"Category {id}", slug=f"category-{id}", count=id * 3
+        )
+        for id in range(1, PAGE.limit + 1)
+    ]
+    category_key = config_cache_service.category_key + PAGE.key
+    try:
+        await job_cache_service.cache_many_job_info(
+            redis, [get_job(rng, job_id, 4) for job_id in job_ids]
+        )
+        get_list = category_service.get_list.cached
+
+        async def compute():
+            return categories
+
+        await config_cache_service.get_or_compute(
+            redis,
+            category_key,
+            compute,
+            encode=get_list.encode,
+            decode=get_list.decode,
+            expire=get_list.expire,
+            stale_expire=get_list.stale_expire,
+        )
+
+        mode = "on" if BaseCache.client_tracking else "off"
+        reads_of = (
+            (
+                "job detail",
+                job_cache_service,
+                lambda index: job_cache_service.get_cache_job_info(
+                    redis, rng.choice(job_ids)
+                ),
+            ),
+            (
+                "config",
+                config_cache_service,
+                lambda index: category_service.get_list(None, redis, PAGE),
+            ),
+        )
+        # fill the local tiers, the timed reads show the steady state
+        for job_id in job_ids:
+            await job_cache_service.get_cache_job_info(redis, job_id)
+        await category_service.get_list(None, redis, PAGE)
+
+        for name, cache, read in reads_of:
+            hits = get_local_hits(cache)
+            result = await measure(reads, read)
+            local = (get_local_hits(cache) - hits) / reads
+            print(
+                f"{name:10} {mode:8} {result['median_ms']:10.3f} "
+                f"{result['p95_ms']:10.3f} {result['p99_ms']:10.3f} {local:>7.1%}"
+            )
+
+        stale_ms = await time_stale_read(redis, job_ids[0])
+        print(
+            f"{'':10} {mode:8} another client's job card write seen after "
+            + (f"{stale_ms:.1f} ms" if stale_ms is not None else "more than 2 s")
+        )
+    finally:
+        await redis.delete(
+            category_key,
+            *[
+                job_cache_service.key_prefix
+                + job_cache_service.job_info_key
+                + str(job_id)
+                for job_id in job_ids
+            ],
+        )
+        await cache_invalidation_listener.stop()
+        await RedisDependency.close_all()
+
+
+def run_modes(argv: List[str]):
+    print(
+        f"{'read':10} {'tracking':8} {'median ms':>10} {'p95 ms':>10} "
+        f"{'p99 ms':>10} {'local':>7}"
+    )
+    for tracking in ("false", "true"):
+        sys.stdout.flush()
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.client_tracking", "--single", *argv],
+            env={**os.environ, "CACHE_CLIENT_TRACKING": tracking},
+            check=True,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.client_tracking")
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--reads", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--single",
+        action="store_true",
+        help="Run once with CACHE_CLIENT_TRACKING as configured.",
+    )
+    args = parser.parse_args()
+    if args.single:
+        asyncio.run(run(args.jobs, args.reads, args.seed))
+    else:
+        run_modes([arg for arg in sys.argv[1:] if arg != "--single"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Measure ModelCodec on a synthetic job corpus.
+
+Builds JobItemResponse values of growing size (longer descriptions, then
+pages of cards). For each size it first compares the encoders the job cache
+could use, by payload bytes and by average dumps and loads time:
+
+- json: the previous `json.dumps(model_dump(), default=str)` and
+  `JobItemResponse(**json.loads(data))` path
+- orjson: the same dicts through orjson, when it is installed
+- TypeAdapter: pydantic-core `dump_json` and `validate_json`, what ModelCodec
+  uses
+
+Then it encodes the values through the codec the job cache uses and prints raw
+JSON bytes, stored bytes, and the average zstd compress and decompress time per
+value. Needs no database or Redis.
+
+    python -m benchmarks.codec
+    python -m benchmarks.codec --values 500 --level 6 --min-size 512
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, List
+
+import zstandard
+from pydantic import TypeAdapter
+
+from app.schema.job import JobItemResponse
+from app.storage.codec import ModelCodec
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+WORDS = (
+    "phát triển ứng dụng web hệ thống backend frontend kinh nghiệm làm việc "
+    "với python java golang mysql redis docker kubernetes môi trường năng "
+    "động lương thưởng hấp dẫn bảo hiểm đầy đủ đào tạo chuyên sâu thăng tiến "
+    "rõ ràng tham gia dự án khách hàng quốc tế yêu cầu tốt nghiệp đại học "
+    "chuyên ngành công nghệ thông tin kỹ năng giao tiếp làm việc nhóm tiếng anh"
+).split()
+# (label, paragraphs per text field, jobs per value)
+SIZES = [
+    ("card", 1, 1),
+    ("detail", 8, 1),
+    ("long detail", 40, 1),
+    ("page of 10", 4, 10),
+    ("page of 50", 4, 50),
+]
+
+
+def get_text(rng: random.Random, paragraphs: int) -> str:
+    # stored like the job forms send it, a JSON dumped HTML string
+    return json.dumps(
+        "".join(
+            "<p>"
+            + " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60)))
+            + "</p>"
+            for _ in range(paragraphs)
+        ),
+        ensure_ascii=False,
+    )
+
+
+def get_job(rng: random.Random, id: int, paragraphs: int) -> JobItemResponse:
+    skills = [{"id": rng.randint(1, 500), "name": rng.choice(WORDS)} for _ in range(5)]
+    return JobItemResponse(
+        id=id,
+        campaign_id=rng.randint(1, 10000),
+        title=" ".join(rng.choice(WORDS) for _ in range(6)),
+        min_salary=rng.randint(5, 20) * 1000000,
+        max_salary=rng.randint(20, 60) * 1000000,
+        job_description=get_text(rng, paragraphs),
+        job_requirement=get_text(rng, paragraphs),
+        job_benefit=get_text(rng, paragraphs),
+        phone_number_contact="0912345678",
+        full_name_contact="Nguyễn Văn An",
+        employment_type="full_time",
+        deadline=date.today() + timedelta(days=rng.randint(1, 60)),
+        quantity=rng.randint(1, 5),
+        job_location="Hà Nội",
+        job_position_id=rng.randint(1, 20),
+        job_experience_id=rng.randint(1, 8),
+        created_at=datetime.now(),
+        email_contact=json.dumps(["hr@example.com"]),
+        status="published",
+        locations=[{"province": {"id": 1, "name": "Hà Nội"}, "address": "Cầu Giấy"}],
+        categories=[{"id": rng.randint(1, 50), "name": rng.choice(WORDS)}],
+        working_times=[{"start_time": "08:00", "end_time": "17:30"}],
+        must_have_skills=skills[:3],
+        should_have_skills=skills[3:],
+        company={"id": rng.randint(1, 3000), "name": "Công ty " + rng.choice(WORDS)},
+    )
+
+
+def get_encoders(jobs: int) -> List[tuple]:
+    """(name, dumps, loads) of every encoder compared, for one job or a page"""
+
+    def dump(value) -> Any:
+        if jobs > 1:
+            return [job.model_dump() for job in value]
+        return value.model_dump()
+
+    def load(data) -> Any:
+        if jobs > 1:
+            return [JobItemResponse(**job) for job in data]
+        return JobItemResponse(**data)
+
+    adapter = TypeAdapter(List[JobItemResponse] if jobs > 1 else JobItemResponse)
+    encoders = [
+        (
+            "json",
+            lambda value: json.dumps(dump(value), default=str).encode(),
+            lambda data: load(json.loads(data)),
+        )
+    ]
+    if orjson:
+        encoders.append(
+            (
+                "orjson",
+                lambda value: orjson.dumps(dump(value), default=str),
+                lambda data: load(orjson.loads(data)),
+            )
+        )
+    encoders.append(("TypeAdapter", adapter.dump_json, adapter.validate_json))
+    return encoders
+
+
+def time_each(function: Callable, items: list) -> tuple:
+    """Results of function over items and the average ms per call"""
+    started = time.perf_counter()
+    results = [function(item) for item in items]
+    return results, (time.perf_counter() - started) * 1000 / len(items)
+
+
+def compare(label: str, values: list, jobs: int):
+    for name, dumps, loads in get_encoders(jobs):
+        encoded, dumps_ms = time_each(dumps, values)
+        decoded, loads_ms = time_each(loads, encoded)
+        assert decoded == values, f"{name} does not round-trip"
+        size = sum(len(data) for data in encoded) // len(encoded)
+        print(f"{label:12} {name:11} {size:>9} {dumps_ms:>9.3f} {loads_ms:>9.3f}")
+
+
+def measure(
+    label: str, values: list, paragraphs: int, jobs: int, level: int, min_size: int
+):
+    type_ = List[JobItemResponse] if jobs > 1 else JobItemResponse
+    codec = ModelCodec(type_)
+    codec.min_size = min_size
+    codec.compressor = zstandard.ZstdCompressor(level=level)
+
+    encoded = [codec.dumps(value) for value in values]
+    started = time.perf_counter()
+    for data in encoded:
+        codec.loads(data)
+    loads_ms = (time.perf_counter() - started) * 1000 / len(encoded)
+
+    stats = codec.get_stats()
+    print(
+        f"{label:12} {stats['raw_bytes'] // stats['encoded']:>9} "
+        f"{stats['stored_bytes'] // stats['encoded']:>9} {stats['ratio']:>6} "
+        f"{stats['compressed']:>5}/{stats['encoded']:<5} "
+        f"{stats['compress_avg_ms']:>11.3f} {stats['decompress_avg_ms']:>13.3f} "
+        f"{loads_ms:>9.3f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.codec")
+    parser.add_argument("--values", type=int, default=200)
+    parser.add_argument("--level", type=int, default=3)
+    parser.add_argument("--min-size", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = []
+    for label, paragraphs, jobs in SIZES:
+        values = []
+        for index in range(args.values):
+            page = [
+                get_job(rng, index * jobs + offset, paragraphs)
+                for offset in range(jobs)
+            ]
+            values.append(page if jobs > 1 else page[0])
+        corpus.append((label, values, paragraphs, jobs))
+
+    print(f"encoders, {args.values} values per size")
+    if orjson is None:
+        print("orjson is not installed, skipped")
+    print(f"{'value':12} {'encoder':11} {'bytes':>9} {'dumps ms':>9} {'loads ms':>9}")
+    for label, values, paragraphs, jobs in corpus:
+        compare(label, values, jobs)
+
+    print()
+    print(
+        f"zstd level {args.level}, compress from {args.min_size} bytes, "
+        f"{args.values} values per size"
+    )
+    print(
+        f"{'value':12} {'raw B':>9} {'stored B':>9} {'ratio':>6} {'zstd':>11} "
+        f"{'compress ms':>11} {'decompress ms':>13} {'loads ms':>9}"
+    )
+    for label, values, paragraphs, jobs in corpus:
+        measure(label, values, paragraphs, jobs, args.level, args.min_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Compare job search and job detail on the sync Session and on AsyncSession.
+
+Runs the database part of GET /user/job/search (first page plus hydration) and
+GET /user/job/{job_id} from concurrent tasks on one event loop, the way the
+routes run them, once with a sync Session called on the loop and once with an
+AsyncSession. Prints requests per second, median, p95 and p99 latency and the
+largest event loop stall seen by a 1 ms ticker. Redis is not used.
+
+    python -m benchmarks.job_session
+    python -m benchmarks.job_session --concurrency 50 --requests 5000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy.orm import Session
+
+from app.core.job.job_helper import job_helper
+from app.crud import job as jobCRUD
+from app.db.base import AsyncSessionLocal, SessionLocal, async_engine, run_sync
+
+
+def search(db: Session, limit: int) -> int:
+    jobs = jobCRUD.user_search(db, skip=0, limit=limit)
+    return len(job_helper.get_list_info_from_db(db, jobs))
+
+
+def detail(db: Session, job_ids: List[int], index: int) -> int:
+    job = jobCRUD.get(db, job_ids[index % len(job_ids)])
+    return job_helper.get_info_from_db(db, job).id
+
+
+async def measure(
+    concurrency: int, requests: int, call: Callable[[int], Awaitable]
+) -> dict:
+    timings = []
+    stall = 0.0
+    queue = iter(range(requests))
+    done = False
+
+    async def ticker():
+        nonlocal stall
+        while not done:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stall = max(stall, time.perf_counter() - started - 0.001)
+
+    async def worker():
+        for index in queue:
+            started = time.perf_counter()
+            await call(index)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    ticking = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    done = True
+    await ticking
+
+    timings.sort()
+    return {
+        "rps": requests / elapsed,
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+        "p99_ms": timings[int(len(timings) * 0.99) - 1],
+        "stall_ms": stall * 1000,
+    }
+
+
+async def run(concurrency: int, requests: int, limit: int):
+    with SessionLocal() as db:
+        job_ids = [job.id for job in jobCRUD.user_search(db, skip=0, limit=100)]
+    if not job_ids:
+        print("no published jobs, seed the database first")
+        return
+
+    async def sync_session(work: Callable, *args):
+        with SessionLocal() as db:
+            return work(db, *args)
+
+    async def async_session(work: Callable, *args):
+        async with AsyncSessionLocal() as db:
+            return await run_sync(db, work, *args)
+
+    print(f"{concurrency} concurrent tasks, {requests} requests per run")
+    print(
+        f"{'route':7} {'session':7} {'req/s':>8} {'median ms':>10} "
+        f"{'p95 ms':>10} {'p99 ms':>10} {'stall ms':>10}"
+    )
+    routes = (
+        ("search", lambda session, index: session(search, limit)),
+        ("detail", lambda session, index: session(detail, job_ids, index)),
+    )
+    for route, call in routes:
+        for name, session in (("sync", sync_session), ("async", async_session)):
+            result = await measure(
+                concurrency, requests, lambda index: call(session, index)
+            )
+            print(
+                f"{route:7} {name:7} {result['rps']:8.1f} "
+                f"{result['median_ms']:10.2f} {result['p95_ms']:10.2f} "
+                f"{result['p99_ms']:10.2f} {result['stall_ms']:10.2f}"
+            )
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.job_session")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.concurrency, args.requests, args.limit))
+
+
+if __name__ == "__main__":
+    main()
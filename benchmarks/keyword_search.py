@@ -0,0 +1,83 @@
+"""Compare keyword search through SQL ILIKE with the Redis inverted index.
+
+For every keyword, runs the first search page both ways against the configured
+database and Redis and prints the median and p95 latency with the number of
+matching jobs. Build the index first (POST /api/v1/admin/search_index/job/rebuild).
+
+    python -m benchmarks.keyword_search
+    python -m benchmarks.keyword_search --runs 50 java "lập trình" C
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Callable, List
+
+from app.crud import job as jobCRUD
+from app.db.base import SessionLocal
+from app.storage.redis import redis_dependency
+from app.storage.search.job_search_index import job_search_index
+
+KEYWORDS = ["java", "python", "kế toán", "nhân viên kinh doanh", "C", "senior"]
+
+
+async def measure(runs: int, search: Callable) -> dict:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        count = await search()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+        "count": count,
+    }
+
+
+async def run(keywords: List[str], runs: int, limit: int):
+    redis = await redis_dependency.get_redis()
+    if not await job_search_index.is_built(redis):
+        print("job search index is not built, rebuild it first")
+        return
+
+    with SessionLocal() as db:
+
+        async def search_ilike():
+            jobCRUD.user_search(db, keyword=keyword, skip=0, limit=limit)
+            return jobCRUD.user_count(db, keyword=keyword)
+
+        async def search_index():
+            job_ids = await job_search_index.search_job_ids(redis, keyword)
+            if job_ids is None:
+                return None
+            jobCRUD.user_search_by_ranked_ids(
+                db, job_ids, keyword=keyword, skip=0, limit=limit
+            )
+            return len(job_ids)
+
+        print(
+            f"{'keyword':24} {'method':6} {'median ms':>10} {'p95 ms':>10} {'jobs':>7}"
+        )
+        for keyword in keywords:
+            for method, search in (("ilike", search_ilike), ("index", search_index)):
+                result = await measure(runs, search)
+                print(
+                    f"{keyword[:24]:24} {method:6} {result['median_ms']:10.2f} "
+                    f"{result['p95_ms']:10.2f} {str(result['count']):>7}"
+                )
+    await redis_dependency.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.keyword_search")
+    parser.add_argument("keywords", nargs="*", default=KEYWORDS)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.keywords, args.runs, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compare cached list writes: one RPUSH per element against set_list.
+
+Writes a list of `--elements` district counts, the value the search sidebar
+caches, to the configured Redis both ways and prints the median and p95 write
+latency with the length of the list read back:
+
+- rpush loop: the previous BaseCache.set_list, one awaited RPUSH per element
+  and an EXPIRE, so 1,001 round-trips for 1,000 elements. It appends, the key
+  is deleted untimed before each run.
+- set_list: DEL, one RPUSH with every element and EXPIRE in one pipeline.
+
+    python -m benchmarks.list_cache
+    python -m benchmarks.list_cache --elements 5000 --runs 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Callable
+
+from redis.asyncio import Redis
+
+from app.storage.base_cache import BaseCache
+from app.storage.redis import redis_dependency
+
+cache = BaseCache("benchmark_list:", 60)
+KEY = "districts"
+
+
+async def rpush_loop(redis: Redis, value: list):
+    for v in value:
+        await redis.rpush(cache.key_prefix + KEY, json.dumps(v))
+    await redis.expire(cache.key_prefix + KEY, cache.expire)
+
+
+async def set_list(redis: Redis, value: list):
+    await cache.set_list(redis, KEY, value)
+
+
+async def measure(redis: Redis, runs: int, write: Callable, value: list) -> dict:
+    timings = []
+    for _ in range(runs):
+        await redis.delete(cache.key_prefix + KEY)
+        started = time.perf_counter()
+        await write(redis, value)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+        "length": len(await cache.get_list(redis, KEY)),
+    }
+
+
+async def run(elements: int, runs: int):
+    redis = await redis_dependency.get_redis()
+    value = [
+        {
+            "district": {"id": id, "name": f"Quận {id}", "province_id": id % 63},
+            "count": id * 7 % 500,
+        }
+        for id in range(1, elements + 1)
+    ]
+    print(f"{elements} elements, {runs} runs")
+    print(f"{'write':10} {'median ms':>10} {'p95 ms':>10} {'length':>7}")
+    try:
+        for name, write in (("rpush loop", rpush_loop), ("set_list", set_list)):
+            result = await measure(redis, runs, write, value)
+            print(
+                f"{name:10} {result['median_ms']:10.2f} {result['p95_ms']:10.2f} "
+                f"{result['length']:>7}"
+            )
+    finally:
+        await redis.delete(cache.key_prefix + KEY)
+        await redis_dependency.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.list_cache")
+    parser.add_argument("--elements", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.elements, args.runs))
+
+
+if __name__ == "__main__":
+    main()
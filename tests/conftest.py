@@ -0,0 +1,167 @@
+import asyncio
+import fnmatch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.db import query_stats
+from app.model import Base
+
+
+class FakePipeline:
+    """Queues commands and runs them on execute, like a redis pipeline"""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self):
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class FakePubSub:
+    """Receives what FakeRedis.publish sends to its subscribed channels"""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.messages = asyncio.Queue()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        for subscribers in self.redis.subscribers.values():
+            subscribers.discard(self)
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, set()).add(self)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio commands the storage layer uses"""
+
+    def __init__(self):
+        self.data = {}
+        self.subscribers = {}
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    async def publish(self, channel, message):
+        subscribers = self.subscribers.get(channel, set())
+        for pubsub in subscribers:
+            pubsub.messages.put_nowait(
+                {"type": "message", "channel": channel.encode(), "data": message}
+            )
+        return len(subscribers)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def exists(self, *keys):
+        return sum(key in self.data for key in keys)
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def unlink(self, *keys):
+        return await self.delete(*keys)
+
+    async def expire(self, key, seconds):
+        return key in self.data
+
+    async def rpush(self, key, *values):
+        items = self.data.setdefault(key, [])
+        items.extend(
+            value.encode() if isinstance(value, str) else value for value in values
+        )
+        return len(items)
+
+    async def lrange(self, key, start, end):
+        items = self.data.get(key, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    async def scan(self, cursor=0, match=None, count=None):
+        return 0, [key for key in self.data if fnmatch.fnmatchcase(key, match or "*")]
+
+    async def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    async def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+
+    async def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key, *members):
+        zset = self.data.get(key, {})
+        for member in members:
+            zset.pop(member, None)
+        if key in self.data and not zset:
+            del self.data[key]
+
+    async def zinterstore(self, dest, keys, aggregate="SUM"):
+        zsets = [self.data.get(key, {}) for key in keys]
+        members = set(zsets[0]).intersection(*zsets[1:])
+        self.data[dest] = {
+            member: sum(zset[member] for zset in zsets) for member in members
+        }
+        return len(members)
+
+    async def zrevrange(self, key, start, end, withscores=False):
+        items = sorted(self.data.get(key, {}).items(), key=lambda item: -item[1])
+        items = items[start:] if end == -1 else items[start : end + 1]
+        return items if withscores else [member for member, _ in items]
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def engine():
+    """In-memory sqlite database with every table, shared across threads"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def query_budget():
+    """`with query_budget(n):` fails the test when the block issues more than
+    n statements or repeats a statement shape"""
+    return query_stats.query_budget
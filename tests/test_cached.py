@@ -0,0 +1,41 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.storage.base_cache import BaseCache
+from app.storage.cached import bypass_cache, cached
+
+calls = []
+
+
+@cached(BaseCache("test_cached_", 60), "value_{id}")
+async def get_value(redis, id: int):
+    calls.append(id)
+    return {"id": id}
+
+
+def request(headers: dict):
+    return SimpleNamespace(headers=headers)
+
+
+async def call_route(headers: dict):
+    # what FastAPI does: dependencies first, then the endpoint, in one context
+    await bypass_cache(request(headers))
+    return await get_value(None, 1)
+
+
+def test_bypass_header_skips_the_cache(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_BYPASS_ENABLED", True)
+    bypassed = get_value.cached.stats.counts["bypass"]
+
+    # redis is None, any cache access would fail
+    assert asyncio.run(call_route({"X-Cache-Bypass": "1"})) == {"id": 1}
+    assert get_value.cached.stats.counts["bypass"] == bypassed + 1
+
+
+def test_bypass_header_is_ignored_unless_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_BYPASS_ENABLED", False)
+    bypassed = get_value.cached.stats.counts["bypass"]
+
+    asyncio.run(call_route({"X-Cache-Bypass": "1"}))
+    assert get_value.cached.stats.counts["bypass"] == bypassed
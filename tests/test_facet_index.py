@@ -0,0 +1,66 @@
+import asyncio
+
+from app.storage.base_facet_index import BaseFacetIndex, FacetIndexRefresher
+
+
+class Worker:
+    """One API worker: its own facet index over the shared database"""
+
+    def __init__(self, database: dict):
+        self.database = database
+        self.index = BaseFacetIndex(refresh_interval=300)
+        self.refresher = FacetIndexRefresher(self.index, self.load, "facet_test")
+
+    def load(self, doc_ids):
+        if doc_ids is None:
+            return dict(self.database)
+        return {id: self.database[id] for id in doc_ids if id in self.database}
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0.01)
+
+
+def test_change_on_one_worker_reaches_the_others(redis):
+    database = {1: {"province": [1]}, 2: {"province": [2]}}
+
+    async def run():
+        writer, reader = Worker(database), Worker(database)
+        for worker in (writer, reader):
+            worker.refresher.start(redis)
+        await settle()
+        assert reader.index.count(reader.index.get("province", 1)) == 1
+
+        database[2] = {"province": [1]}
+        database[3] = {"province": [1]}
+        del database[1]
+        writer.index.update_documents([1, 2, 3], writer.load([1, 2, 3]))
+        await writer.refresher.publish(redis, [1, 2, 3])
+        await settle()
+
+        for worker in (writer, reader):
+            assert worker.index.to_ids(worker.index.get("province", 1)) == [2, 3]
+            assert worker.index.get("province", 2) == 0
+            await worker.refresher.stop()
+
+    asyncio.run(run())
+
+
+def test_worker_ignores_its_own_changes(redis):
+    database = {1: {"province": [1]}}
+
+    async def run():
+        worker = Worker(database)
+        worker.refresher.start(redis)
+        await settle()
+        loads = []
+        worker.refresher.load = lambda doc_ids: loads.append(doc_ids) or {}
+
+        await worker.refresher.publish(redis, [1])
+        await settle()
+
+        assert loads == []
+        await worker.refresher.stop()
+
+    asyncio.run(run())
@@ -0,0 +1,24 @@
+import asyncio
+
+from app.storage.base_cache import BaseCache
+
+cache = BaseCache("test_list:", 60)
+
+
+def test_set_list_replaces_the_cached_list(redis):
+    async def run():
+        await cache.set_list(redis, "districts", [{"id": 1}, {"id": 2}, {"id": 3}])
+        await cache.set_list(redis, "districts", [{"id": 4}, {"id": 5}])
+        return await cache.get_list(redis, "districts")
+
+    assert asyncio.run(run()) == [{"id": 4}, {"id": 5}]
+
+
+def test_set_list_with_an_empty_list_clears_the_key(redis):
+    async def run():
+        await cache.set_list(redis, "districts", [{"id": 1}])
+        await cache.set_list(redis, "districts", [])
+        return await cache.get_list(redis, "districts")
+
+    assert asyncio.run(run()) == []
+    assert "test_list:districts" not in redis.data
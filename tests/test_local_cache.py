@@ -0,0 +1,52 @@
+from app.storage.local_cache import LocalCache
+
+
+def test_set_is_dropped_when_its_key_was_invalidated():
+    cache = LocalCache(max_size=10, expire=60)
+    version = cache.version
+    cache.delete("job_1")
+
+    cache.set("job_1", "stale", None, version)
+    assert cache.get("job_1") is None
+
+
+def test_invalidating_other_keys_keeps_concurrent_sets():
+    cache = LocalCache(max_size=10, expire=60)
+    version = cache.version
+    cache.delete("job_2")
+
+    cache.set("job_1", "fresh", None, version)
+    assert cache.get("job_1") == "fresh"
+
+
+def test_read_after_invalidation_is_stored():
+    cache = LocalCache(max_size=10, expire=60)
+    cache.delete("job_1")
+    version = cache.version
+
+    cache.set("job_1", "fresh", None, version)
+    assert cache.get("job_1") == "fresh"
+
+
+def test_clear_drops_every_earlier_read():
+    cache = LocalCache(max_size=10, expire=60)
+    version = cache.version
+    cache.clear()
+
+    cache.set("job_1", "stale", None, version)
+    assert cache.get("job_1") is None
+    cache.set("job_1", "fresh", None, cache.version)
+    assert cache.get("job_1") == "fresh"
+
+
+def test_forgotten_invalidations_drop_older_reads():
+    cache = LocalCache(max_size=2, expire=60)
+    version = cache.version
+    for key in ["job_1", "job_2", "job_3"]:
+        cache.delete(key)
+
+    # job_1 fell out of the invalidation log, reads older than it are dropped
+    cache.set("job_1", "stale", None, version)
+    assert cache.get("job_1") is None
+    cache.set("job_4", "fresh", None, cache.version)
+    assert cache.get("job_4") == "fresh"
@@ -0,0 +1,63 @@
+import asyncio
+import json
+
+from app.storage.base_cache import BaseCache, CacheInvalidationListener
+from app.storage.lookup import Lookup
+
+
+class Table:
+    def __init__(self, rows: dict):
+        self.rows = rows
+        self.loads = 0
+
+    def load(self, db) -> dict:
+        self.loads += 1
+        return dict(self.rows)
+
+
+def test_reloads_on_missing_id():
+    table = Table({1: "IT"})
+    lookup = Lookup("test_missing", table.load)
+
+    assert lookup.get(None, [1]) == {1: "IT"}
+    assert lookup.get(None, [1, None]) == {1: "IT"}
+    table.rows[2] = "Sales"
+    assert lookup.get(None, [2]) == {1: "IT", 2: "Sales"}
+    assert table.loads == 2
+
+
+def test_reloads_after_expire():
+    table = Table({1: "IT"})
+    lookup = Lookup("test_expire", table.load, expire=60)
+    lookup.get(None, [1])
+
+    table.rows[1] = "Software"
+    assert lookup.get(None, [1]) == {1: "IT"}
+    lookup.loaded_at -= 61
+    assert lookup.get(None, [1]) == {1: "Software"}
+
+
+def test_invalidation_message_clears_other_workers(redis):
+    published = []
+
+    async def publish(channel, message):
+        published.append((channel, message))
+
+    redis.publish = publish
+    table = Table({1: "IT"})
+    writer = Lookup("test_invalidate", table.load)
+    reader = Lookup("test_invalidate", table.load)
+    writer.get(None, [1])
+    reader.get(None, [1])
+
+    table.rows[1] = "Software"
+    asyncio.run(writer.invalidate(redis))
+    # the listener of the other worker receives the published keys
+    channel, data = published[0]
+    CacheInvalidationListener().handle_message(
+        {"type": "message", "channel": channel.encode(), "data": data}
+    )
+
+    assert json.loads(data) == ["lookup:test_invalidate"]
+    assert channel == BaseCache.invalidation_channel
+    assert reader.get(None, [1]) == {1: "Software"}
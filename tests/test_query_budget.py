@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.orm import Session
+
+from app.api.api_v1.endpoint.user import cv_applications
+from app.core.auth.user_manager_service import user_manager_service
+from app.crud import cv_applications as cv_applicationCRUD
+from app.db.base import get_db
+from app.model import Account, CVApplication
+from app.storage.redis import get_redis
+from test_query_profiles import ROWS, seed
+
+# count, list, profile
+CV_APPLICATION_LIST_BUDGET = 3
+
+
+@pytest.fixture
+def client(engine, redis):
+    """Client of the user cv application routes, signed in as a user who
+    applied to ROWS campaigns"""
+    with Session(engine) as db:
+        seed(db, ROWS)
+        user_id = db.query(CVApplication).order_by(CVApplication.id).first().user_id
+        db.query(CVApplication).update({"user_id": user_id})
+        db.commit()
+        account = db.get(Account, user_id)
+
+    def get_test_db():
+        with Session(engine) as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(cv_applications.router, prefix="/cv_application")
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_redis] = lambda: redis
+    app.dependency_overrides[user_manager_service.get_current_user] = lambda: account
+
+    def get(url: str) -> httpx.Response:
+        async def request():
+            async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+                return await client.get(url)
+
+        # runs the app in this thread so the budget sees its statements
+        return asyncio.run(request())
+
+    return get
+
+
+def test_list_cv_applications_stays_in_budget(client, query_budget):
+    with query_budget(CV_APPLICATION_LIST_BUDGET):
+        response = client("/cv_application?limit=10")
+
+    assert response.status_code == 200
+    assert len(response.json()["data"]["jobs"]) == ROWS
+
+
+def test_list_cv_applications_without_profile_goes_over_budget(
+    client, query_budget, monkeypatch
+):
+    monkeypatch.setattr(
+        cv_applicationCRUD, "load_profile", lambda db, objs, profile: objs
+    )
+    with pytest.raises(AssertionError, match="queries issued"):
+        with query_budget(CV_APPLICATION_LIST_BUDGET):
+            client("/cv_application?limit=10")
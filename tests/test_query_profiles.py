@@ -0,0 +1,190 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.crud import (
+    campaign as campaignCRUD,
+    conversation_member as conversation_memberCRUD,
+    cv_applications as cv_applicationCRUD,
+)
+from app.db.query_stats import track_queries
+from app.hepler.enum import (
+    AttachmentType,
+    ConversationType,
+    Gender,
+    JobStatus,
+    Role,
+)
+from app.model import (
+    Account,
+    Business,
+    Campaign,
+    Company,
+    CompanyBusiness,
+    Conversation,
+    ConversationMember,
+    CVApplication,
+    Job,
+    Manager,
+    User,
+)
+
+ROWS = 5
+
+
+def seed(db: Session, rows: int):
+    """`rows` businesses with a campaign and a job, `rows` users who applied
+    to one campaign each, and one group conversation with all of them"""
+    conversation = Conversation(
+        account_id=1, type=ConversationType.GROUP, count_member=2 * rows
+    )
+    db.add(conversation)
+    for index in range(1, rows + 1):
+        business_account = Account(full_name=f"business {index}", role=Role.BUSINESS)
+        user_account = Account(full_name=f"user {index}", role=Role.USER)
+        db.add_all([business_account, user_account])
+        db.flush()
+
+        manager = Manager(
+            id=business_account.id,
+            email=f"business{index}@example.com",
+            hashed_password="-",
+            phone_number="0912345678",
+        )
+        business = Business(
+            id=business_account.id,
+            province_id=1,
+            gender=Gender.OTHER,
+            company_name=f"company {index}",
+            work_position="hr",
+        )
+        company = Company(
+            name=f"company {index}",
+            email=f"company{index}@example.com",
+            address="Hà Nội",
+            phone_number="0912345678",
+            scale="100",
+            tax_code=f"{index:010}",
+            business_id=business_account.id,
+        )
+        user = User(id=user_account.id, email=f"user{index}@example.com")
+        db.add_all([manager, business, company, user])
+        db.flush()
+
+        campaign = Campaign(
+            title=f"campaign {index}",
+            business_id=business.id,
+            company_id=company.id,
+            count_apply=1,
+        )
+        db.add_all([CompanyBusiness(business_id=business.id, company_id=company.id)])
+        db.add(campaign)
+        db.flush()
+        db.add_all(
+            [
+                Job(
+                    business_id=business.id,
+                    campaign_id=campaign.id,
+                    job_experience_id=1,
+                    job_position_id=1,
+                    title=f"job {index}",
+                    job_description="-",
+                    job_requirement="-",
+                    job_benefit="-",
+                    job_location="Hà Nội",
+                    full_name_contact="-",
+                    phone_number_contact="0912345678",
+                    email_contact=["hr@example.com"],
+                    status=JobStatus.PUBLISHED,
+                    deadline=date.today() + timedelta(days=30),
+                ),
+                CVApplication(
+                    campaign_id=campaign.id,
+                    user_id=user.id,
+                    cv="cv.pdf",
+                    type=AttachmentType.PDF,
+                    name="cv.pdf",
+                    size=1,
+                    full_name=f"user {index}",
+                    email=f"user{index}@example.com",
+                    phone_number="0912345678",
+                ),
+                ConversationMember(
+                    account_id=business_account.id, conversation_id=conversation.id
+                ),
+                ConversationMember(
+                    account_id=user_account.id, conversation_id=conversation.id
+                ),
+            ]
+        )
+    db.commit()
+
+
+# the relationships each response builder walks
+
+
+def walk_campaign(campaign: Campaign):
+    # campaign_helper.get_info
+    campaign.job.title
+    campaign.company.name
+    campaign.business.manager.account.full_name
+
+
+def walk_cv_application(cv_application: CVApplication):
+    # cv_applications_helper.get_full_info
+    cv_application.campaign.job.title
+    cv_application.campaign.company.name
+    cv_application.user.account.full_name
+
+
+def walk_conversation_member(conversation_member: ConversationMember):
+    # conversation_helper.get_member_response
+    account = conversation_member.account
+    if account.role == Role.BUSINESS:
+        account.manager.business.company.name
+        account.manager.email
+    else:
+        account.user.email
+
+
+PROFILES = [
+    (campaignCRUD, Campaign, "campaign_dashboard", walk_campaign),
+    (
+        conversation_memberCRUD,
+        ConversationMember,
+        "conversation_member",
+        walk_conversation_member,
+    ),
+    (cv_applicationCRUD, CVApplication, "cv_application_card", walk_cv_application),
+]
+
+
+def count_queries(engine, crud, model, profile, walk, limit: int) -> int:
+    with Session(engine) as db:
+        with track_queries() as stats:
+            rows = db.query(model).order_by(model.id).limit(limit).all()
+            if profile:
+                crud.load_profile(db, rows, profile)
+            for row in rows:
+                walk(row)
+    assert len(rows) == limit
+    return stats.count
+
+
+@pytest.mark.parametrize(
+    "crud, model, profile, walk", PROFILES, ids=[item[2] for item in PROFILES]
+)
+def test_profile_loads_any_number_of_rows_in_constant_queries(
+    engine, crud, model, profile, walk
+):
+    with Session(engine) as db:
+        seed(db, ROWS)
+    rows = ROWS * 2 if model is ConversationMember else ROWS
+
+    one = count_queries(engine, crud, model, profile, walk, 1)
+    many = count_queries(engine, crud, model, profile, walk, rows)
+
+    assert one == many
+    # the same walk without the profile lazy loads per row
+    assert count_queries(engine, crud, model, None, walk, rows) > many
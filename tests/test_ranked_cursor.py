@@ -0,0 +1,59 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.crud import job as jobCRUD
+from app.hepler.common import CommonHelper
+from app.model import Job
+from app.schema.job import JobSearchByUser
+from test_query_profiles import seed
+
+ROWS = 5
+
+
+def search_pages(db: Session, ranked_ids, limit: int):
+    """Follow next cursors of a ranked search to the last page"""
+    pages, after = [], None
+    while True:
+        page = JobSearchByUser(keyword="job", limit=limit, after=after)
+        jobs = jobCRUD.user_search_by_ranked_ids(db, ranked_ids, **page.model_dump())
+        pages.append([job.id for job in jobs])
+        after = jobCRUD.get_next_ranked_cursor(jobs, **page.model_dump())
+        if after is None:
+            return pages
+        assert jobCRUD.is_ranked_cursor(after)
+
+
+def test_cursor_continues_in_ranked_order(engine):
+    with Session(engine) as db:
+        seed(db, ROWS)
+        ranked_ids = [id for (id,) in db.query(Job.id).order_by(Job.id.desc())]
+        ranked_ids = ranked_ids[1::2] + ranked_ids[::2]
+
+        assert search_pages(db, ranked_ids, 2) == [
+            ranked_ids[0:2],
+            ranked_ids[2:4],
+            ranked_ids[4:5],
+        ]
+
+
+def test_keyset_cursor_is_not_ranked(engine):
+    with Session(engine) as db:
+        seed(db, ROWS)
+        page = JobSearchByUser(limit=2)
+        jobs = jobCRUD.user_search(db, **page.model_dump())
+        after = jobCRUD.get_next_cursor(
+            jobs, limit=page.limit, sort_by=page.sort_by, order_by=page.order_by
+        )
+
+    assert not jobCRUD.is_ranked_cursor(after)
+
+
+@pytest.mark.parametrize("position", [-1, "2", None])
+def test_invalid_ranked_position_is_rejected(position):
+    page = JobSearchByUser(limit=1)
+    after = CommonHelper.encode_cursor(
+        {"s": page.sort_by, "o": page.order_by, "v": None, "i": 1, "r": position}
+    )
+    with pytest.raises(ValidationError, match="Invalid cursor"):
+        JobSearchByUser(limit=1, after=after)
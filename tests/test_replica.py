@@ -0,0 +1,31 @@
+import asyncio
+
+from app.db.replica import ReplicaRouter
+
+
+def test_get_replica_reads_the_cached_health():
+    router = ReplicaRouter(["sqlite://"], health_interval=0, sticky_seconds=0)
+    replica = router.replicas[0]
+    checks = []
+    check = replica.check
+    replica.check = lambda: checks.append(1) or check()
+
+    replica.healthy = False
+    assert router.get_replica() is None
+    assert not checks
+
+    asyncio.run(router.check_all())
+    assert checks
+    assert router.get_replica() is replica
+
+
+def test_unreachable_replica_is_skipped():
+    router = ReplicaRouter(
+        ["sqlite://", "sqlite:////nonexistent/dir/replica.db"],
+        health_interval=0,
+        sticky_seconds=0,
+    )
+    asyncio.run(router.check_all())
+
+    assert [replica.healthy for replica in router.replicas] == [True, False]
+    assert {router.get_replica() for _ in range(4)} == {router.replicas[0]}
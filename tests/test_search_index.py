@@ -0,0 +1,45 @@
+import asyncio
+
+from app.storage.base_search_index import BaseSearchIndex
+
+index = BaseSearchIndex("test_search_index_")
+
+
+def index_documents(redis, documents: dict):
+    async def run():
+        for doc_id, title in documents.items():
+            await index.index_document(redis, doc_id, [(title, 1)])
+        await index.mark_built(redis)
+
+    asyncio.run(run())
+
+
+def test_tokenize_keeps_single_characters():
+    assert index.tokenize("Lập trình C# và R") == ["lap", "trinh", "c", "va", "r"]
+
+
+def test_search_short_keyword(redis):
+    index_documents(redis, {1: "Lập trình viên C", 2: "Kỹ sư R", 3: "Java"})
+
+    assert [doc_id for doc_id, _ in asyncio.run(index.search(redis, "C"))] == [1]
+    assert [doc_id for doc_id, _ in asyncio.run(index.search(redis, "C#"))] == [1]
+    assert [doc_id for doc_id, _ in asyncio.run(index.search(redis, "r"))] == [2]
+
+
+def test_search_without_terms_falls_back(redis):
+    index_documents(redis, {1: "Java"})
+
+    # None tells the caller to fall back to SQL, [] would mean no match
+    assert asyncio.run(index.search(redis, "++")) is None
+    assert asyncio.run(index.search(redis, "")) is None
+
+
+def test_clear_drops_stale_terms(redis):
+    index_documents(redis, {1: "Python", 2: "Golang"})
+
+    asyncio.run(index.clear(redis))
+    assert not asyncio.run(index.is_built(redis))
+    index_documents(redis, {2: "Golang"})
+
+    assert asyncio.run(index.search(redis, "python")) == []
+    assert [doc_id for doc_id, _ in asyncio.run(index.search(redis, "golang"))] == [2]
@@ -0,0 +1,28 @@
+import asyncio
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.db.base import run_sync
+
+
+def select_one(db: Session, value: int) -> int:
+    assert isinstance(db, Session)
+    return db.execute(text("SELECT :value"), {"value": value}).scalar()
+
+
+def test_run_sync_calls_through_a_sync_session():
+    with Session(create_engine("sqlite://")) as db:
+        assert asyncio.run(run_sync(db, select_one, 1)) == 1
+
+
+def test_run_sync_calls_through_an_async_session():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with AsyncSession(engine) as db:
+            value = await run_sync(db, select_one, value=2)
+        await engine.dispose()
+        return value
+
+    assert asyncio.run(run()) == 2
@@ -0,0 +1,72 @@
+import asyncio
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db import slow_query
+from app.db.slow_query import register_slow_query_log, slow_query_log
+
+
+def test_register_records_slow_statements(monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_ENABLED", True)
+    monkeypatch.setattr(slow_query_log, "threshold", 0)
+    monkeypatch.setattr(slow_query_log, "explain_sample_rate", 0)
+    slow_query_log.reset()
+    register_slow_query_log()
+    register_slow_query_log()
+    try:
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            for id in (1, 2):
+                conn.execute(text(f"SELECT {id}"))
+    finally:
+        for name in ("before_cursor_execute", "after_cursor_execute", "handle_error"):
+            event.remove(Engine, name, getattr(slow_query, name))
+
+    report = slow_query_log.get_report()
+    assert report["fingerprints"] == 1
+    # registered once, so each statement is counted once
+    assert report["entries"][0]["count"] == 2
+    assert report["entries"][0]["statement"] == "SELECT ?"
+
+
+def test_register_is_off_by_setting(monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_ENABLED", False)
+    register_slow_query_log()
+
+    assert not event.contains(
+        Engine, "after_cursor_execute", slow_query.after_cursor_execute
+    )
+
+
+def test_async_engine_statements_are_explained(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "SLOW_QUERY_ENABLED", True)
+    monkeypatch.setattr(slow_query_log, "threshold", 0)
+    monkeypatch.setattr(slow_query_log, "explain_sample_rate", 1)
+    slow_query_log.reset()
+    register_slow_query_log()
+    url = f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}"
+
+    async def run():
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE job (id INTEGER PRIMARY KEY)"))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM job WHERE id = :id"), {"id": 1})
+        await engine.dispose()
+
+    try:
+        asyncio.run(run())
+        slow_query_log.explain_executor.submit(lambda: None).result()
+    finally:
+        for name in ("before_cursor_execute", "after_cursor_execute", "handle_error"):
+            event.remove(Engine, name, getattr(slow_query, name))
+
+    (entry,) = [
+        entry
+        for entry in slow_query_log.get_report()["entries"]
+        if entry["statement"].startswith("SELECT")
+    ]
+    assert isinstance(entry["explain"], list) and entry["explain"]